@@ -12,7 +12,7 @@
 # License:       GPL
 # -----------------------------------------------------------------||||||||||||--
 
-import sys, os, time, random, traceback, http.client, urllib.request, urllib.parse, urllib.error
+import sys, os, time, random, traceback
 import unittest
 
 athVersion = "2.0.0"
@@ -37,12 +37,13 @@ except ImportError:
         sys.stdout.write("athenaCL package cannot be found.\n")
         sys.exit()
 
+# command and help are large; they are imported on first use
 from athenaCL.libATH import argTools
-from athenaCL.libATH import command
 from athenaCL.libATH import dialog
 from athenaCL.libATH import drawer
+from athenaCL.libATH import error
+from athenaCL.libATH import jobTools
 from athenaCL.libATH import typeset
-from athenaCL.libATH import help
 from athenaCL.libATH import ioTools  # needed for bkwdCompat object
 from athenaCL.libATH import rhythm  # needed for timing
 from athenaCL.libATH import language
@@ -52,8 +53,6 @@ import athenaObjExt
 lang = language.LangObj()
 # from athenaCL.libATH import SC
 from athenaCL.libATH.libOrc import orc
-from athenaCL.libATH.libTM import texture  # needed for test script
-from athenaCL.libATH import clone  # needed for proc_AUtest
 
 # objects not stored in ao, but nameing data needed
 from athenaCL.libATH import eventList
@@ -157,6 +156,8 @@ class External(object):
 
     def logSend(self):
         """attempt to submit a log file"""
+        import http.client, urllib.parse
+
         paramRaw = self._logParse()
         paramRaw["stateNext"] = "8"  # state 8 is bug processing
         params = urllib.parse.urlencode(paramRaw)
@@ -192,6 +193,8 @@ class External(object):
     def onlineVersionFetch(self):
         """if online, check current version
         returns None if not available"""
+        import urllib.request
+
         try:  # read number of chars lines 1.1.1.1000.10.10
             webpage = urllib.request.urlopen(drawer.urlPrep(lang.msgVersionURL)).read(
                 24
@@ -337,7 +340,7 @@ class AthenaObject(object):
         self.external.getVisualMethod("init")  # prep, dont resolve
 
         # utility objects
-        self.help = help.HelpDoc(self.termObj)  # pass ref termObj
+        self._help = None  # HelpDoc, created on first access
         self.backward = ioTools.BackwardsCompat()
 
         # data and objects saved with AO
@@ -353,7 +356,7 @@ class AthenaObject(object):
         self.initTextureLib()
         self.setActiveTexture("")
         # CLONE DATA
-        self.cloneLib = clone.CloneManager()  # added post 1.3
+        self._cloneLib = None  # added post 1.3; created on first access
         self.midiTempo = 120  # default value, changed with TEmidi, added 1.1
 
         # these are stored here, with with project;
@@ -362,7 +365,7 @@ class AthenaObject(object):
         self.audioRate = 44100  # default, saved w/ ao
 
         # this may be init from a pref; but loaded and stored in ao
-        self.orcObj = None  # initialized from setEventMode
+        self._orcObj = None  # created on first access after setEventMode
         self.activeEventMode = None
         # cannot store an em object, contains ao, but must instant orc
         # sets self.activeEventMode and self.orcObj
@@ -378,6 +381,9 @@ class AthenaObject(object):
         # list of paths: built in audio dir, and user-defined dir
         self.aoInfo["fpAudioDirs"] = self.external.getFilePathAudio()
         # self.fpAudioDirs = self.external.getFilePathAudio()
+        # seeded texture and clone scores, reused by ELn when unchanged
+        maxEvents = self.external.getPref("athena", "scoreCacheEvents", 1)
+        self.scoreCache = eventList.ScoreCache(maxEvents)
         self.aoInfo["fpLastDir"] = self.external.getPref("athena", "fpLastDir")
         # self.fpLastDir = self.external.getPref('athena', 'fpLastDir')
         self.aoInfo["fpLastDirEventList"] = self.external.getPref(
@@ -514,6 +520,7 @@ class AthenaObject(object):
                 "APgfx(graphics)",
                 "APcurs(cursor)",
                 "APr(refresh)",
+                "APsco(score)",
                 "APwid(width)",
             ),
         }
@@ -554,9 +561,62 @@ class AthenaObject(object):
             "help",
             "shell",
         ]
-        # store a list of all commands
-        self.cmdRef = self.cmdManifest()
-        self.cmdRef.sort()
+        # commands that only display data, and may be executed while another
+        # command is run as a job; commands that change any state, even the
+        # active path or texture, must wait for the job to finish
+        self.cmdQuery = [
+            "PIv",
+            "PIls",
+            "TMv",
+            "TMls",
+            "TPv",
+            "TPls",
+            "TIv",
+            "TIls",
+            "TIdoc",
+            "TCv",
+            "TCls",
+            "TTls",
+            "TEv",
+            "EOls",
+            "EMv",
+            "EMls",
+            "EMi",
+            "AHls",
+        ]
+        # list of all commands, created on first access
+        self._cmdRef = None
+
+    @property
+    def help(self):
+        """the HelpDoc; the help module is only loaded when first needed"""
+        if self._help is None:
+            from athenaCL.libATH import help
+
+            self._help = help.HelpDoc(self.termObj)  # pass ref termObj
+        return self._help
+
+    @property
+    def cloneLib(self):
+        """the CloneManager; the clone module, which loads all ParameterObjects,
+        is only imported when first needed"""
+        if self._cloneLib is None:
+            from athenaCL.libATH import clone
+
+            self._cloneLib = clone.CloneManager()
+        return self._cloneLib
+
+    @cloneLib.setter
+    def cloneLib(self, value):
+        self._cloneLib = value
+
+    @property
+    def cmdRef(self):
+        """sorted list of all commands; this loads the command module"""
+        if self._cmdRef is None:
+            self._cmdRef = self.cmdManifest()
+            self._cmdRef.sort()
+        return self._cmdRef
 
     def initPathLib(self):
         self.pathLib = WatchedDict(callback=athenaObjExt.pathLibUpdated)
@@ -688,12 +748,26 @@ class AthenaObject(object):
         # otherwise line stays the same
         return line
 
+    def cmdIsQuery(self, line):
+        """return True if the command in line is in cmdQuery
+
+        >>> a = AthenaObject()
+        >>> a.cmdIsQuery('tils'), a.cmdIsQuery('tio a'), a.cmdIsQuery('eln')
+        (True, False, False)
+        """
+        line = self.cmdCorrect(line)
+        if not line:
+            return False
+        return line.split()[0] in self.cmdQuery
+
     def cmdManifest(self):
         """get all commands from command.py;
 
         >>> a = AthenaObject()
         >>> post = a.cmdManifest()
         """
+        from athenaCL.libATH import command
+
         cmdList = dir(command)  # get listing from module
         cmdFilter = []
         for entry in cmdList:
@@ -855,7 +929,22 @@ class AthenaObject(object):
             usrStr = default
         assert usrStr != None
         self.activeEventMode = usrStr
-        self.orcObj = orc.factory(eventList.selectEventModeOrc(self.activeEventMode))
+        self._orcObj = None  # orchestra is created on first access
+
+    @property
+    def orcObj(self):
+        """orchestra of the active event mode; instrument libraries, such as
+        csoundNative, are only loaded when first needed
+
+        >>> a = AthenaObject()
+        >>> a.setEventMode('m')
+        >>> a.orcObj.name
+        'generalMidi'
+        """
+        if self._orcObj is None and self.activeEventMode is not None:
+            orcName = eventList.selectEventModeOrc(self.activeEventMode)
+            self._orcObj = orc.factory(orcName)
+        return self._orcObj
 
     def setPreference(self, filePath):
         """set the preference file to an arbitraray path
@@ -1036,11 +1125,14 @@ class Interpreter(object):
     # -----------------------------------------------------------------------||--
     def _getCmdClass(self, cmd):
         """gets a reference to command object; this may get modules that
-        are imported into the command module; this is a problem"""
+        are imported into the command module; this is a problem
+        the command module is imported on the first call, not at startup"""
         # some cmds strings cannot be properly filtered unles directly avoided
         # lang pbject will print an error if an attr is not found
         if cmd in ["lang"]:
             return None
+        from athenaCL.libATH import command
+
         try:
             func = getattr(command, cmd)  # from command module, get class
         except AttributeError:
@@ -1285,6 +1377,33 @@ class Interpreter(object):
         else:  # catch bad parameter setting
             raise Exception("bad error mode")
 
+    def cmdJob(self, jobId, line, progress=None):
+        """Execute a command line as a job.
+
+        Long commands, such as ELn, reach jobTools checkpoints as they score
+        textures and clones and write with each engine; at each, progress is
+        called with the jobId, a stage name, and an object name, and returns
+        True to cancel the command. If progress is None, progress is reported
+        to the GUI with athenaObjExt.jobProgress.
+
+        Returns the same as cmd(); a cancelled command returns 0 and a message.
+
+        >>> a = Interpreter()
+        >>> post = a.cmdJob(1, 'tin a 3', lambda *args: False)
+        >>> ok, msg = a.cmdJob(2, 'eln', lambda jobId, stage, name: True)
+        >>> ok, msg
+        (0, 'job 2 cancelled at texture a')
+        """
+        if progress == None:
+            progress = athenaObjExt.jobProgress
+        job = jobTools.start(jobId, progress)
+        try:
+            return self.cmd(line)
+        except error.CancelError as e:
+            return 0, str(e)
+        finally:
+            jobTools.stop(job)
+
     # -----------------------------------------------------------------------||--
     def _precmd(self, line):
         return line
@@ -1600,6 +1719,8 @@ class Test(unittest.TestCase):
             "APwid 80",
             "APcurs",
             "APcurs",  # twice to toggle back
+            "APsco 2 3",
+            "APsco 0",
             "cmd",
             "help",
             "AUsys",
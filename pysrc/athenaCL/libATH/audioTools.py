@@ -13,7 +13,7 @@
 # there is a wave module that may provide support for wave output formats
 # with the same interface
 
-import random, os, array, copy
+import random, os, sys, array, copy, itertools, operator
 import unittest, doctest
 
 try:
@@ -23,6 +23,21 @@ try:
 except ImportError:
     AIF = 0
 
+_numpy = None  # numpy is optional and loaded on first use; False if missing
+
+
+def _getNumpy():
+    """return the numpy module, or None if not available"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
 from athenaCL.libATH import drawer
 from athenaCL.libATH import unit
 from athenaCL.libATH import fileTools
@@ -30,6 +45,11 @@ from athenaCL.libATH import osTools
 
 _MOD = "audioTools.py"
 
+# frames read, mixed, and written at a time when streaming audio files
+BLOCK_FRAMES = 8192
+# aif sample data is big-endian; arrays use the native byte order
+_SWAP = sys.byteorder == "little"
+
 # -----------------------------------------------------------------||||||||||||--
 audioFormatNames = ["aif", "wav", "sd2"]
 
@@ -413,65 +433,90 @@ class EnvelopeGenerator:
 
 class SampleGenerator:
     """utility to generate sample data
-    always returns in format for writting
-    data in these arrays conssist of two bytes, and thus lengths
-        are always twice as large"""
+    always returns in format for writting: bytes of big-endian signed
+    shorts, as stored in aif files
+    samples are processed in array.array('h') buffers, with numpy if
+    available; the iter methods provide data in blocks of samples"""
 
     def __init__(self, ch=1, sr=44100, bytes=2):
         self.ch = 1
         self.bytes = 2  # 16 bits
         self.sr = 44100
+        self.absMax = int(byteToInt(self.bytes))
 
     def update(self, ch, sr, bytes):
         # update values in case of changes
         self.ch = ch
         self.sr = sr
         self.bytes = bytes
-        self.absMax = byteToInt(self.bytes)  # value in integers
+        self.absMax = int(byteToInt(self.bytes))  # value in integers
+
+    # -----------------------------------------------------------------------||--
+    # conversion between file data and sample arrays
+
+    def toArray(self, data):
+        """convert file data to an array of samples"""
+        xArray = array.array("h")
+        xArray.frombytes(data)
+        if _SWAP:
+            xArray.byteswap()
+        return xArray
+
+    def toData(self, xArray):
+        """convert an array of samples to file data"""
+        if _SWAP:
+            xArray = array.array("h", xArray)  # do not alter the source
+            xArray.byteswap()
+        return xArray.tobytes()
+
+    def _zeros(self, samples):
+        return array.array("h", bytes(samples * 2))
 
     # -----------------------------------------------------------------------||--
     # synthesize for given frames
 
     def silence(self, frames):
         if frames == 0:
-            return ""
-        # h is a signed short
-        return array.array("h", [0] * frames * self.ch).tostring()
+            return b""
+        # zero is the same in any byte order
+        return bytes(frames * self.ch * 2)
 
     def noise(self, frames, amp=1):
         """amp is a scalar between 0 and 1"""
         if frames == 0:
-            return ""
-        noise = []
+            return b""
+        max = self.absMax
+        noise = array.array("h")
         for i in range(frames * self.ch):
-            max = byteToInt(self.bytes)
             noise.append(int(round(random.randint(-max, max) * amp)))
-        # 'h' is a signed int here
-        return array.array("h", noise).tostring()
+        return self.toData(noise)
 
     # -----------------------------------------------------------------------||--
     # funtionst the process string and list data
     def multiply(self, xStr, yList):
-        """multiple two data strings, both not supplied as lists
-        note: this may not work for stereo
-        if float values are provided, not sure that proper rouding is done
-        """
-        xArray = array.array("h")
-        xArray.fromstring(xStr)
-        xList = xArray.tolist()
-        # print _MOD, 'comparing mult lists', len(xList), len(yList), self.ch
-        zList = []
-        i = 0
-        q = 0
-        while 1:
-            if i == len(xList):
-                break
-            scalar = yList[q]  # only one per frame, not data value
-            zList.append(int(round(xList[i] * scalar)))
-            i = i + 1
-            if i % self.ch == 0:
-                q = q + 1  # increment scale index
-        return array.array("h", zList).tostring()
+        """multiply data by a list of scalars, one per frame, limiting the
+        products"""
+        xArray = self.toArray(xStr)
+        np = _getNumpy()
+        if np is not None:
+            scale = np.repeat(np.asarray(yList, dtype=float), self.ch)[: len(xArray)]
+            z = np.rint(np.frombuffer(xArray, dtype=np.int16) * scale)
+            np.clip(z, -self.absMax, self.absMax, out=z)
+            zArray = array.array("h", z.astype(np.int16).tobytes())
+        else:
+            ch = self.ch
+            hi = self.absMax
+            lo = -hi
+            zArray = array.array(
+                "h",
+                [
+                    hi if z > hi else (lo if z < lo else z)
+                    for z in (
+                        int(round(x * yList[i // ch])) for i, x in enumerate(xArray)
+                    )
+                ],
+            )
+        return self.toData(zArray)
 
     def _frameLimit(self, val):
         if val > self.absMax:
@@ -481,116 +526,132 @@ class SampleGenerator:
         else:
             return val
 
+    def mixArray(self, xArray, yArray):
+        """mix two equal lengthed sample arrays, limiting the sum"""
+        np = _getNumpy()
+        if np is not None:
+            z = np.frombuffer(xArray, dtype=np.int16).astype(np.int32)
+            z += np.frombuffer(yArray, dtype=np.int16)
+            np.clip(z, -self.absMax, self.absMax, out=z)
+            return array.array("h", z.astype(np.int16).tobytes())
+        hi = self.absMax
+        lo = -hi
+        return array.array(
+            "h",
+            [
+                hi if z > hi else (lo if z < lo else z)
+                for z in map(operator.add, xArray, yArray)
+            ],
+        )
+
     def mix(self, xStr, yStr):
         """mix two equal lengthed data strings;"""
-        xArray = array.array("h")
-        xArray.fromstring(xStr)
-        xList = xArray.tolist()
-        yArray = array.array("h")
-        yArray.fromstring(yStr)
-        yList = yArray.tolist()
-        # print _MOD, 'comparing mix lists', len(xList), len(yList), self.ch
-        zList = []
-        i = 0
-        q = 0
-        for i in range(len(xList)):
-            # this should be limited
-            zList.append(self._frameLimit(xList[i] + yList[i]))
-        return array.array("h", zList).tostring()
+        return self.toData(self.mixArray(self.toArray(xStr), self.toArray(yStr)))
 
     def split(self, xStr):
         """split stereo data into two lists of data
         if there is 1000 frames dataLen will be 2000
         each side should have 1000 after complete"""
-        splitList = []
-        for ch in range(self.ch):
-            splitList.append([])  # create a list for each channel
+        # samples are only moved, so byte order does not matter
         xArray = array.array("h")
-        xArray.fromstring(xStr)
-        xList = xArray.tolist()  # possible not necessary
-        i = 0
-        while i < len(xList):
-            for ch in range(self.ch):
-                splitList[ch].append(xList[i])
-                i = i + 1
-        # convert back to data string format
-        # print _MOD, 'split source, side', len(xList), len(splitList[0]), self.ch
-        for ch in range(self.ch):
-            splitList[ch] = array.array("h", splitList[ch]).tostring()
-        return splitList  # list of channel data
+        xArray.frombytes(xStr)
+        return [xArray[ch :: self.ch].tobytes() for ch in range(self.ch)]
 
     def interleave(self, xStr, yStr):
         """intereleave two data sets
         channel is not considered"""
         xArray = array.array("h")
-        xArray.fromstring(xStr)
-        xList = xArray.tolist()  # possible not necessary
-
+        xArray.frombytes(xStr)
         yArray = array.array("h")
-        yArray.fromstring(xStr)
-        yList = yArray.tolist()  # possible not necessary
-
-        zList = []
-        for i in range(len(xList)):
-            zList.append(xList[i])
-            zList.append(yList[i])
-        # convert back to data string format
-        return array.array("h", zList).tostring()
+        yArray.frombytes(yStr)
+        zArray = self._zeros(len(xArray) * 2)
+        zArray[0::2] = xArray
+        zArray[1::2] = yArray
+        return zArray.tobytes()
 
     # -----------------------------------------------------------------------||--
     # tools to load unit interval array as samples
     # concver with various methods
 
-    def unitSynthesizer(self, xList, method=None):
-        """scale values to the bit depth
-        pack into a list, convert to string data
+    def iterUnitBlocks(self, xList, method=None, frames=None):
+        """scale values to the bit depth, and yield arrays of samples for
+        blocks of frames; xList may be any iterable
 
         assumes that values are normalized b/n 0 and 1
 
         direct; scales value in range of 0 to 1 between -max and amx
+        reflect and fold use zero crossings to effect sign of the wave form
         """
-        #         for i in range(len(xList)):
-        #             xList[i] = unit.limit(xList[i])
-
-        zList = []
-        max = byteToInt(self.bytes)
-        # print _MOD, max
-        if method in [None, "direct"]:
-            for x in xList:
-                valSigned = int(round(unit.denorm(x, -max, max)))
-                # add a value for each channel
-                for ch in range(self.ch):
-                    zList.append(valSigned)
-        # thee use zero crossings to effect sig of the wave form
-        elif method in ["reflect"]:
-            sign = 1  # 1 is positive
-            for x in xList:
-                val = unit.denorm(x, 0, max)
-                if val == 0:  # only change sign at zero crossing
-                    if sign == 1:
-                        sign = -1
-                    else:
-                        sign = 1
-                valSigned = val * sign
-                # add a value for each channel
-                for ch in range(self.ch):
-                    zList.append(valSigned)
-        elif method == "fold":
-            sign = 1  # 1 is positive
-            for x in xList:
-                val = abs(unit.denorm(x, -max, max))  # abs of full range
+        if frames == None:
+            frames = BLOCK_FRAMES
+        if method == None:
+            method = "direct"
+        if method not in ["direct", "reflect", "fold"]:
+            raise ValueError("unknown unit conversion method: %s" % method)
+        max = self.absMax
+        sign = 1  # 1 is positive
+        xIter = iter(xList)
+        while 1:
+            xBlock = list(itertools.islice(xIter, frames))
+            if not xBlock:
+                break
+            zList = []
+            for x in xBlock:
+                if method == "direct":
+                    zList.append(int(round(unit.denorm(x, -max, max))))
+                    continue
+                if method == "reflect":
+                    val = unit.denorm(x, 0, max)
+                elif method == "fold":
+                    val = abs(unit.denorm(x, -max, max))  # abs of full range
                 if val == 0:  # only change sign at zero crossing
-                    if sign == 1:
-                        sign = -1
-                    else:
-                        sign = 1
-                valSigned = val * sign
-                # add a value for each channel
+                    sign = -sign
+                zList.append(int(round(val * sign)))
+            if self.ch == 1:
+                yield array.array("h", zList)
+            else:  # add a value for each channel
+                zArray = self._zeros(len(zList) * self.ch)
                 for ch in range(self.ch):
-                    zList.append(valSigned)
+                    zArray[ch :: self.ch] = array.array("h", zList)
+                yield zArray
 
-        # print zList
-        return array.array("h", zList).tostring()
+    def unitSynthesizer(self, xList, method=None):
+        """scale values to the bit depth, and convert to data"""
+        zArray = array.array("h")
+        for block in self.iterUnitBlocks(xList, method):
+            zArray.extend(block)
+        return self.toData(zArray)
+
+    def iterDataBlocks(self, data, frames=None):
+        """yield arrays of samples for blocks of frames of file data"""
+        if frames == None:
+            frames = BLOCK_FRAMES
+        step = frames * self.ch * self.bytes
+        data = memoryview(data)
+        for i in range(0, len(data), step):
+            yield self.toArray(data[i : i + step])
+
+    def iterSilenceBlocks(self, frames, blockFrames=None):
+        """yield arrays of zero samples for frames, in blocks"""
+        if blockFrames == None:
+            blockFrames = BLOCK_FRAMES
+        for i in range(0, frames, blockFrames):
+            yield self._zeros(min(blockFrames, frames - i) * self.ch)
+
+    def iterFixedBlocks(self, blocks, frames=None):
+        """regroup an iterable of sample arrays into arrays of frames; only
+        the last may be shorter"""
+        if frames == None:
+            frames = BLOCK_FRAMES
+        size = frames * self.ch
+        zArray = array.array("h")
+        for block in blocks:
+            zArray.extend(block)
+            while len(zArray) >= size:
+                yield zArray[:size]
+                del zArray[:size]
+        if zArray:
+            yield zArray
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -610,6 +671,8 @@ class AudioFile:
         # store an envelope generator for convenience
         self.envlGenObj = EnvelopeGenerator()
         self.sampleGenObj = SampleGenerator()
+        # frames processed at a time by streaming methods
+        self.blockFrames = BLOCK_FRAMES
         # store initial settings
         self.ch = ch
         self.sr = sr
@@ -768,9 +831,11 @@ class AudioFile:
         None defaults to direct
         """
         # print _MOD, 'fillDataUnit got unitList;', unitList[0:10]
-        data = self.sampleGenObj.unitSynthesizer(unitList, method)
         self._open("w")
-        self.aObj.writeframesraw(data)
+        for zArray in self.sampleGenObj.iterUnitBlocks(
+            unitList, method, self.blockFrames
+        ):
+            self.aObj.writeframesraw(self.sampleGenObj.toData(zArray))
         self._close()
         # print _MOD, 'fillDataUnit done'
 
@@ -812,72 +877,57 @@ class AudioFile:
 
     def insertMix(self, pos, insertData, method=None):
         """insert the data at specifiec location
-        data can be in the form of a unitList (b/n 0 and 1)
-        or string data (assuming its in the same channel
+        data can be in the form of unit interval values (b/n 0 and 1), as
+        a list or any iterable, or data bytes (assuming its in the same channel)
+
+        the file is read, mixed, and written in blocks of self.blockFrames,
+        so memory does not grow with the size of the file or the insert
 
         it may be good to allow for a negative position:
         insert the necessary frames before x and y
         """
+        sampleGenObj = self.sampleGenObj
+        frames = self.blockFrames
+        if isinstance(insertData, (bytes, bytearray)):
+            yBlocks = sampleGenObj.iterDataBlocks(insertData, frames)
+        else:  # must be unit values
+            yBlocks = sampleGenObj.iterUnitBlocks(insertData, method, frames)
         # zero position measured form x
-        xData = self.getData()
-        xSize = copy.copy(self.frames)
-
-        if drawer.isStr(insertData):
-            # divide channel number * byte
-            ySize = arrayLenToFrameLen(len(insertData), self.bytes, self.ch)
-            yData = insertData
-        else:  # must be a unit list
-            ySize = len(insertData)  # channel does not matter in unit list
-            yData = self.sampleGenObj.unitSynthesizer(insertData, method)
-
-        # print _MOD, 'x, y size', xSize, ySize
-        if pos == 0:  # just pad end of shorter
-            if ySize == xSize:
-                _caseStr = "a"  # this is just for debugging
-                xFinal = xData
-                yFinal = yData
-            elif ySize > xSize:  # x needs pad after
-                _caseStr = "b"
-                dif = ySize - xSize
-                xFinal = xData + self.sampleGenObj.silence(dif)
-                yFinal = yData
-            elif ySize < xSize:  # y needs pad after
-                _caseStr = "c"
-                dif = xSize - ySize
-                xFinal = xData
-                yFinal = yData + self.sampleGenObj.silence(dif)
-        else:
-            if ySize >= xSize:
-                _caseStr = "d"
-                posRemain = (pos + ySize) - xSize
-                xFinal = xData + self.sampleGenObj.silence(posRemain)
-                yFinal = self.sampleGenObj.silence(pos) + yData
-            elif ySize < xSize:  # x needs pad after
-                if pos + ySize == xSize:
-                    _caseStr = "e"
-                    xRemain = pos  # postpend to x
-                    yRemain = 0
-                elif pos + ySize < xSize:  # need yRemain
-                    _caseStr = "f"
-                    xRemain = 0
-                    yRemain = xSize - (pos + ySize)
-                elif pos + ySize > xSize:  # need yRemain
-                    _caseStr = "g"
-                    xRemain = (pos + ySize) - xSize
-                    yRemain = 0
-
-                xFinal = xData + self.sampleGenObj.silence(xRemain)
-                yFinal = (
-                    self.sampleGenObj.silence(pos)
-                    + yData
-                    + self.sampleGenObj.silence(yRemain)
+        yBlocks = itertools.chain(sampleGenObj.iterSilenceBlocks(pos, frames), yBlocks)
+        yBlocks = sampleGenObj.iterFixedBlocks(yBlocks, frames)
+
+        # mix into a temporary file, then replace this file
+        nameStub, ext = os.path.splitext(self.absPath)
+        tempPath = "%s-temp%s" % (nameStub, ext)
+        dst = aifc.open(tempPath, "w")
+        dst.setnchannels(self.ch)
+        dst.setsampwidth(self.bytes)
+        dst.setframerate(self.sr)
+        self._open("r")
+        try:
+            while 1:
+                xArray = sampleGenObj.toArray(self.aObj.readframes(frames))
+                yArray = next(yBlocks, None)
+                if yArray is None:
+                    if not xArray:
+                        break
+                    yArray = sampleGenObj._zeros(len(xArray))
+                elif len(xArray) < len(yArray):  # x needs pad after
+                    xArray.extend(sampleGenObj._zeros(len(yArray) - len(xArray)))
+                elif len(yArray) < len(xArray):  # y needs pad after
+                    yArray.extend(sampleGenObj._zeros(len(xArray) - len(yArray)))
+                dst.writeframesraw(
+                    sampleGenObj.toData(sampleGenObj.mixArray(xArray, yArray))
                 )
-
-        # print _MOD, 'resize case:', _caseStr
-
-        data = self.sampleGenObj.mix(xFinal, yFinal)
-        self._open("w")  # over-write existing data
-        self.aObj.writeframesraw(data)
+        except Exception:  # leave this file unchanged
+            self._close()
+            dst.close()
+            os.remove(tempPath)
+            raise
+        self._close()
+        dst.close()
+        os.replace(tempPath, self.absPath)
+        self._open("r")  # update frames
         self._close()
 
     def envelopeSymmetric(self, fadeLen):
@@ -930,6 +980,8 @@ class AudioFile:
             print("no data: %s: %s, %s" % (self.frames, pos, frames))
             result = 0  # no data to get
         absMax = byteToInt(self.bytes)
+        if _SWAP:  # audioop reads native byte order
+            data = audioop.byteswap(data, self.bytes)
         max = audioop.max(data, self.bytes)
         rms = audioop.rms(data, self.bytes)
         if rms >= (absMax * rmsThresh) or max >= (absMax * maxThresh):
@@ -1172,6 +1224,66 @@ class Test(unittest.TestCase):
     def testDummy(self):
         self.assertEqual(True, True)
 
+    def testSampleGenerator(self):
+        sg = SampleGenerator()
+        sg.update(2, 44100, 2)
+        xArray = array.array("h", [32000, -32000, 100, -100])
+        # data is big-endian, as in aif files
+        self.assertEqual(sg.toData(xArray)[:2], b"\x7d\x00")
+        self.assertEqual(sg.toArray(sg.toData(xArray)), xArray)
+        self.assertEqual(xArray[0], 32000)  # source not altered
+        # sums are limited
+        self.assertEqual(
+            list(sg.mixArray(xArray, xArray)), [32767, -32767, 200, -200]
+        )
+        left, right = sg.split(sg.toData(xArray))
+        self.assertEqual(list(sg.toArray(left)), [32000, 100])
+        self.assertEqual(sg.interleave(left, right), sg.toData(xArray))
+        self.assertEqual(
+            list(sg.toArray(sg.multiply(sg.toData(xArray), [0.5, 0]))),
+            [16000, -16000, 0, 0],
+        )
+        # products are limited, with or without numpy
+        global _numpy
+        np = _numpy
+        try:
+            for _numpy in [np, False]:
+                post = sg.toArray(sg.multiply(sg.toData(xArray), [2, 2]))
+                self.assertEqual(list(post), [32767, -32767, 200, -200])
+        finally:
+            _numpy = np
+        self.assertRaises(ValueError, list, sg.iterUnitBlocks([0.5], "wrap"))
+        # a value for each channel, in fixed blocks
+        blocks = sg.iterUnitBlocks(iter([0, 0.5, 1]), None, 2)
+        self.assertEqual(
+            [list(b) for b in blocks], [[-32767, -32767, 0, 0], [32767, 32767]]
+        )
+        sg.update(1, 44100, 2)
+        blocks = sg.iterFixedBlocks(sg.iterSilenceBlocks(5, 3), 2)
+        self.assertEqual([len(b) for b in blocks], [2, 2, 1])
+
+    def testInsertMix(self):
+        if not AIF:
+            return
+        import tempfile
+
+        dir = tempfile.mkdtemp()
+        fp = os.path.join(dir, "test.aif")
+        a = AudioFile(fp, 1)
+        a.blockFrames = 2  # mix across several blocks
+        a.clear()
+        self.assertEqual(a.getSize(), 1)
+        a.insertMix(0, (x for x in [1, 0.5, 0]))
+        a.insertMix(2, [1, 1, 0.75])
+        a.insertMix(1, a.sampleGenObj.toData(array.array("h", [-100])))
+        self.assertEqual(a.getSize(), 5)
+        self.assertEqual(
+            list(a.sampleGenObj.toArray(a.getData())), [32767, -100, 0, 32767, 16384]
+        )
+        self.assertEqual(os.listdir(dir), ["test.aif"])
+        os.remove(fp)
+        os.rmdir(dir)
+
 
 # -----------------------------------------------------------------||||||||||||--
 if __name__ == "__main__":
@@ -31,6 +31,40 @@ environment = prefTools.Environment(_MOD)
 # -----------------------------------------------------------------||||||||||||--
 
 
+class RefDictArray:
+    """a read-only list of refDicts, one per event, used to score a clone
+    all events share one copy of the texture refDict, and differ only by bpm;
+    the refDict for an event is created when indexed
+
+    >>> a = RefDictArray({'bpm': 120, 'stateCurrentChord': (0, 4)}, [60, 90])
+    >>> len(a)
+    2
+    >>> a[1]['bpm'], a[1]['stateCurrentChord']
+    (90, (0, 4))
+    """
+
+    def __init__(self, refDictTexture, bpmArray):
+        self._base = refDictTexture.copy()  # texture refDict changes when scored
+        self._bpmArray = bpmArray
+
+    def __len__(self):
+        return len(self._bpmArray)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        eventDict = self._base.copy()
+        eventDict["bpm"] = self._bpmArray[i]
+        return eventDict
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+# -----------------------------------------------------------------||||||||||||--
+
+
 class Clone:
     """object of a clone; similar to a texture, but processes
     score data; does not actually generate data, but modifies
@@ -675,7 +709,8 @@ class Clone:
         the BPM of each note.
         """
         # should check that it has events
-        self.esObj = esObj.copy()  # dont assume this is a copy
+        # dont assume this is a copy; events are copied when first changed
+        self.esObj = esObj.snapshot()
         if len(self.esObj) == 0:
             raise Exception("no events in EventSequence object")
 
@@ -683,13 +718,8 @@ class Clone:
             if pmtrName[:6] != "cloneQ":  # check texture options
                 # reset all necessary variables before scoring
                 self.pmtrObjDict[pmtrName].reset()
-        bpmArray = self.esObj.getArray("bpm")
-
-        self.refDictArray = []
-        for val in bpmArray:  # use refDict from texture to create a new refArray
-            eventDict = copy.deepcopy(refDictTexture)
-            eventDict["bpm"] = val
-            self.refDictArray.append(eventDict)
+        # use refDict from texture, and bpm of each event, to create refArray
+        self.refDictArray = RefDictArray(refDictTexture, self.esObj.getArray("bpm"))
 
         # update event object
         self.esObj.updatePre()
@@ -770,7 +800,7 @@ class Clone:
 
     def getScore(self):
         assert len(self.esObj) != 0
-        return self.esObj.copy()  # return copy of object
+        return self.esObj.snapshot()  # return copy-on-write copy of object
 
     def clearScore(self):
         # print _MOD, 'clearing score'
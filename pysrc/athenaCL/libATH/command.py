@@ -1304,6 +1304,28 @@ class Command(object):
         else:
             return None
 
+    def _elConvertWindow(self, usrStr):
+        """convert a user string of start and end times, separated by a
+        comma, to a time window; return None if not a valid window
+
+        >>> from athenaCL.libATH import athenaObj; ao = athenaObj.AthenaObject()
+        >>> a = Command(ao)
+        >>> a._elConvertWindow('30,60.5')
+        (30.0, 60.5)
+        >>> a._elConvertWindow('test.xml') == None
+        True
+        >>> a._elConvertWindow('60,30') == None
+        True
+        """
+        if usrStr == None or usrStr.count(",") != 1:
+            return None
+        tStart, tEnd = usrStr.split(",")
+        tStart = drawer.strToNum(tStart, "float", 0)
+        tEnd = drawer.strToNum(tEnd, "float", 0)
+        if tStart == None or tEnd == None or tEnd <= tStart:
+            return None
+        return tStart, tEnd
+
     def _elGetInstrumentNo(self):
         """asks user for instrument number, displays list if asked"""
         # instInfo, instNoList = self.ao.orcObj.getInstInfo()
@@ -6583,6 +6605,7 @@ class ELn(Command):
         self.cmdStr = "ELn"
         # only difference w/ elw
         self.refresh = 1
+        self.window = None  # optional start and end time
 
     def gather(self):
         if self._tiTestExistance() != None:  # check existance
@@ -6597,12 +6620,19 @@ class ELn(Command):
         self.scoPath = None
         if self.args != "":
             self.args = argTools.ArgOps(self.args)  # no strip
-            self.scoPath = self._validWritePath(
-                self.args.get(0, "end"), ".xml", "fpLastDirEventList"
-            )
-            if self.scoPath == None:
-                return self._getUsage()
-            scoDir, scoName = os.path.split(self.scoPath)
+            # a time window may follow the file name, or be given alone
+            argCount = len(self.args.argList)
+            self.window = self._elConvertWindow(self.args.get(argCount - 1))
+            if self.window != None:
+                argCount = argCount - 1
+                self.args = argTools.ArgOps(self.args.argList[:-1])
+            if argCount > 0:
+                self.scoPath = self._validWritePath(
+                    self.args.get(0, "end"), ".xml", "fpLastDirEventList"
+                )
+                if self.scoPath == None:
+                    return self._getUsage()
+                scoDir, scoName = os.path.split(self.scoPath)
 
         if self.scoPath == None:
             self.scoPath = environment.getTempFile(".xml")
@@ -6638,7 +6668,11 @@ class ELn(Command):
         # None processes all objects in the init ao
         # 1 gets evaluated preference string
         outRequest = self.ao.external.getPref("athena", "eventOutput", 1)
-        ok, msg, outComplete = emObj.process(None, outRequest, self.refresh)
+        workers = self.ao.external.getPref("athena", "scoreWorkers", 1)
+        seed = self.ao.external.getPref("athena", "scoreSeed", 1)
+        ok, msg, outComplete = emObj.process(
+            None, outRequest, self.refresh, workers, seed, self.window
+        )
         if ok:  # scores exist
             self.report.append(msg)
         else:  # no scores were created
@@ -6656,6 +6690,13 @@ class ELn(Command):
 
     def log(self):
         if self.gatherStatus and self.processStatus:  # if complete
+            if self.window != None:
+                return "%s %s %s,%s" % (
+                    self.cmdStr,
+                    self.scoPath,
+                    self.window[0],
+                    self.window[1],
+                )
             return "%s %s" % (self.cmdStr, self.scoPath)
 
     def display(self):
@@ -6832,6 +6873,7 @@ class ELv(Command):
             msg = lang.msgEMviewError % self.viewPath
         else:
             msg = lang.msgELviewInit % self.viewPath
+        msg = msg + "score cache: %s\n" % self.ao.scoreCache.report()
         return msg
 
 
@@ -7101,7 +7143,9 @@ class _CommandAO(Command):
         return textureData
 
     def _aoDetermineFileFormat(self, path):
-        "check xml type of a file, or determine if it is an old pickled file"
+        "check xml type of a file, or determine if it is a binary file"
+        if ioTools.isBinary(path):
+            return "binary", "ok"
         with open(path, "r") as f:
             content = f.read()
 
@@ -7197,6 +7241,12 @@ class AOl(_CommandAO):
             aData, pData, tData = ioTools.extractXML(self.path)
             aData, pData, tData = ioTools.evalObjectDictionary(aData, pData, tData)
             self.formatString = "%s xml" % aData["version"]
+        elif fileFormat == "binary":
+            try:
+                aData, pData, tData = ioTools.extractBinary(self.path)
+            except ValueError as e:
+                return "%s\n" % e
+            self.formatString = "%s binary" % aData["version"]
         # check backwards compat issues
         aData, pData, tData = self.ao.backward.process(aData, pData, tData)
         # load data
@@ -7224,7 +7274,8 @@ class AOl(_CommandAO):
 
 
 class AOw(_CommandAO):
-    """creates an XML AthenaObject file
+    """creates an XML AthenaObject file, or a binary file if named with
+    ioTools.BINARY_EXTENSION
     uses _aoSave methods to create dictionaries w/ an xml shape
     these dictionaries are then passed to ioTools
     """
@@ -7246,6 +7297,10 @@ class AOw(_CommandAO):
         if args != "":
             args = argTools.ArgOps(args)  # no strip
             self.path = self._validWritePath(args.get(0, "end"), ".xml", "fpLastDir")
+            if self.path == None:  # try binary format
+                self.path = self._validWritePath(
+                    args.get(0, "end"), ioTools.BINARY_EXTENSION, "fpLastDir"
+                )
             if self.path == None:
                 return self._getUsage()
         if self.path == None:
@@ -7258,7 +7313,7 @@ class AOw(_CommandAO):
                 )
                 if ok != 1:
                     return lang.msgReturnCancel
-                if self.path[-4:] == ".xml":
+                if self.path[-4:] in (".xml", ioTools.BINARY_EXTENSION):
                     break
                 else:
                     dialog.msgOut(lang.msgAObadName, self.termObj)
@@ -7268,10 +7323,16 @@ class AOw(_CommandAO):
         athenaData = self._aoSaveAthenaData()
         pathData = self._aoSavePathData()
         textureData = self._aoSaveTextureData()
+        if self.path.endswith(ioTools.BINARY_EXTENSION):
+            write = ioTools.writeBinary
+        else:
+            write = ioTools.writeXML
         try:
-            ioTools.writeXML(self.path, athenaData, pathData, textureData)
+            write(self.path, athenaData, pathData, textureData)
         except (IOError, OSError):  # a bad path may be given
             return lang.msgFileError
+        except ValueError as e:  # data a binary file cannot encode
+            return "%s\n" % e
 
         # sytem dependent adjustments to AO file
         if os.name == "mac":
@@ -7347,6 +7408,12 @@ class AOmg(_CommandAO):
             aData, pData, tData = ioTools.extractXML(self.path)
             aData, pData, tData = ioTools.evalObjectDictionary(aData, pData, tData)
             self.formatString = "%s xml" % aData["version"]
+        elif fileFormat == "binary":
+            try:
+                aData, pData, tData = ioTools.extractBinary(self.path)
+            except ValueError as e:
+                return "%s\n" % e
+            self.formatString = "%s binary" % aData["version"]
         # check backwards compat issues
         aData, pData, tData = self.ao.backward.process(aData, pData, tData)
         pData, tData = self._aoRenameConflicts(pData, tData)
@@ -7573,6 +7640,58 @@ class APr(Command):
         return lang.msgAPrefreshMode % typeset.boolAsStr(curVal)
 
 
+class APsco(Command):
+    """sets the number of worker processes and the seed used for scoring"""
+
+    def __init__(self, ao, args="", **keywords):
+        Command.__init__(self, ao, args, **keywords)
+        self.processSwitch = 1  # display only
+        self.gatherSwitch = 1  # display only
+        self.cmdStr = "APsco"
+
+    def _apConvertWorkers(self, usrStr):
+        """range checks worker count"""
+        return drawer.strToNum(usrStr, "int", 0, 256)  # may be None
+
+    def _apGetWorkers(self):
+        """quaries user for a worker count, returns None on error"""
+        while 1:
+            usrString = dialog.askStr(lang.msgAPscoreGetWorkers, self.termObj)
+            if usrString == None:
+                return None
+            number = self._apConvertWorkers(usrString)
+            if number == None:
+                dialog.msgOut(lang.msgAPscoreBadWorkers, self.termObj)
+                continue
+            else:
+                return number
+
+    def gather(self):
+        args = self.args
+        self.workers = None
+        self.seed = self.ao.external.getPref("athena", "scoreSeed", 1)
+        if args != "":
+            args = argTools.ArgOps(args, stripComma=True)
+            self.workers = self._apConvertWorkers(args.get(0))
+            if self.workers == None:
+                return self._getUsage()
+            if args.get(1) != None:
+                self.seed = drawer.strToNum(args.get(1), "int")
+                if self.seed == None:
+                    return self._getUsage()
+        if self.workers == None:
+            self.workers = self._apGetWorkers()
+            if self.workers == None:
+                return lang.msgReturnCancel
+
+    def process(self):
+        self.ao.external.writePref("athena", "scoreWorkers", str(self.workers))
+        self.ao.external.writePref("athena", "scoreSeed", str(self.seed))
+
+    def display(self):
+        return lang.msgAPscore % (self.workers, self.seed)
+
+
 class APwid(Command):
     """manually sets screen width"""
 
@@ -8305,6 +8424,11 @@ class AUsys(Command):
         entryLines.append(["graphics format:", value])
         value = self.ao.external.getPref("athena", "refreshMode", 1)
         entryLines.append(["refresh mode:", typeset.boolAsStr(value)])
+        value = self.ao.external.getPref("athena", "scoreWorkers", 1)
+        entryLines.append(["score workers:", value])
+        value = self.ao.external.getPref("athena", "scoreSeed", 1)
+        entryLines.append(["score seed:", value])
+        entryLines.append(["score cache:", self.ao.scoreCache.report()])
 
         entryLines.append(["", ""])  # draw line
         entryLines.append(["preferences:", drawer.getPrefsPath()])
@@ -8944,6 +9068,28 @@ class Test(unittest.TestCase):
         second = rand.UniformRNG().random()
         self.assertEqual(first, second)
 
+    def testELnWindow(self):
+        import tempfile
+        from athenaCL.libATH import athenaObj
+
+        interpreter = athenaObj.Interpreter("terminal")
+        for cmd in ["EMo m", "TIn a 0"]:
+            ok, result = interpreter.cmd(cmd, errorMode="return")
+            self.assertTrue(ok, result)
+        path = os.path.join(tempfile.gettempdir(), "a.xml")
+        for args, window in [
+            (path, None),
+            ("%s 4,9" % path, (4.0, 9.0)),
+            ("4,9", (4.0, 9.0)),  # a window alone uses a temporary file
+        ]:
+            a = ELn(interpreter.ao, args=args)
+            self.assertEqual(a.gather(), None)
+            self.assertEqual(a.window, window)
+            if args == "4,9":
+                self.assertNotEqual(a.scoPath, path)
+            else:
+                self.assertEqual(a.scoPath, path)
+
     def testTPsd(self):
         from athenaCL.libATH import athenaObj
 
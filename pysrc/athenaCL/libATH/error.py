@@ -108,6 +108,16 @@ class MultisetError(Exception):
         return self._msg
 
 
+# raised by jobTools checkpoints when a command run as a job is cancelled
+class CancelError(Exception):
+    def __init__(self, msg=""):
+        self._msg = msg
+        Exception.__init__(self, "%s" % self._msg)
+
+    def __repr__(self):
+        return self._msg
+
+
 # was TestBug
 # now error.TestError
 class TestError(Exception):
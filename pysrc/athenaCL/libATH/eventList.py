@@ -8,11 +8,12 @@
 # Copyright:     (c) 2004-2010 Christopher Ariza
 # License:       GPL
 # -----------------------------------------------------------------||||||||||||--
-import os, time, random, copy, array
+import os, sys, time, random, copy, array, hashlib, collections, math
 import unittest, doctest
 
 
 from athenaCL.libATH import drawer
+from athenaCL.libATH import jobTools
 from athenaCL.libATH import language
 
 lang = language.LangObj()
@@ -24,6 +25,8 @@ from athenaCL.libATH import outFormat
 from athenaCL.libATH.libOrc import orc
 from athenaCL.libATH.libPmtr import basePmtr
 from athenaCL.libATH.omde import bpf  # needed for interpolation
+from athenaCL.libATH.omde import rand
+import renderExt
 
 _MOD = "eventList.py"
 from athenaCL.libATH import prefTools
@@ -162,6 +165,122 @@ def selectOutEngineOrc(emName, oeName):
         raise ValueError("no such ouput Engine name")
 
 
+# -----------------------------------------------------------------||||||||||||--
+# immutable types that can be shared, rather than copied, between events
+_SHARED_TYPES = (int, float, str, bool, type(None))
+
+
+def _repeatCopy(value, count):
+    """return a list of count copies of value; immutable values are shared"""
+    if type(value) in _SHARED_TYPES:
+        return [value] * count
+    return [copy.deepcopy(value) for i in range(count)]
+
+
+def _mergeOrder(timesA, timesB):
+    """return the index order that sorts the events of timesA followed by the
+    events of timesB by time, with equal times in index order; if both are in
+    time order they are merged, otherwise they are sorted
+
+    >>> _mergeOrder([0, 1, 2], [0.5, 1, 1.5])
+    [0, 3, 1, 4, 5, 2]
+    >>> _mergeOrder([0, 2, 1], [])
+    [0, 2, 1]
+    """
+    for times in (timesA, timesB):
+        for i in range(1, len(times)):
+            if times[i] < times[i - 1]:  # not in order; sort all
+                tRef = list(zip(timesA + timesB, range(len(timesA) + len(timesB))))
+                tRef.sort()
+                return [i for t, i in tRef]
+    order = []
+    a = 0
+    b = 0
+    lenA = len(timesA)
+    lenB = len(timesB)
+    while a < lenA and b < lenB:
+        if timesB[b] < timesA[a]:
+            order.append(lenA + b)
+            b += 1
+        else:
+            order.append(a)
+            a += 1
+    order.extend(range(a, lenA))
+    order.extend(range(lenA + b, lenA + lenB))
+    return order
+
+
+class _InterpolationSegment:
+    """interpolation between two events, evaluated at a list of frame times;
+    calling with a start and end value returns a list of values, one for each
+    frame. values are identical to those of the omde.bpf segment of the same
+    interpolation method
+
+    >>> a = _InterpolationSegment('linear', None, 0, 2, [0.5, 1, 1.5])
+    >>> a(0, 4)
+    [1.0, 2.0, 3.0]
+    >>> a = _InterpolationSegment('power', -1.5, 0, 2, [0.5, 1, 1.5])
+    >>> a(0, 4) == bpf.PowerSegment([(0, 0), (2, 4)], exp=-1.5).evaluate([0.5, 1, 1.5])
+    True
+    """
+
+    def __init__(self, method, exponent, tStart, tEnd, tFrames):
+        if method not in ("linear", "halfCosine", "power"):
+            raise ValueError("bad interpolation method: %s" % method)
+        self.method = method
+        self.exponent = exponent
+        t0 = float(tStart)
+        t1 = float(tEnd)
+        # frames outside of the events take the start or end value
+        self._edges = {}
+        self._r = []
+        for i, t in enumerate(tFrames):
+            if t < t0:
+                self._edges[i] = 0
+            elif t >= t1:
+                self._edges[i] = 1
+            self._r.append(None if i in self._edges else (t - t0) / (t1 - t0))
+        self._weights = {}  # weights shared by all parameters, by kind
+
+    def __len__(self):
+        return len(self._r)
+
+    def _weight(self, kind):
+        """return a list of weights, one for each frame, calculated once"""
+        if kind not in self._weights:
+            e = self.exponent
+            r = [0.0 if x is None else x for x in self._r]
+            if kind == "cosine":
+                w = [1 + math.cos(x * math.pi + math.pi) for x in r]
+            elif kind == "rise":  # r ** (1 + e), or r ** (1 - e)
+                p = 1.0 + e if e > 0.0 else 1.0 - e
+                w = [pow(x, p) for x in r]
+            elif kind == "fall":  # (1 - r) ** (1 + e), or (1 - r) ** (1 - e)
+                p = 1.0 + e if e > 0.0 else 1.0 - e
+                w = [pow(1.0 - x, p) for x in r]
+            self._weights[kind] = w
+        return self._weights[kind]
+
+    def __call__(self, valueStart, valueEnd):
+        v0 = float(valueStart)
+        v1 = float(valueEnd)
+        if self.method == "linear":
+            post = [v0 + (0.0 if x is None else x) * (v1 - v0) for x in self._r]
+        elif self.method == "halfCosine":
+            post = [v0 + ((v1 - v0) * w / 2.0) for w in self._weight("cosine")]
+        elif v1 == v0:  # power
+            post = [v0] * len(self._r)
+        elif self.exponent == 0.0:
+            post = [v0 + (0.0 if x is None else x) * (v1 - v0) for x in self._r]
+        elif (v1 >= v0) == (self.exponent > 0.0):
+            post = [v0 + w * (v1 - v0) for w in self._weight("rise")]
+        else:
+            post = [v1 + (w * (v0 - v1)) for w in self._weight("fall")]
+        for i, edge in self._edges.items():
+            post[i] = v1 if edge else v0
+        return post
+
+
 # -----------------------------------------------------------------||||||||||||--
 class EventSequence:
     """data representation of event lists; stores all event data
@@ -198,15 +317,35 @@ class EventSequence:
         self._eventList = []  # a list of event dictionaries, perhaps un sorted
         # can store: tStart, tEnd, ampMax
         self._eventData = {}  # dictionary that store attribute data
+        # true if the event list may be shared with a snapshot
+        self._shared = 0
+
+    def _own(self):
+        """called before changing the event list or its events; if shared
+        with a snapshot, replace the list and events with copies.
+        list values (aux, comment) are copied; values are otherwise shared"""
+        if not self._shared:
+            return
+        eventList = []
+        for event in self._eventList:
+            event = event.copy()
+            for key, value in list(event.items()):
+                if isinstance(value, list):
+                    event[key] = value[:]
+            eventList.append(event)
+        self._eventList = eventList
+        self._shared = 0
 
     # -----------------------------------------------------------------------||--
     # built in methods
     def append(self, eventDict):
         """append an event dictionary"""
+        self._own()
         self._eventList.append(eventDict)
 
     def clear(self):
         self._eventList = []
+        self._shared = 0
 
     def __len__(self):
         return len(self._eventList)
@@ -216,15 +355,64 @@ class EventSequence:
         return list(range(0, len(self._eventList)))
 
     def __getitem__(self, key):
-        """numbers are index keys, return event dict at this location"""
-        return self._eventList[key]
+        """numbers are index keys, return a view of the event at this
+        location, as EventSequenceColumnar does; lists returned by the view
+        are copies, so events are only changed by assigning to the view.
+        if shared w/ a snapshot, reading does not copy, and assigning first
+        copies the event list
+
+        >>> a = EventSequence()
+        >>> a.append({'time': 0, 'aux': [0.5]})
+        >>> a[0]['aux'][0] = 1
+        >>> a[0]['aux']
+        [0.5]
+        >>> a[0]['aux'] = [1]
+        >>> a[0]
+        {'time': 0, 'aux': [1]}
+        """
+        if isinstance(key, slice):
+            return [_EventView(self, i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key = key + len(self._eventList)
+        if key < 0 or key >= len(self._eventList):
+            raise IndexError("event index out of range")
+        return _EventView(self, key)
 
     def __setitem__(self, key, value):
+        self._own()
         self._eventList[key] = value
 
     def __delitem__(self, key):
+        self._own()
         del self._eventList[key]
 
+    # -----------------------------------------------------------------------||--
+    # event values, as read and written by an _EventView
+    # lists are returned as copies, as they may be shared w/ a snapshot
+
+    def _getValue(self, i, key):
+        value = self._eventList[i][key]
+        if isinstance(value, list):
+            return value[:]
+        return value
+
+    def _setValue(self, i, key, value):
+        self._own()
+        self._eventList[i][key] = value
+
+    def _delValue(self, i, key):
+        self._own()
+        del self._eventList[i][key]
+
+    def _getKeys(self, i):
+        return list(self._eventList[i].keys())
+
+    def _getDict(self, i):
+        post = {}
+        for key in self._getKeys(i):
+            post[key] = self._getValue(i, key)
+        return post
+
     def copy(self):
         esObj = EventSequence()
         # this will not work w/ arrays
@@ -232,6 +420,55 @@ class EventSequence:
         esObj._eventData = copy.deepcopy(self._eventData)
         return esObj
 
+    def snapshot(self):
+        """return a copy-on-write copy: the new object shares its event
+        list with this object until either changes events, at which time
+        the one changing makes its own copy. reading, sorting, and
+        retrograding do not copy. events are views, and return copies of
+        lists; assign to change them
+
+        >>> a = EventSequence()
+        >>> a.append({'time': 0, 'dur': 1, 'aux': [0.5]})
+        >>> b = a.snapshot()
+        >>> b.list() is a.list()
+        True
+        >>> b.setArray('dur', [2])
+        >>> a[0]['aux'] = [0.5, 1]
+        >>> a[0], b[0]
+        ({'time': 0, 'dur': 1, 'aux': [0.5, 1]}, {'time': 0, 'dur': 2, 'aux': [0.5]})
+        >>> c = b.snapshot()
+        >>> c[0]['time'], c.list() is b.list()
+        (0, True)
+        """
+        esObj = EventSequence()
+        esObj._eventList = self._eventList
+        esObj._eventData = self._eventData.copy()
+        esObj._shared = 1
+        self._shared = 1
+        return esObj
+
+    def byteCount(self):
+        """return an estimate of the memory, in bytes, held by events;
+        all events are assumed to be the size of the first
+
+        >>> a = EventSequence()
+        >>> empty = a.byteCount()
+        >>> a.append({'time': 0, 'dur': 1, 'aux': [0.5]})
+        >>> a.byteCount() > empty
+        True
+        """
+        count = sys.getsizeof(self._eventList)
+        if len(self._eventList) == 0:
+            return count
+        event = self._eventList[0]
+        size = sys.getsizeof(event)
+        for value in event.values():
+            size = size + sys.getsizeof(value)
+            if isinstance(value, list):
+                for part in value:
+                    size = size + sys.getsizeof(part)
+        return count + size * len(self._eventList)
+
     def sort(self):
         """sort the event list in place according to time values
         called automatically w/ updatePost; called after texture creation
@@ -246,12 +483,27 @@ class EventSequence:
             alt.append(self._eventList[i])
         self._eventList = alt  # assign to eventList
 
+    def window(self, tStart, tEnd):
+        """remove all events that do not start in the time window from
+        tStart up to tEnd; remaining events are not copied
+
+        >>> a = EventSequence()
+        >>> for t in [0, 1, 2, 3]: a.append({'time': t, 'sus': 1})
+        >>> a.window(1, 3)
+        >>> a.getArray('time')
+        [1, 2]
+        """
+        self._eventList = [
+            event for event in self._eventList if tStart <= event["time"] < tEnd
+        ]
+
     # -----------------------------------------------------------------------||--
     # data access and loading
 
     def list(self):
         """return a reference to the event list
-        not a copy; only used for translations"""
+        not a copy; only used for translations; events must not be changed
+        as they may be shared w/ a snapshot"""
         return self._eventList
 
     def meta(self, key):
@@ -260,14 +512,12 @@ class EventSequence:
 
     def getArray(self, name):
         """get a copy of all values from the event list as an array"""
-        data = []
-        for event in self._eventList:
-            data.append(event[name])
-        return data
+        return [event[name] for event in self._eventList]
 
     def setArray(self, name, data):
         """load all values from the event list as an array"""
         assert len(data) == len(self._eventList)
+        self._own()
         for i in range(0, len(data)):
             self._eventList[i][name] = data[i]
 
@@ -321,7 +571,18 @@ class EventSequence:
         """givena tFrameArray, create interpolated events between existing events
         tFrameArray: tStart, dur, eventFlag, interpMethod, interpExponet
             # event frames are len==5, others do not have interpExponet
-        exponet can only be updated for each event"""
+        exponet can only be updated for each event
+
+        frames are computed a column of values at a time, for each active
+        parameter, and are merged with events in time order
+
+        >>> a = EventSequence()
+        >>> a.append({'time': 0, 'sus': 1, 'amp': 0.0, 'aux': [0, 'x']})
+        >>> a.append({'time': 1, 'sus': 1, 'amp': 1.0, 'aux': [1, 'y']})
+        >>> a.interpolate([(0, 1, 1, 'linear', 0), (0.5, 0.5, 0), (1, 1, 1, 'linear', 0)], 1, ['time', 'amp', 'aux'])
+        >>> [(e['time'], e['sus'], e['amp'], e['aux']) for e in a]
+        [(0, 0.5, 0.0, [0, 'x']), (0.5, 0.5, 0.5, [0.5, 'x']), (1, 1, 1.0, [1, 'y'])]
+        """
 
         # get a list of index values for events within tFrameArray
         eventFrameIndex = []
@@ -334,102 +595,54 @@ class EventSequence:
                 "tFrameArray does not contain all events stored: %s, %s"
                 % (self.__len__(), len(eventFrameIndex))
             )
+        self._own()  # start events are edited below
 
+        eventList = self._eventList
+        interpolated = [pmtr for pmtr in active if pmtr != "aux"]
+        frames = []  # new events, in the order of tFrameArray
         # iterate over all indexes less 1, as two are done at a time
         for i in range(self.__len__() - 1):
-            eStart = self._eventList[i]
-            eEnd = self._eventList[i + 1]
-
+            eStart = eventList[i]
+            eEnd = eventList[i + 1]
             # range of frames to create is between event frames start and end
             frameStart = eventFrameIndex[i] + 1
-            frameEnd = eventFrameIndex[i + 1] - 1
-
-            # prepare list of parameters to clone in a dictionary
-            # always include aux list, as some vals may not be numbers
-            eventTemplate = {}
-            for key in list(eStart.keys()):
-                if key not in active or key == "aux":
-                    eventTemplate[key] = copy.deepcopy(eStart[key])
-
-            # create a dict of bpl objs to acces when creating frames
-            # start and end times should be of events, not frames
-            tStart = tFrameArray[eventFrameIndex[i]][0]
-            tEnd = tFrameArray[eventFrameIndex[i + 1]][0]
-            # these values are only found w/ event frames
-            interpolationMethod = tFrameArray[eventFrameIndex[i]][3]
-            exponent = tFrameArray[eventFrameIndex[i]][4]
-
-            bpArray = {}
-            for pmtr in active:
-                if pmtr == "aux":
-                    continue
-
-                valStart = eStart[pmtr]
-                valEnd = eEnd[pmtr]
-                boundaryPair = [(tStart, valStart), (tEnd, valEnd)]
-
-                # create segment
-                if interpolationMethod == "linear":
-                    bp = bpf.LinearSegment(boundaryPair)
-                elif interpolationMethod == "halfCosine":
-                    bp = bpf.HalfCosineSegment(boundaryPair)
-                elif interpolationMethod == "power":
-                    bp = bpf.PowerSegment(boundaryPair, exp=exponent)
-                bpArray[pmtr] = bp
-
-            # handle aux by creating a list of lists
-            if "aux" in active:
-                pmtr = "aux"
-                valStartArray = eStart[pmtr]
-                valEndArray = eEnd[pmtr]
-                # create a list w/n bpArray to append w/n
-                bpArray[pmtr] = []
-
-                # iterate over every aux slot in the source aux list
-                for iAux in range(len(eStart[pmtr])):
-                    # some aux values may not be numbers
-                    if not drawer.isNum(valStartArray[iAux]):
-                        bpArray[pmtr].append(None)
-                        continue  # use vals in template
-
-                    boundaryPair = [
-                        (tStart, valStartArray[iAux]),
-                        (tEnd, valEndArray[iAux]),
-                    ]
-
-                    # create segment
-                    if interpolationMethod == "linear":
-                        bp = bpf.LinearSegment(boundaryPair)
-                    elif interpolationMethod == "cosine":
-                        bp = bpf.HalfCosineSegment(boundaryPair)
-                    elif interpolationMethod == "power":
-                        bp = bpf.PowerSegment(boundaryPair, exp=exponent)
-                    bpArray[pmtr].append(bp)
-
-            # create frames using eventTemplate and acccessing values from bpArray
-            for frameIndex in range(frameStart, frameEnd + 1):
-                # use template to store all non-interpolated values
-                eventDict = copy.deepcopy(eventTemplate)
-                tFrameStart = tFrameArray[frameIndex][0]
-                tFrameDur = tFrameArray[frameIndex][1]
-                for pmtr in active:
-                    if pmtr == "aux":
+            frameSpan = tFrameArray[frameStart : eventFrameIndex[i + 1]]
+
+            if len(frameSpan) > 0:
+                # start and end times should be of events, not frames
+                # these values are only found w/ event frames
+                frameEvent = tFrameArray[eventFrameIndex[i]]
+                tEnd = tFrameArray[eventFrameIndex[i + 1]][0]
+                segment = _InterpolationSegment(
+                    frameEvent[3],  # interpolation method
+                    frameEvent[4],  # exponent
+                    frameEvent[0],
+                    tEnd,
+                    [frame[0] for frame in frameSpan],
+                )
+                count = len(frameSpan)
+                # a column of values for each key, in the key order of events
+                keys = []
+                columns = []
+                for key in list(eStart.keys()):
+                    if key in interpolated:
                         continue
-                    #  print(bpArray[pmtr])
-                    #  print(bpArray[pmtr](tFrameStart))
-                    eventDict[pmtr] = bpArray[pmtr](tFrameStart)
-                if "aux" in active:
-                    pmtr = "aux"
-                    for iAux in range(len(eStart[pmtr])):
-                        # keep value set in template
-                        if bpArray[pmtr][iAux] == None:
-                            continue
-                        eventDict[pmtr][iAux] = bpArray[pmtr][iAux](tFrameStart)
-
-                if snapSus:  # will override template value
-                    eventDict["sus"] = tFrameDur
-                # add eventDictionary to this eventList
-                self.append(eventDict)
+                    elif key == "aux" and "aux" in active:
+                        column = self._interpolateAux(segment, eStart[key], eEnd[key])
+                    elif key == "sus" and snapSus:  # will override event value
+                        column = [frame[1] for frame in frameSpan]
+                    else:  # non-interpolated values are copied
+                        column = _repeatCopy(eStart[key], count)
+                    keys.append(key)
+                    columns.append(column)
+                for pmtr in interpolated:
+                    keys.append(pmtr)
+                    columns.append(segment(eStart[pmtr], eEnd[pmtr]))
+                if snapSus and "sus" not in keys:
+                    keys.append("sus")
+                    columns.append([frame[1] for frame in frameSpan])
+                for row in zip(*columns):
+                    frames.append(dict(zip(keys, row)))
 
             # if snap sus, alter sus of start and end events
             if snapSus:
@@ -437,8 +650,33 @@ class EventSequence:
                 eStart["sus"] = tFrameArray[frameStart][0] - eStart["time"]
                 # ending event is not adjusted
 
-        # sort after processing
-        self.sort()
+        # events and frames are each usually in time order, and can be merged
+        order = _mergeOrder(
+            self.getArray("time"), [frame["time"] for frame in frames]
+        )
+        self._insertOrdered(frames, order)
+
+    def _interpolateAux(self, segment, auxStart, auxEnd):
+        """return a column of aux lists, interpolating numeric aux values
+        between the start and end lists"""
+        count = len(segment)
+        slots = []
+        # iterate over every aux slot in the source aux list
+        for iAux in range(len(auxStart)):
+            # some aux values may not be numbers
+            if not drawer.isNum(auxStart[iAux]):
+                slots.append(_repeatCopy(auxStart[iAux], count))
+            else:
+                slots.append(segment(auxStart[iAux], auxEnd[iAux]))
+        if len(slots) == 0:
+            return [[] for i in range(count)]
+        return [list(row) for row in zip(*slots)]
+
+    def _insertOrdered(self, events, order):
+        """add events, a list of event dictionaries; order gives the final
+        position of each event, indexed as existing events followed by events"""
+        eventList = self._eventList + events
+        self._eventList = [eventList[i] for i in order]
 
     def retrograde(self, type):
         """perform retrograde transformations directly on an event list
@@ -509,6 +747,7 @@ class EventSequence:
                 t = t + altDur
 
         self._eventList = alt  # reassign to eventList
+        self._shared = 0  # all events are new copies
 
     # -----------------------------------------------------------------------||--
     # format conversions
@@ -536,6 +775,665 @@ class EventSequence:
         return splitScore
 
 
+# -----------------------------------------------------------------||||||||||||--
+# columnar event storage: an alternative to a list of event dictionaries
+# if true, textures store their scores in EventSequenceColumnar objects
+EVENT_SEQUENCE_COLUMNAR = False
+
+# standard event keys, in the order used by baseTexture.makeEvent
+_EVENT_KEYS = (
+    "inst",
+    "time",
+    "bpm",
+    "pulse",
+    "dur",
+    "sus",
+    "acc",
+    "amp",
+    "ps",
+    "pan",
+    "aux",
+    "comment",
+)
+_EVENT_BIT = dict([(key, 1 << i) for i, key in enumerate(_EVENT_KEYS)])
+# keys stored in array('d') columns; ints are flagged and restored on access
+_EVENT_NUMERIC = ("inst", "time", "bpm", "dur", "sus", "acc", "amp", "ps", "pan")
+_EVENT_NUMERIC_BITS = tuple([(key, _EVENT_BIT[key]) for key in _EVENT_NUMERIC])
+_EVENT_BITS_ALL = (1 << len(_EVENT_KEYS)) - 1
+# keys stored as indices into a table of shared strings and tuples
+_EVENT_SHARED = ("pulse", "comment")
+# largest int that survives a round trip through a double
+_INT_EXACT = 2**53
+# aux value kinds
+_AUX_FLOAT = 0
+_AUX_INT = 1
+_AUX_OBJECT = 2
+
+_MISSING = object()
+
+
+def eventSequenceFactory():
+    """return an empty event sequence of the configured storage type
+
+    >>> a = eventSequenceFactory()
+    >>> len(a)
+    0
+    """
+    if EVENT_SEQUENCE_COLUMNAR:
+        return EventSequenceColumnar()
+    return EventSequence()
+
+
+class _EventView(object):
+    """a lightweight, dictionary-like view of one event of an EventSequence
+    or EventSequenceColumnar; values are read from and written to the
+    sequence
+
+    a view refers to an event position, not an event: after sorting or
+    otherwise reordering the sequence a view refers to a different event
+    lists returned for aux and comment are copies; assign to change them
+    """
+
+    __slots__ = ("_es", "_i")
+
+    def __init__(self, es, i):
+        self._es = es
+        self._i = i
+
+    def __getitem__(self, key):
+        return self._es._getValue(self._i, key)
+
+    def __setitem__(self, key, value):
+        self._es._setValue(self._i, key, value)
+
+    def __delitem__(self, key):
+        self._es._delValue(self._i, key)
+
+    def __contains__(self, key):
+        return key in self._es._getKeys(self._i)
+
+    def __len__(self):
+        return len(self._es._getKeys(self._i))
+
+    def __iter__(self):
+        return iter(self._es._getKeys(self._i))
+
+    def keys(self):
+        return self._es._getKeys(self._i)
+
+    def values(self):
+        return [self._es._getValue(self._i, key) for key in self.keys()]
+
+    def items(self):
+        return [(key, self._es._getValue(self._i, key)) for key in self.keys()]
+
+    def get(self, key, default=None):
+        try:
+            return self._es._getValue(self._i, key)
+        except KeyError:
+            return default
+
+    def copy(self):
+        """return the event as a dictionary"""
+        return self._es._getDict(self._i)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._es._getDict(self._i), memo)
+
+    def __eq__(self, other):
+        if isinstance(other, _EventView):
+            other = other.copy()
+        return self.copy() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class _EventViewList(object):
+    """a read-only sequence of event views, returned by
+    EventSequenceColumnar.list() in place of a list of event dictionaries"""
+
+    __slots__ = ("_es",)
+
+    def __init__(self, es):
+        self._es = es
+
+    def __len__(self):
+        return len(self._es)
+
+    def __getitem__(self, key):
+        return self._es[key]
+
+    def __iter__(self):
+        es = self._es
+        for i in range(len(es)):
+            yield _EventView(es, i)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(view, memo) for view in self]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class EventSequenceColumnar(EventSequence):
+    """an EventSequence that stores events in parallel columns rather than
+    as a list of dictionaries
+
+    numeric values (inst, time, bpm, dur, sus, acc, amp, ps, pan) are stored
+    in array('d') columns; a bit mask per event records which of these
+    were ints, so that values are returned with the type they were given.
+    pulse strings and comment lists are stored once in a shared table and
+    referenced by index. aux lists are stored in one flat array, with a
+    start position and length for each event. any other value or key is
+    kept in a per-event dictionary.
+
+    events are accessed as _EventView objects, which support the dictionary
+    operations used by translators, clones, and texture modules
+
+    >>> a = EventSequenceColumnar()
+    >>> a.append({'time': 0, 'dur': 0.5, 'pulse': '(1,1,+)', 'aux': [1, 'a']})
+    >>> a.append({'time': 1.5, 'dur': 0.25, 'pulse': '(1,1,+)', 'aux': []})
+    >>> len(a)
+    2
+    >>> a[0]['time'], a[1]['time']
+    (0, 1.5)
+    >>> a[0]['aux']
+    [1, 'a']
+    >>> a.getArray('dur')
+    [0.5, 0.25]
+    >>> a[1]['time'] = 0.25
+    >>> a.sort()
+    >>> a.getArray('time')
+    [0, 0.25]
+    """
+
+    def __init__(self):
+        self._eventData = {}  # dictionary that store attribute data
+        self._clearColumns()
+
+    def _clearColumns(self):
+        # bit mask of standard keys stored in columns, for each event
+        self._present = array.array("H")
+        # bit mask of numeric keys whose value was an int, for each event
+        self._intMask = array.array("H")
+        self._numeric = {}
+        for key in _EVENT_NUMERIC:
+            self._numeric[key] = array.array("d")
+        self._sharedIds = {}
+        for key in _EVENT_SHARED:
+            self._sharedIds[key] = array.array("i")
+        self._sharedTable = []  # shared strings and comment tuples
+        self._sharedIndex = {}  # value to position in shared table
+        # ragged aux storage
+        self._auxStart = array.array("L")
+        self._auxLen = array.array("L")
+        self._auxData = array.array("d")
+        self._auxKind = array.array("b")
+        self._auxObjects = {}  # flat aux position to non-numeric value
+        # values that cannot be stored in columns, by event index
+        self._extra = {}
+        # or of all int masks and of all missing standard keys;
+        # only reset when cleared, these are used to select fast paths
+        self._intBits = 0
+        self._missingBits = 0
+
+    # -----------------------------------------------------------------------||--
+    # column access
+
+    def _sharedId(self, value):
+        try:
+            return self._sharedIndex[value]
+        except KeyError:
+            self._sharedIndex[value] = len(self._sharedTable)
+            self._sharedTable.append(value)
+            return self._sharedIndex[value]
+
+    def _appendAux(self, auxiliary):
+        """store aux values at the end of the flat aux array; return start"""
+        start = len(self._auxData)
+        pos = start
+        for value in auxiliary:
+            valueType = type(value)
+            if valueType is float:
+                self._auxData.append(value)
+                self._auxKind.append(_AUX_FLOAT)
+            elif valueType is int and -_INT_EXACT <= value <= _INT_EXACT:
+                self._auxData.append(value)
+                self._auxKind.append(_AUX_INT)
+            else:
+                self._auxData.append(0.0)
+                self._auxKind.append(_AUX_OBJECT)
+                self._auxObjects[pos] = value
+            pos += 1
+        return start
+
+    def _getAux(self, i):
+        start = self._auxStart[i]
+        end = start + self._auxLen[i]
+        post = self._auxData[start:end].tolist()
+        kind = self._auxKind
+        for j in range(start, end):
+            if kind[j] == _AUX_INT:
+                post[j - start] = int(post[j - start])
+            elif kind[j] == _AUX_OBJECT:
+                post[j - start] = self._auxObjects[j]
+        return post
+
+    def _setAux(self, i, auxiliary):
+        start = self._auxStart[i]
+        for j in range(start, start + self._auxLen[i]):
+            if self._auxKind[j] == _AUX_OBJECT:
+                del self._auxObjects[j]
+        if len(auxiliary) == self._auxLen[i]:  # overwrite in place
+            for j, value in enumerate(auxiliary):
+                valueType = type(value)
+                if valueType is float:
+                    kind = _AUX_FLOAT
+                elif valueType is int and -_INT_EXACT <= value <= _INT_EXACT:
+                    kind = _AUX_INT
+                else:
+                    kind = _AUX_OBJECT
+                    self._auxObjects[start + j] = value
+                    value = 0.0
+                self._auxData[start + j] = value
+                self._auxKind[start + j] = kind
+        else:  # old values are left unreferenced until the next reorder
+            self._auxStart[i] = self._appendAux(auxiliary)
+            self._auxLen[i] = len(auxiliary)
+
+    def _storeColumn(self, i, key, value):
+        """try to store a standard key in its column; return 1 on success
+        the caller must clear any extra value for this key"""
+        bit = _EVENT_BIT[key]
+        if key in self._numeric:
+            valueType = type(value)
+            if valueType is float:
+                self._numeric[key][i] = value
+                self._intMask[i] &= ~bit
+            elif valueType is int and -_INT_EXACT <= value <= _INT_EXACT:
+                self._numeric[key][i] = value
+                self._intMask[i] |= bit
+                self._intBits |= bit
+            else:
+                return 0
+        elif key == "aux":
+            if type(value) is not list:
+                return 0
+            if self._present[i] & bit:
+                self._setAux(i, value)
+            else:
+                self._auxStart[i] = self._appendAux(value)
+                self._auxLen[i] = len(value)
+        elif key == "pulse":
+            if type(value) is not str:
+                return 0
+            self._sharedIds[key][i] = self._sharedId(value)
+        else:  # comment
+            if type(value) is not list:
+                return 0
+            try:
+                self._sharedIds[key][i] = self._sharedId(tuple(value))
+            except TypeError:  # unhashable components
+                return 0
+        self._present[i] |= bit
+        return 1
+
+    def _clearColumn(self, i, key):
+        bit = _EVENT_BIT[key]
+        if key == "aux" and self._present[i] & bit:
+            self._setAux(i, [])
+        self._present[i] &= ~bit
+        self._intMask[i] &= ~bit
+        self._missingBits |= bit
+
+    def _getValue(self, i, key):
+        bit = _EVENT_BIT.get(key, 0)
+        if self._present[i] & bit:
+            col = self._numeric.get(key)
+            if col is not None:
+                if self._intMask[i] & bit:
+                    return int(col[i])
+                return col[i]
+            elif key == "aux":
+                return self._getAux(i)
+            elif key == "pulse":
+                return self._sharedTable[self._sharedIds[key][i]]
+            return list(self._sharedTable[self._sharedIds[key][i]])
+        extra = self._extra.get(i)
+        if extra is not None and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def _setValue(self, i, key, value):
+        extra = self._extra.get(i)
+        if extra is not None and key in extra:
+            del extra[key]
+            if not extra:
+                del self._extra[i]
+        if key in _EVENT_BIT:
+            if self._storeColumn(i, key, value):
+                return
+            self._clearColumn(i, key)
+        self._extra.setdefault(i, {})[key] = value
+
+    def _delValue(self, i, key):
+        self._getValue(i, key)  # raises KeyError if not defined
+        extra = self._extra.get(i)
+        if extra is not None and key in extra:
+            del extra[key]
+            if not extra:
+                del self._extra[i]
+        if key in _EVENT_BIT:
+            self._clearColumn(i, key)
+
+    def _getKeys(self, i):
+        present = self._present[i]
+        extra = self._extra.get(i)
+        if extra is None:
+            return [key for key in _EVENT_KEYS if present & _EVENT_BIT[key]]
+        post = [
+            key for key in _EVENT_KEYS if present & _EVENT_BIT[key] or key in extra
+        ]
+        for key in extra:
+            if key not in _EVENT_BIT:
+                post.append(key)
+        return post
+
+    def _getDict(self, i):
+        post = {}
+        for key in self._getKeys(i):
+            post[key] = self._getValue(i, key)
+        return post
+
+    def _index(self, key):
+        if key < 0:
+            key += len(self._present)
+        if key < 0 or key >= len(self._present):
+            raise IndexError("event index out of range")
+        return key
+
+    def _compactAux(self):
+        """rewrite aux storage in event order, removing unreferenced values"""
+        auxStart, auxLen = self._auxStart, self._auxLen
+        auxData, auxKind = self._auxData, self._auxKind
+        auxObjects = self._auxObjects
+        self._auxStart = array.array("L")
+        self._auxData = array.array("d")
+        self._auxKind = array.array("b")
+        self._auxObjects = {}
+        for i in range(len(auxLen)):
+            start = auxStart[i]
+            end = start + auxLen[i]
+            startNew = len(self._auxData)
+            self._auxStart.append(startNew)
+            self._auxData.extend(auxData[start:end])
+            self._auxKind.extend(auxKind[start:end])
+            for j in range(start, end):
+                if auxKind[j] == _AUX_OBJECT:
+                    self._auxObjects[startNew + j - start] = auxObjects[j]
+
+    def _reorder(self, order):
+        """rebuild all columns with events in the order of the index list
+        order; events not in order are removed"""
+        compact = len(order) != len(self._present)
+        self._present = array.array("H", map(self._present.__getitem__, order))
+        self._intMask = array.array("H", map(self._intMask.__getitem__, order))
+        for key in _EVENT_NUMERIC:
+            col = self._numeric[key]
+            self._numeric[key] = array.array("d", map(col.__getitem__, order))
+        for key in _EVENT_SHARED:
+            col = self._sharedIds[key]
+            self._sharedIds[key] = array.array("i", map(col.__getitem__, order))
+        # aux values stay in place; only positions are reordered
+        self._auxStart = array.array("L", map(self._auxStart.__getitem__, order))
+        self._auxLen = array.array("L", map(self._auxLen.__getitem__, order))
+        if compact:  # drop aux values of removed events
+            self._compactAux()
+
+        extra = self._extra
+        self._extra = {}
+        if extra:
+            for iNew, i in enumerate(order):
+                if i in extra:
+                    self._extra[iNew] = extra[i]
+
+    # -----------------------------------------------------------------------||--
+    # built in methods
+
+    def append(self, eventDict):
+        """append an event dictionary, or any object with get() and
+        dictionary access; values are copied into the columns"""
+        i = len(self._present)
+        get = eventDict.get
+        present = 0
+        intMask = 0
+        found = 0  # count of standard keys defined
+        extra = {}
+        for key, bit in _EVENT_NUMERIC_BITS:
+            value = get(key, _MISSING)
+            valueType = type(value)
+            if valueType is float:
+                self._numeric[key].append(value)
+                present |= bit
+            elif valueType is int and -_INT_EXACT <= value <= _INT_EXACT:
+                self._numeric[key].append(value)
+                present |= bit
+                intMask |= bit
+            else:
+                self._numeric[key].append(0.0)
+                if value is _MISSING:
+                    continue
+                extra[key] = value
+            found += 1
+
+        for key in _EVENT_SHARED:
+            value = get(key, _MISSING)
+            if key == "pulse" and type(value) is str:
+                shared = value
+            elif key == "comment" and type(value) is list:
+                try:
+                    shared = tuple(value)
+                    hash(shared)
+                except TypeError:  # unhashable components
+                    shared = _MISSING
+            else:
+                shared = _MISSING
+            if shared is _MISSING:
+                self._sharedIds[key].append(0)
+                if value is _MISSING:
+                    continue
+                extra[key] = value
+            else:
+                self._sharedIds[key].append(self._sharedId(shared))
+                present |= _EVENT_BIT[key]
+            found += 1
+
+        value = get("aux", _MISSING)
+        if type(value) is list:
+            self._auxStart.append(self._appendAux(value))
+            self._auxLen.append(len(value))
+            present |= _EVENT_BIT["aux"]
+        else:
+            self._auxStart.append(len(self._auxData))
+            self._auxLen.append(0)
+            if value is not _MISSING:
+                extra["aux"] = value
+        if value is not _MISSING:
+            found += 1
+
+        if found != len(eventDict):  # keys other than the standard keys
+            for key in list(eventDict.keys()):
+                if key not in _EVENT_BIT:
+                    extra[key] = eventDict[key]
+        if extra:
+            self._extra[i] = extra
+        if present != _EVENT_BITS_ALL:
+            self._missingBits |= ~present & _EVENT_BITS_ALL
+        self._present.append(present)
+        self._intMask.append(intMask)
+        self._intBits |= intMask
+
+    def clear(self):
+        self._clearColumns()
+
+    def __len__(self):
+        return len(self._present)
+
+    def keys(self):
+        return list(range(0, len(self._present)))
+
+    def __getitem__(self, key):
+        """numbers are index keys, return an event view at this location"""
+        if isinstance(key, slice):
+            return [_EventView(self, i) for i in range(*key.indices(len(self)))]
+        return _EventView(self, self._index(key))
+
+    def __setitem__(self, key, value):
+        i = self._index(key)
+        if isinstance(value, _EventView):
+            value = value.copy()  # value may be a view of this event
+        for oldKey in self._getKeys(i):
+            self._delValue(i, oldKey)
+        for newKey in list(value.keys()):
+            self._setValue(i, newKey, value[newKey])
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            remove = set(range(*key.indices(len(self))))
+        else:
+            remove = set([self._index(key)])
+        self._reorder([i for i in range(len(self)) if i not in remove])
+
+    def copy(self):
+        esObj = EventSequenceColumnar()
+        for name, value in list(self.__dict__.items()):
+            if name in ("_numeric", "_sharedIds"):  # dictionaries of arrays
+                value = dict([(key, col[:]) for key, col in value.items()])
+            elif isinstance(value, array.array):
+                value = value[:]
+            elif name == "_sharedTable":  # contents are immutable
+                value = value[:]
+            elif name == "_sharedIndex":
+                value = value.copy()
+            else:
+                value = copy.deepcopy(value)
+            setattr(esObj, name, value)
+        return esObj
+
+    def _own(self):
+        pass  # columns are never shared
+
+    def snapshot(self):
+        """columns are cheap to copy, so a snapshot is a copy"""
+        return self.copy()
+
+    def byteCount(self):
+        """return an estimate of the memory, in bytes, held by columns"""
+        arrays = [self._present, self._intMask, self._auxStart, self._auxLen]
+        arrays = arrays + [self._auxData, self._auxKind]
+        arrays = arrays + list(self._numeric.values())
+        arrays = arrays + list(self._sharedIds.values())
+        count = 0
+        for col in arrays:
+            count = count + len(col) * col.itemsize
+        for value in self._sharedTable:
+            count = count + sys.getsizeof(value)
+        return count + sys.getsizeof(self._auxObjects) + sys.getsizeof(self._extra)
+
+    def sort(self):
+        """sort the event list in place according to time values;
+        events with equal times retain their order"""
+        tArray = self.getArray("time")
+        order = sorted(range(len(tArray)), key=tArray.__getitem__)
+        if order != list(range(len(tArray))):  # scores are often in order
+            self._reorder(order)
+
+    def _insertOrdered(self, events, order):
+        """add events, a list of event dictionaries; order gives the final
+        position of each event, indexed as existing events followed by events"""
+        for eventDict in events:
+            self.append(eventDict)
+        if order != list(range(len(order))):
+            self._reorder(order)
+
+    def window(self, tStart, tEnd):
+        """remove all events that do not start in the time window from
+        tStart up to tEnd"""
+        tArray = self.getArray("time")
+        order = [i for i in range(len(tArray)) if tStart <= tArray[i] < tEnd]
+        if len(order) != len(tArray):
+            self._reorder(order)
+
+    # -----------------------------------------------------------------------||--
+    # data access and loading
+
+    def _getEventList(self):
+        return _EventViewList(self)
+
+    def _setEventList(self, eventList):
+        # used by EventSequence methods that assign a new list of events
+        self._clearColumns()
+        for eventDict in eventList:
+            self.append(eventDict)
+
+    _eventList = property(_getEventList, _setEventList)
+
+    def list(self):
+        """return a sequence of event views; views read from and write to
+        this object; only used for translations"""
+        return _EventViewList(self)
+
+    def getArray(self, name):
+        """get a copy of all values from the event list as an array"""
+        bit = _EVENT_BIT.get(name, 0)
+        if self._missingBits & bit or not bit:
+            return [self._getValue(i, name) for i in range(len(self))]
+        if name in self._numeric:
+            data = self._numeric[name].tolist()
+            if self._intBits & bit:
+                for i, mask in enumerate(self._intMask):
+                    if mask & bit:
+                        data[i] = int(data[i])
+            return data
+        elif name == "aux":
+            if self._auxObjects or _AUX_INT in self._auxKind:
+                return [self._getAux(i) for i in range(len(self))]
+            flat = self._auxData.tolist()
+            return [
+                flat[start : start + length]
+                for start, length in zip(self._auxStart, self._auxLen)
+            ]
+        table = self._sharedTable
+        if name == "pulse":
+            return [table[j] for j in self._sharedIds[name]]
+        return [list(table[j]) for j in self._sharedIds[name]]
+
+    def setArray(self, name, data):
+        """load all values from the event list as an array"""
+        assert len(data) == len(self)
+        if name in self._numeric and not self._extra and not self._missingBits:
+            valueTypes = set([type(value) for value in data])
+            if valueTypes == set([float]):  # replace the column at once
+                bit = _EVENT_BIT[name]
+                self._numeric[name] = array.array("d", data)
+                if self._intBits & bit:
+                    for i, mask in enumerate(self._intMask):
+                        self._intMask[i] = mask & ~bit
+                return
+        for i in range(0, len(data)):
+            self._setValue(i, name, data[i])
+
+
 # -----------------------------------------------------------------||||||||||||--
 class EventSequenceSplit:
     """object for storing data for a texture, clone, or parameter
@@ -773,10 +1671,8 @@ class EventSequenceSplit:
                 continue
             self.splitScore[label] = []  # clear list, replace w/ new values
             pObj.reset()  # reset parameter object
-            if lib in ["genPmtrObjs"]:
-                for t in self.splitScore["time"]:  # run through time list
-                    # append data values
-                    self.splitScore[label].append(pObj(t, refDict))
+            if lib in ["genPmtrObjs"]:  # values for the whole time list
+                self.splitScore[label] = pObj.evaluate(self.splitScore["time"], refDict)
             elif lib in ["filterPmtrObjs"]:
                 # create a dummy fpRef dict array
                 refDictArray = [refDict] * self.nEvent
@@ -952,6 +1848,216 @@ class EventSequenceSplit:
             raise ValueError("unexpected src fmt")
 
 
+# -----------------------------------------------------------------||||||||||||--
+# parallel scoring: textures and their clones are scored in worker processes,
+# each with a random stream derived from a seed and the texture name
+
+
+def textureSeed(seed, tName, cName=None):
+    """return a random seed for a texture, or for one of its clones if
+    cName is given, derived from a project seed and the texture name;
+    the same on every platform and process
+
+    >>> textureSeed(0, 'a')
+    41315431
+    >>> textureSeed(0, 'a') == textureSeed(1, 'a')
+    False
+    >>> textureSeed(0, 'a') == textureSeed(0, 'a', 'b')
+    False
+    """
+    if cName == None:
+        key = "%s:%s" % (seed, tName)
+    else:
+        key = "%s:%s:%s" % (seed, tName, cName)
+    return int(hashlib.md5(key.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def _seedRandom(seed):
+    """seed all random generators used by parameter objects"""
+    random.seed(seed)
+    rand._the_same.seed(seed)
+
+
+def _scoreTexture(t, cNames, window=None):
+    """score a texture; if window is a start and end time and the texture
+    has no clones, only events in that window are scored; clones need the
+    complete score. return ok, and 1 if the score is partial"""
+    if window != None and cNames == []:
+        return t.score(window[0], window[1]), 1
+    return t.score(), 0
+
+
+# AthenaObject, seed, and window, set before forking worker processes
+_workerState = None
+
+
+def _scoreTextureWorker(tName):
+    """score a texture and its clones in a worker process; return score
+    data to be installed in the parent's objects, or None on failure"""
+    ao, seed, window = _workerState
+    t = ao.textureLib[tName]
+    _seedRandom(textureSeed(seed, tName))
+    ok, partial = _scoreTexture(t, ao.cloneLib.cNames(tName), window)
+    if not ok or (t.checkScore() == 0 and not partial):
+        return tName, None
+    refDict = t.getRefClone()
+    post = {"esObj": t.esObj, "timeRangeAbs": t.timeRangeAbs, "TC": {}}
+    post["refDict"] = refDict
+    esObjTexture = t.getScore()
+    for cName in ao.cloneLib.cNames(tName):
+        c = ao.cloneLib.get(tName, cName)
+        _seedRandom(textureSeed(seed, tName, cName))
+        if c.score(esObjTexture, refDict):
+            post["TC"][cName] = (c.esObj, c.timeRangeAbs)
+        else:
+            post["TC"][cName] = None
+    return tName, post
+
+
+def _scoreTexturesParallel(ao, tNames, workers, seed, window=None):
+    """score textures in worker processes; return a dictionary of texture
+    name to score data, or None if worker processes are not available"""
+    global _workerState
+    try:
+        import multiprocessing
+
+        context = multiprocessing.get_context("fork")
+    except (ImportError, AttributeError, ValueError):
+        return None  # no processes, or cannot share the AthenaObject
+    _workerState = (ao, seed, window)
+    try:
+        try:
+            pool = context.Pool(min(workers, len(tNames)))
+        except (OSError, NotImplementedError):
+            return None
+        try:
+            return dict(pool.map(_scoreTextureWorker, tNames, 1))
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _workerState = None
+
+
+# -----------------------------------------------------------------||||||||||||--
+# score caching: seeded scores are stored under a hash of everything that
+# determines them, so that unchanged textures and clones are not re-scored
+
+
+def _stableRepr(data):
+    """return a repr of data in which dictionaries are sorted by key
+
+    >>> _stableRepr({'b': [1, {'d': 2, 'c': 3}], 'a': (0,)})
+    "{'a': (0,), 'b': [1, {'c': 3, 'd': 2}]}"
+    """
+    if isinstance(data, dict):
+        parts = []
+        for key in sorted(data.keys(), key=repr):
+            parts.append("%r: %s" % (key, _stableRepr(data[key])))
+        return "{%s}" % ", ".join(parts)
+    elif isinstance(data, list):
+        return "[%s]" % ", ".join([_stableRepr(x) for x in data])
+    return repr(data)
+
+
+def textureScoreKey(tName, t, seed):
+    """return a hash of everything that determines a seeded texture score"""
+    data = [tName, t.tmName, t.pmtrQDict, t.temperamentName, t.pitchMode]
+    data = data + [t.auxNo, t.silenceMode, t.fpAudioDirs, seed]
+    if t.path != None:
+        data.append(t.path.writeDataModel())
+    return hashlib.md5(_stableRepr(data).encode("utf-8")).hexdigest()
+
+
+def cloneScoreKey(textureKey, cName, c):
+    """return a hash of everything that determines a seeded clone score,
+    given the key of its texture"""
+    data = [textureKey, cName, c.pmtrQDict, c.auxNo]
+    return hashlib.md5(_stableRepr(data).encode("utf-8")).hexdigest()
+
+
+class ScoreCache(object):
+    """a least-recently used store of texture and clone scores, limited by
+    the total number of events held; stores copy-on-write snapshots, so
+    that scores installed from the cache may be changed
+
+    >>> a = ScoreCache(3)
+    >>> esObj = EventSequence()
+    >>> esObj.append({'time': 0, 'dur': 1})
+    >>> esObj.append({'time': 1, 'dur': 1})
+    >>> a.put('x', esObj, (0, 2))
+    >>> a.get('x')[1], a.get('y')
+    ((0, 2), None)
+    >>> a.put('y', esObj, (0, 2))
+    >>> len(a), a.eventCount, a.get('x')
+    (1, 2, None)
+    >>> a.hits, a.misses
+    (1, 2)
+    """
+
+    def __init__(self, maxEvents=1000000):
+        self.maxEvents = maxEvents
+        # key to (esObj, timeRangeAbs, refDict, events, bytes)
+        self._entries = collections.OrderedDict()
+        self.eventCount = 0
+        self.byteCount = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """remove all scores and reset counts"""
+        self._entries.clear()
+        self.eventCount = 0
+        self.byteCount = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """return a snapshot of the stored score, its absolute time range,
+        and any stored reference dictionary, or None if not stored"""
+        if key not in self._entries:
+            self.misses = self.misses + 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits = self.hits + 1
+        esObj, timeRangeAbs, refDict, events, bytes = self._entries[key]
+        return esObj.snapshot(), timeRangeAbs, copy.deepcopy(refDict)
+
+    def put(self, key, esObj, timeRangeAbs, refDict=None):
+        """store a score; least recently used scores are removed until the
+        total number of events is not greater than maxEvents"""
+        if key in self._entries:
+            self._remove(key)
+        events = len(esObj)
+        if events > self.maxEvents:
+            return  # would remove all others, and still not fit
+        bytes = esObj.byteCount()
+        entry = (esObj.snapshot(), timeRangeAbs, copy.deepcopy(refDict), events, bytes)
+        self._entries[key] = entry
+        self.eventCount = self.eventCount + events
+        self.byteCount = self.byteCount + entry[4]
+        while self.eventCount > self.maxEvents:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self.eventCount = self.eventCount - entry[3]
+        self.byteCount = self.byteCount - entry[4]
+
+    def report(self):
+        """return a one-line description of cache use"""
+        return lang.msgELscoreCache % (
+            self.hits,
+            self.misses,
+            len(self._entries),
+            self.eventCount,
+            self.byteCount,
+        )
+
+
 # -----------------------------------------------------------------||||||||||||--
 class Performer(object):
     """used only by EventMode
@@ -998,6 +2104,15 @@ class Performer(object):
         self.polySeq[tName]["TC"] = {}
         self.scoreCount = self.scoreCount + 1  # only count if score successfull
 
+    def _packWindow(self, seqDict, window):
+        """remove events that are not in the window from a packed score;
+        a score w/o events is muted, as there is nothing to write"""
+        if window == None:
+            return
+        seqDict["esObj"].window(window[0], window[1])
+        if len(seqDict["esObj"]) == 0:
+            seqDict["mute"] = 1
+
     def _packClone(self, tName, cName, c):
         """store clone data, encluding an eventList, in a dictionary
         stored as part of clone's parent texture
@@ -1009,25 +2124,29 @@ class Performer(object):
 
     # note: textures and clones already may have scores;
     # refreshing the scores here makes sense, but may not always be necessary
-    def flattenSome(self, objList, refresh=1):
+    def flattenSome(self, objList, refresh=1, window=None):
         """flatten reads and scores textures into a polySeq data dict
         score a polySeq, but only for objects that are in the list
-        objects must be textures; clones cannot be scored this way"""
+        objects must be textures; clones cannot be scored this way
+        if window is a start and end time, only events that start in that
+        time window are included"""
         self.reset()
         # use number as tName
         for i in range(0, len(objList)):
             tName = str(i)
             t = objList[i]
+            jobTools.checkpoint("texture", t.name)
             # inst = t.getInst()
             # if inst not in self.instList: self.instList.append(inst)
             if refresh:
-                ok = t.score()  # returns -1 if score fails
-                if not ok or t.checkScore() == 0:
+                ok, partial = _scoreTexture(t, [], window)
+                if not ok or (t.checkScore() == 0 and not partial):
                     print(_MOD, "texture failed to score", tName)
                     continue
             self._packTexture(tName, t)
+            self._packWindow(self.polySeq[tName], window)
 
-    def flattenAll(self, ao, refresh=1):
+    def flattenAll(self, ao, refresh=1, workers=0, seed=0, window=None):
         """flatten reads and scores textures into a polySeq data dict
         generate a flat score, stored in polySeq, for all textures + clones
         in the athenaObject
@@ -1037,34 +2156,180 @@ class Performer(object):
         w/ each textures .score() method.
         must get scores for all texture and clones, even if muted
             a texture can be muted while a clone is not, so all data must be gen
+
+        if workers is 0, textures are scored in order, sharing the random
+        generators. otherwise, each texture and each clone is scored w/ a
+        random stream derived from seed and its name; if workers is greater
+        than 1, textures are scored in that many worker processes. results
+        do not depend on the number of workers. these seeded scores are
+        stored in the AthenaObject's score cache: textures and clones that
+        have not changed since a previous call are not scored again
+
+        if a command is run as a job, a jobTools checkpoint is reached before
+        each texture and each clone is scored
+
+        if window is a start and end time, only events that start in that
+        time window are included. textures w/o clones score only events in
+        the window; as clones transform complete texture scores, textures
+        w/ clones are scored completely. partial scores are not stored in
+        the score cache, though stored scores are used
         """
         textureLib = ao.textureLib
         cloneLib = ao.cloneLib
         self.reset()
-        for tName in list(textureLib.keys()):
+        tNames = list(textureLib.keys())
+        cache = None
+        if refresh and workers > 0:
+            cache = ao.scoreCache
+        cached = {}  # texture name to cache key and cached score, if found
+        if cache != None:
+            for tName in tNames:
+                key = textureScoreKey(tName, textureLib[tName], seed)
+                cached[tName] = key, cache.get(key)
+        tNamesScore = [n for n in tNames if cached.get(n, (None, None))[1] == None]
+        scoreData = None
+        if refresh and workers > 1 and len(tNamesScore) > 1:
+            # None if worker processes are not available on this platform
+            scoreData = _scoreTexturesParallel(ao, tNamesScore, workers, seed, window)
+        for tName in tNames:
+            jobTools.checkpoint("texture", tName)
             t = textureLib[tName]
             # inst = t.getInst()
             # if inst not in self.instList: self.instList.append(inst)
             # must always score, even if muted, so clone can be generated
-            if refresh:
-                ok = t.score()  # returns -1 if score fails
-                if not ok or t.checkScore() == 0:
+            key, entry = cached.get(tName, (None, None))
+            post = None
+            refDict = None
+            partial = window != None and cloneLib.cNames(tName) == []
+            if entry != None:  # unchanged since stored
+                t.esObj, t.timeRangeAbs, refDict = entry
+            elif scoreData != None:  # install scores from workers
+                post = scoreData[tName]
+                if post == None:
+                    print(_MOD, "texture failed to score", tName)
+                    continue
+                t.esObj, t.timeRangeAbs = post["esObj"], post["timeRangeAbs"]
+                refDict = post["refDict"]
+            elif refresh:
+                if workers > 0:
+                    _seedRandom(textureSeed(seed, tName))
+                ok, partial = _scoreTexture(t, cloneLib.cNames(tName), window)
+                if not ok or (t.checkScore() == 0 and not partial):
                     print(_MOD, "texture failed to score", tName)
                     continue
-            self._packTexture(tName, t)
             # get necessary inputs for clones
-            refDict = t.getRefClone()
+            if refDict == None:
+                refDict = t.getRefClone()
+            if key != None and entry == None and not partial:
+                cache.put(key, t.esObj, t.timeRangeAbs, refDict)
+            self._packTexture(tName, t)
             esObjTexture = self.polySeq[tName]["esObj"]
             for cName in cloneLib.cNames(tName):
+                jobTools.checkpoint("clone", "%s.%s" % (tName, cName))
                 c = cloneLib.get(tName, cName)
+                cKey = None
+                cEntry = None
+                if key != None:
+                    cKey = cloneScoreKey(key, cName, c)
+                    cEntry = cache.get(cKey)
                 # create a clone score w/ esObj from texture
                 # a copy will be made w/n the cone
-                if refresh:
+                if cEntry != None:
+                    c.esObj, c.timeRangeAbs, ignore = cEntry
+                elif post != None:
+                    if post["TC"][cName] == None:
+                        print(_MOD, "clone failed to score", tName, cName)
+                        continue
+                    c.esObj, c.timeRangeAbs = post["TC"][cName]
+                elif refresh:
+                    if workers > 0:
+                        _seedRandom(textureSeed(seed, tName, cName))
                     ok = c.score(esObjTexture, refDict)
                     if not ok:
                         print(_MOD, "clone failed to score", tName, cName)
                         continue
+                if cKey != None and cEntry == None:
+                    cache.put(cKey, c.esObj, c.timeRangeAbs)
                 self._packClone(tName, cName, c)
+                self._packWindow(self.polySeq[tName]["TC"][cName], window)
+            # clones are scored from the complete texture score
+            self._packWindow(self.polySeq[tName], window)
+
+
+# -----------------------------------------------------------------||||||||||||--
+# number of events formatted together when writing a csound score
+_SCORE_BLOCK = 1024
+# maximum number of formatted values stored by each score column formatter
+_SCORE_MEMO = 65536
+
+
+def _strValue(value, ljust=8, sigDig=6, prefix="", postfix=" "):
+    """given a value, prepare appropriate string version,
+    w/ default space at end (only needed w/ csound scores)
+    float and int values, the most common, are tested first
+
+    >>> _strValue(0.12345678, 10)
+    '0.123457   '
+    >>> _strValue(3.7, 4, 0, 'i'), _strValue('x', 2, postfix='')
+    ('i4    ', 'x ')
+    """
+    kind = type(value)
+    if kind is int:
+        return prefix + str(value).ljust(ljust) + postfix
+    elif kind is not float:
+        if drawer.isStr(value):
+            return "%s%s%s" % (prefix, value.ljust(ljust), postfix)
+        elif drawer.isInt(value):
+            return "%s%s%s" % (prefix, str(value).ljust(ljust), postfix)
+    # assume is is a float
+    val = round(value, sigDig)
+    if sigDig == 0:
+        val = int(val)  # convert
+    return prefix + str(val).ljust(ljust) + postfix
+
+
+def _strColumnFunc(ljust=8, sigDig=6, prefix="", postfix=" ", postMap=None):
+    """return a function that, given a list of values, returns a list of
+    the strings _strValue returns with these arguments; if given, postMap
+    is called on each value first; used to format columns of score values
+
+    >>> a = _strColumnFunc(10, 6)
+    >>> a([0.12345678, 3, 'x'])
+    ['0.123457   ', '3          ', 'x          ']
+    >>> _strColumnFunc(4, 1, 'i', postMap=lambda x: x * 2)([3, -0.0])
+    ['i6    ', 'i-0.0 ']
+    """
+
+    def strValue(value):
+        if postMap != None:
+            value = postMap(value)
+        return _strValue(value, ljust, sigDig, prefix, postfix)
+
+    # strings of float and int values already formatted, as score columns
+    # often repeat values; zero is not stored, as -0.0 == 0.0
+    floatStr = {}
+    intStr = {}
+
+    def strColumn(values):
+        post = []
+        for value in values:
+            kind = type(value)
+            if kind is float:
+                memo = floatStr
+            elif kind is int:
+                memo = intStr
+            else:
+                post.append(strValue(value))
+                continue
+            valueStr = memo.get(value)
+            if valueStr is None:
+                valueStr = strValue(value)
+                if value and len(memo) < _SCORE_MEMO:
+                    memo[value] = valueStr
+            post.append(valueStr)
+        return post
+
+    return strColumn
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -1124,6 +2389,7 @@ class _OutputEngine:
         # define orc sources tt are incompat w/ this engine
         self.orcIncompat = []
         self.orcObj = None  # define name of orc used in converting mix vals
+        self.orcSrcStr = None  # orchestra source, for file based orchestras
         # output data
         self.outComplete = []  # outpout formats that were written
         self.outRequest = []  # called with write operations
@@ -1294,18 +2560,11 @@ class _OutputEngine:
 
     def _fmtComment(self, commentList, delimit=";"):
         commentStr = []
-        commentStr.append(" %s" % delimit)
-        for cmtPos in range(0, len(commentList)):
-            cmtData = commentList[cmtPos]
-            if drawer.isNum(cmtData):
-                cmtData = round(commentList[cmtPos], 4)
-            cmtStr = str(cmtData)
-            cmtStr = cmtStr.rjust(len(cmtStr) + 1)
-            commentStr.append(cmtStr)
-            if cmtPos != len(commentList) - 1:
-                commentStr.append(":")
-        commentStr.append("\n")
-        return "".join(commentStr)
+        for cmtData in commentList:
+            if isinstance(cmtData, (float, int)):
+                cmtData = round(cmtData, 4)
+            commentStr.append(" " + str(cmtData))
+        return " %s%s\n" % (delimit, ":".join(commentStr))
 
     def _fmtHeadTexture(self, className, tName, prepend=""):
         return "%s TM(%s), TI(%s)\n" % (prepend, className, tName)
@@ -1324,15 +2583,7 @@ class _OutputEngine:
     def _strValue(self, value, ljust=8, sigDig=6, prefix="", postfix=" "):
         """given a value, prepare appropriate string version,
         w/ default space at end (only needed w/ csound scores)"""
-        if drawer.isStr(value):
-            return "%s%s%s" % (prefix, value.ljust(ljust), postfix)
-        elif drawer.isInt(value):
-            return "%s%s%s" % (prefix, str(value).ljust(ljust), postfix)
-        else:  # assume is is a float
-            val = round(value, sigDig)
-            if sigDig == 0:
-                val = int(val)  # convert
-            return "%s%s%s" % (prefix, str(val).ljust(ljust), postfix)
+        return _strValue(value, ljust, sigDig, prefix, postfix)
 
     def _strLabel(self, orderList, delimit=" ", prefix=""):
         """previde an event to sample, and return a key string
@@ -1364,15 +2615,84 @@ class _OutputEngine:
                 label.append(key)
         return "%s%s\n" % (prefix, delimit.join(label))
 
+    def _iterPolyStr(self, translator, prepend="", *args):
+        """yield strings for each compatible texture and clone that is not
+        muted: a header, then all strings yielded by translator, called
+        with the orcMapMode, the esObj, and any further args
+
+        strings are produced one event at a time, so that a score can be
+        written to a file without building the complete score in memory
+
+        only the translated output is streamed: the events are read from the
+        polySeq, which holds every scored event of every texture and clone,
+        as clones process complete scores and all engines share the polySeq.
+        peak memory is that of the polySeq, not of the polySeq and the output
+        """
+        for tName in self.compatNames:
+            tDict = self.polySeq[tName]
+            orcMapMode = tDict["orcMapMode"]
+            className = tDict["className"]
+            if not tDict["mute"]:
+                yield self._fmtHeadTexture(className, tName, prepend)
+                for msg in translator(orcMapMode, tDict["esObj"], *args):
+                    yield msg
+            for cName in list(tDict["TC"].keys()):
+                if not tDict["TC"][cName]["mute"]:
+                    yield self._fmtHeadClone(className, tName, cName, prepend)
+                    esObj = tDict["TC"][cName]["esObj"]
+                    for msg in translator(orcMapMode, esObj, *args):
+                        yield msg
+
     # -----------------------------------------------------------------------||--
     # covnert single eventList into necessary data structures, lists or strings
 
-    def _translateCsoundExternalStr(self, orcMapMode, esObj):
+    def _iterScoStr(self, esObj, columns, auxStr=None):
+        """yield csound score i-statements for all events of esObj that are
+        not rests, formatted in blocks of events
+
+        columns is a list of (name, func) pairs: name is an event key, or an
+        int for a single aux value, and func is a function from
+        _strColumnFunc; if auxStr is given, all aux values are formatted
+        with it after the columns; each statement ends with the event comment
+        """
+        acc = esObj.getArray("acc")
+        aux = esObj.getArray("aux")
+        comment = esObj.getArray("comment")
+        arrays = {}
+        for name, func in columns:
+            if not drawer.isInt(name) and name not in arrays:
+                arrays[name] = esObj.getArray(name)
+        for start in range(0, len(acc), _SCORE_BLOCK):
+            # do not write rests
+            index = [
+                i for i in range(start, min(start + _SCORE_BLOCK, len(acc))) if acc[i]
+            ]
+            parts = []
+            for name, func in columns:
+                if drawer.isInt(name):
+                    parts.append(func([aux[i][name] for i in index]))
+                else:
+                    data = arrays[name]
+                    parts.append(func([data[i] for i in index]))
+            if auxStr != None:
+                # format all aux values of the block together
+                auxFlat = auxStr([v for i in index for v in aux[i]])
+                auxLines = []
+                pos = 0
+                for i in index:
+                    auxLines.append("".join(auxFlat[pos : pos + len(aux[i])]))
+                    pos += len(aux[i])
+                parts.append(auxLines)
+            parts.append([self._fmtComment(comment[i]) for i in index])
+            yield "".join(["".join(line) for line in zip(*parts)])
+
+    def _iterCsoundExternalStr(self, orcMapMode, esObj):
         """exclude built in args for amp, ps, pan
         if a user needs pitch information from path
         can be obtained by using pathRead parameter object on an aux
         orcMapMode not really needed here, as ps/amp/pan not used in
         external score
+        yields a label, then score lines in blocks of events
         """
         el = esObj.list()  # get event list
         orderList = [
@@ -1382,57 +2702,44 @@ class _OutputEngine:
         ]
         for i in range(0, len(el[0]["aux"])):  # just get first event
             orderList.append(i)
-        label = self._strLabel(orderList, " ", ";")
-        msg = []
-        for event in el:
-            if event["acc"] == 0:
-                continue  # do not write rests
-            msg.append(self._strValue(event["inst"], 4, 1, "i"))
-            msg.append(self._strValue(event["time"], 12, 8))
-            msg.append(self._strValue(event["sus"], 12, 8))
-            # skip all default perameters, go straight to aux
-            for i in range(0, len(event["aux"])):
-                msg.append(self._strValue(event["aux"][i], 10, 6))
-            msg.append(self._fmtComment(event["comment"]))
-        return "".join(msg), label  # returns string
+        yield self._strLabel(orderList, " ", ";")
+        columns = [
+            ("inst", _strColumnFunc(4, 1, "i")),
+            ("time", _strColumnFunc(12, 8)),
+            ("sus", _strColumnFunc(12, 8)),
+        ]
+        # skip all default perameters, go straight to aux
+        for msg in self._iterScoStr(esObj, columns, _strColumnFunc(10, 6)):
+            yield msg
 
-    def _translateCsoundNativeStr(self, orcMapMode, esObj):
+    def _iterCsoundNativeStr(self, orcMapMode, esObj):
         """convert single texture or clone event sequence object
-        to the apropriate string"""
+        to the apropriate strings: yields a label, then score lines
+        in blocks of events"""
         el = esObj.list()  # get event list
         orderList = ["inst", "time", "sus", "amp", "ps", "pan"]
         for i in range(0, len(el[0]["aux"])):  # just get first event
             orderList.append(i)
-        label = self._strLabel(orderList, " ", ";")
+        yield self._strLabel(orderList, " ", ";")
         inst = el[0]["inst"]  # get inst from first event
-        msg = []
-        for event in el:
-            if event["acc"] == 0:
-                continue  # do not write rests
-            msg.append(self._strValue(event["inst"], 4, 1, "i"))
-            msg.append(self._strValue(event["time"], 12, 8))
-            msg.append(self._strValue(event["sus"], 12, 8))
-
-            val = self.orcObj.postMap(inst, "amp", event["amp"], orcMapMode)
-            msg.append(self._strValue(val, 10, 6))
-
-            val = self.orcObj.postMap(inst, "ps", event["ps"], orcMapMode)
-            msg.append(self._strValue(val, 10, 6))
-
-            val = self.orcObj.postMap(inst, "pan", event["pan"], orcMapMode)
-            msg.append(self._strValue(val, 10, 6))
-
-            for i in range(0, len(event["aux"])):
-                msg.append(self._strValue(event["aux"][i], 10, 6))
-            msg.append(self._fmtComment(event["comment"]))
-        return "".join(msg), label  # returns string
+        columns = [
+            ("inst", _strColumnFunc(4, 1, "i")),
+            ("time", _strColumnFunc(12, 8)),
+            ("sus", _strColumnFunc(12, 8)),
+        ]
+        for pmtr in ("amp", "ps", "pan"):
+            postMap = self.orcObj.postMapFunc(inst, pmtr, orcMapMode)
+            columns.append((pmtr, _strColumnFunc(10, 6, postMap=postMap)))
+        for msg in self._iterScoStr(esObj, columns, _strColumnFunc(10, 6)):
+            yield msg
 
-    def _translateCsoundSilenceStr(self, orcMapMode, esObj):
+    def _iterCsoundSilenceStr(self, orcMapMode, esObj):
         """
         p1 instrument / p2 time (seconds) / p3 duration (seconds)
         p4 MIDI key (can be a fraction) / p5 MIDI velocity / p6 phase
         p7 x (pan) / p8 y (depth) / p9 z (height)
         p10 pitch-class set (sum of pitch-classes as powers of 2), optional
+        yields a label, then score lines in blocks of events
         """
         # need to check if pitch and pan are in the appropriate
         # data format
@@ -1449,39 +2756,30 @@ class _OutputEngine:
             "panZ",
             "mason",
         ]
-        label = self._strLabel(orderList, " ", ";")
+        yield self._strLabel(orderList, " ", ";")
         inst = el[0]["inst"]  # get inst from first event
-        msg = []
         for event in el:
-            if event["acc"] == 0:
-                continue  # do not write rests
-            assert len(event) == 11  # req length for csoundSilence
-            i = self._strValue(event["inst"], 4, 1, "i")
-            start = self._strValue(event["time"], 12, 8)
-            sus = self._strValue(event["sus"], 12, 8)
-
-            val = self.orcObj.postMap(inst, "amp", event["amp"], orcMapMode)
-            amp = self._strValue(val, 8, 6)
-
-            val = self.orcObj.postMap(inst, "ps", event["ps"], orcMapMode)
-            midiNote = self._strValue(val, 8, 6)
-
-            val = self.orcObj.postMap(inst, "pan", event["pan"], orcMapMode)
-            panX = self._strValue(val, 8, 6, "", " ")
-
-            # parameters for silence; there must be 4 aux values
-            phase = self._strValue(event["aux"][0], 8, 6)
-            panY = self._strValue(event["aux"][1], 8, 6)
-            panZ = self._strValue(event["aux"][2], 8, 6)
-            mason = self._strValue(event["aux"][3], 6, 6)
-            cmt = self._fmtComment(event["comment"])
-            msg.append(
-                "".join(
-                    [i, start, sus, midiNote, amp, phase, panX, panY, panZ, mason, cmt]
-                )
-            )
-        msg.append("\n")
-        return "".join(msg), label  # returns string
+            # req length for csoundSilence; rests are not written
+            assert event["acc"] == 0 or len(event) == 11
+        postMap = {}
+        for pmtr in ("amp", "ps", "pan"):
+            postMap[pmtr] = self.orcObj.postMapFunc(inst, pmtr, orcMapMode)
+        # parameters for silence; there must be 4 aux values
+        columns = [
+            ("inst", _strColumnFunc(4, 1, "i")),
+            ("time", _strColumnFunc(12, 8)),
+            ("sus", _strColumnFunc(12, 8)),
+            ("ps", _strColumnFunc(8, 6, postMap=postMap["ps"])),
+            ("amp", _strColumnFunc(8, 6, postMap=postMap["amp"])),
+            (0, _strColumnFunc(8, 6)),
+            ("pan", _strColumnFunc(8, 6, postMap=postMap["pan"])),
+            (1, _strColumnFunc(8, 6)),
+            (2, _strColumnFunc(8, 6)),
+            (3, _strColumnFunc(6, 6)),
+        ]
+        for msg in self._iterScoStr(esObj, columns):
+            yield msg
+        yield "\n"
 
     def _translateSuperColliderNativeStr(self, orcMapMode, esObj):
         """ """
@@ -1514,12 +2812,11 @@ class _OutputEngine:
         return "".join(msg), label  # returns string
 
     # -----------------------------------------------------------------------||--
-    def _translateMidiList(self, orcMapMode, esObj):
-        """mid list is a short list of data
+    def _iterMidiList(self, orcMapMode, esObj):
+        """yield a short tuple of data for each event
         consists only of tStart, sus, midiVel, midiPs, midiPan"""
         el = esObj.list()  # get event list
         inst = el[0]["inst"]  # get inst from first event
-        midiList = []
         for event in el:
             if event["acc"] == 0:
                 continue  # do not write rests
@@ -1528,8 +2825,7 @@ class _OutputEngine:
             midiVel = self.orcObj.postMap(inst, "amp", event["amp"], orcMapMode)
             midiPs = self.orcObj.postMap(inst, "ps", event["ps"], orcMapMode)
             midiPan = self.orcObj.postMap(inst, "pan", event["pan"], orcMapMode)
-            midiList.append((tStart, sus, midiVel, midiPs, midiPan))
-        return midiList
+            yield (tStart, sus, midiVel, midiPs, midiPan)
 
     def _translateAcToolbox(self, orcMapMode, esObj, ch=0, pgm=0):
         """channel may be None; must provide default (0)
@@ -1610,19 +2906,19 @@ class _OutputEngine:
     #         return intList
 
     # -----------------------------------------------------------------------||--
-    def _translateTextDelimitStr(self, orcMapMode, esObj, delimit="\t"):
+    def _iterTextDelimitStr(self, orcMapMode, esObj, delimit="\t"):
         """used for creating both a plain text file and a tab delimitted
-        file"""
+        file; yields a label, then one line for each event"""
         el = esObj.list()  # get event list
         orderList = ["inst", "time", "sus", "amp", "midiNote", "pan"]
         for i in range(0, len(el[0]["aux"])):  # just get first event
             orderList.append(i)
-        label = self._strLabel(orderList, delimit)
+        yield self._strLabel(orderList, delimit)
         inst = el[0]["inst"]  # get inst from first event
-        msg = []
         for event in el:  # set all ljust to 0
             if event["acc"] == 0:
                 continue  # do not write rests
+            msg = []
             msg.append(self._strValue(event["inst"], 0, 1, "", delimit))
             msg.append(self._strValue(event["time"], 0, 8, "", delimit))
             msg.append(self._strValue(event["sus"], 0, 8, "", delimit))
@@ -1641,7 +2937,7 @@ class _OutputEngine:
                 msg.append(self._strValue(event["aux"][i], 0, 6, "", delimit))
             # comment has return carriage
             msg.append(self._fmtComment(event["comment"], "comment:"))
-        return "".join(msg), label
+            yield "".join(msg)
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -1665,29 +2961,23 @@ class EngineAudioFile(_OutputEngine):
         """takes an audioMixObject and adds samples to it;
         progressive mixes layerd textures upon each other
 
-        xList shoudl use an array
+        amp values are provided as a generator, and mixed in blocks
         audioFile uses the 'generic' orchestra (base-class) to force
             values (from the event list) to stay between zero and one
         """
-        el = esObj.list()  # get event list
-
-        # start = el[0]['time'] # get start from first event
         # presently, writes all textures and clones at the same location
         # should find a method to localize position relative to frames
         pos = 0  # insert position at zero for now
 
-        xList = []  # presently have to provide data as a list
-        for event in el:  # set all ljust to 0
-            # must right silent events; this used ot be active
-            # if event['acc'] == 0: continue
-
-            # limit values b/n 0 and 1 w/ "generic" orcestra
-            val = self.orcObj.postMap(1, "amp", event["amp"], orcMapMode)
-            xList.append(val)  # get amp values
-        # provide a position, a unit list to mix in, and a method
-        # this will replace all datall
-
-        audioMixObj.insertMix(pos, xList, method)
+        # must right silent events; this used ot be active
+        # if event['acc'] == 0: continue
+        # limit values b/n 0 and 1 w/ "generic" orcestra
+        xIter = (
+            self.orcObj.postMap(1, "amp", event["amp"], orcMapMode)
+            for event in esObj.list()
+        )
+        # provide a position, unit values to mix in, and a method
+        audioMixObj.insertMix(pos, xIter, method)
         # audioMixObj.insertMixUnit(framePos, xList, method)
         return audioMixObj
 
@@ -1795,7 +3085,7 @@ class EngineSuperColliderTask(_OutputEngine):
     def _writeScScd(self):
         """write a csd file given sco and orc strings
         must be done after calling self.translate()
-        and after creating orc srcStr
+        and after creating orc source
         uses score in self.polySeqStr
         """
         msg = []
@@ -1805,7 +3095,7 @@ s = Server.local;
 s.boot;
 """
         )
-        msg.append(self.orcObj.srcStr)
+        msg.append(self.orcSrcStr)
         msg.append(self.polySeqStr)
         msg.append(") // end main")
 
@@ -1817,9 +3107,11 @@ s.boot;
     def _write(self):
         """translate and write all files"""
         self._translatePoly()
-        # update orcObj.srcStr
+        # orchestra source for compatible instruments
         # instList may have instruments not compatiable with this orchestra?
-        self.orcObj.constructOrc(self.fpRef["audioChannels"], self.compatInsts)
+        self.orcSrcStr = self.orcObj.constructOrc(
+            self.fpRef["audioChannels"], self.compatInsts
+        )
         self._writeScScd()
 
     def _writePost(self):
@@ -1857,7 +3149,6 @@ class EngineCsoundNative(_OutputEngine):
         # min out should be score, orc, bat; csd is an option
         self.outMin = ["csoundOrchestra", "csoundScore", "csoundBatch"]
         # outComplete, pathComplete defined in parent
-        self.polySeqStr = None  # score as single, format specific string
 
     def _genCommandStr(self, csd=1):
         """creates a .bat string, and a plain list of render options
@@ -1917,11 +3208,10 @@ class EngineCsoundNative(_OutputEngine):
 
     def _writeCsd(self):
         """write a csd file given sco and orc strings
-        must be done after calling self.translate()
-        and after creating orc srcStr
-        uses score in self.polySeqStr
+        must be done after creating orc source
+        the score is written as translated from self.polySeq
         """
-        if self.orcObj.srcStr == None:
+        if self.orcSrcStr == None:
             raise Exception("orchestra object has no src str")
 
         batStr, csdOptions = self._genCommandStr(1)  # 1 expects a csd string
@@ -1932,57 +3222,41 @@ class EngineCsoundNative(_OutputEngine):
         optStr = "<CsOptions>\n" + csdOptions + "\n\n" + "</CsOptions>\n"
         msg.append(optStr)
         msg.append(
-            "%s\n%s%s\n\n" % ("<CsInstruments>", self.orcObj.srcStr, "</CsInstruments>")
+            "%s\n%s%s\n\n" % ("<CsInstruments>", self.orcSrcStr, "</CsInstruments>")
         )
-        msg.append("%s\n%s%s\n\n" % ("<CsScore>", self.polySeqStr, "</CsScore>"))
-        msg.append("</CsoundSynthesizer>\n")
+        msg.append("<CsScore>\n")
 
         f = open(self._outFormatToFilePath("csoundData"), "w")
         f.writelines(msg)
+        f.writelines(self._translatePoly())
+        f.write("</CsScore>\n\n</CsoundSynthesizer>\n")
         f.close()
         self.outComplete.append("csoundData")
 
     # -----------------------------------------------------------------------||--
     def _translatePoly(self):
-        """set self.polySeqStr w/ complet orc from self.polySeq"""
-        msg = []
+        """yield the complete score from self.polySeq, one event at a time"""
         # may pass instrument list here to get only fTables
         # for specific instruments
         headStr = self.orcObj.getScoFtables()
-        msg.append(self._fmtHeadSco(headStr, ";"))
-        for tName in self.compatNames:
-            tDict = self.polySeq[tName]
-            orcMapMode = tDict["orcMapMode"]
-            className = tDict["className"]
-            if not tDict["mute"]:
-                msg.append(self._fmtHeadTexture(className, tName, ";"))
-                esObj = tDict["esObj"]
-                data, label = self._translateCsoundNativeStr(orcMapMode, esObj)
-                msg.append(label)
-                msg.append(data)
-            for cName in self.polySeq[tName]["TC"]:
-                if not tDict["TC"][cName]["mute"]:
-                    msg.append(self._fmtHeadClone(className, tName, cName, ";"))
-                    esObj = tDict["TC"][cName]["esObj"]
-                    data, label = self._translateCsoundNativeStr(orcMapMode, esObj)
-                    msg.append(label)
-                    msg.append(data)
-        self.polySeqStr = "".join(msg)
+        yield self._fmtHeadSco(headStr, ";")
+        for msg in self._iterPolyStr(self._iterCsoundNativeStr, ";"):
+            yield msg
 
     def _writeSco(self):
         outFormatObj = self.emObj.outFormatObjects["csoundScore"]
         f = open(self.fpRef[outFormatObj.emKey], "w")
-        f.write(self.polySeqStr)
+        f.writelines(self._translatePoly())
         f.close()
         self.outComplete.append("csoundScore")
 
     def _writeOrc(self):
         """write orchestra already constructed in _write Method"""
-        if self.orcObj.srcStr == None:
+        if self.orcSrcStr == None:
             raise Exception("orchestra object has no source string")
         outFormatObj = self.emObj.outFormatObjects["csoundOrchestra"]
         f = open(self.fpRef[outFormatObj.emKey], "w")
-        f.write(self.orcObj.srcStr)
+        f.write(self.orcSrcStr)
         f.close()
         self.outComplete.append("csoundOrchestra")
 
@@ -1999,10 +3273,11 @@ class EngineCsoundNative(_OutputEngine):
 
     def _write(self):
         """translate and write all files"""
-        self._translatePoly()
-        # update orcObj.srcStr
+        # orchestra source for compatible instruments
         # instList may have instruments not compatiable with this orchestra?
-        self.orcObj.constructOrc(self.fpRef["audioChannels"], self.compatInsts)
+        self.orcSrcStr = self.orcObj.constructOrc(
+            self.fpRef["audioChannels"], self.compatInsts
+        )
         if "csoundBatch" in self.outRequest:
             if "csoundData" in self.outRequest:
                 self._writeBat(1)
@@ -2046,33 +3321,15 @@ class EngineCsoundExternal(_OutputEngine):
         self.outMin = ["csoundScore"]
 
     def _translatePoly(self):
-        """set self.polySeqStr w/ complet orc from self.polySeq"""
-        msg = []
-        msg.append(self._fmtHeadSco("", ";"))
-        for tName in self.compatNames:
-            tDict = self.polySeq[tName]
-            orcMapMode = tDict["orcMapMode"]
-            className = tDict["className"]
-            if not tDict["mute"]:
-                msg.append(self._fmtHeadTexture(className, tName, ";"))
-                esObj = tDict["esObj"]
-                data, label = self._translateCsoundExternalStr(orcMapMode, esObj)
-                msg.append(label)
-                msg.append(data)
-            for cName in list(tDict["TC"].keys()):
-                if not tDict["TC"][cName]["mute"]:
-                    msg.append(self._fmtHeadClone(className, tName, cName, ";"))
-                    esObj = tDict["TC"][cName]["esObj"]
-                    data, label = self._translateCsoundExternalStr(orcMapMode, esObj)
-                    msg.append(label)
-                    msg.append(data)
-        self.polySeqStr = "".join(msg)
+        """yield the complete score from self.polySeq, one event at a time"""
+        yield self._fmtHeadSco("", ";")
+        for msg in self._iterPolyStr(self._iterCsoundExternalStr, ";"):
+            yield msg
 
     def _write(self):
         """ """
-        self._translatePoly()
         f = open(self._outFormatToFilePath("csoundScore"), "w")
-        f.write(self.polySeqStr)
+        f.writelines(self._translatePoly())
         f.close()
         self.outComplete.append("csoundScore")
         self.fpRef["fpOutputView"] = self._outFormatToFilePath("csoundScore")
@@ -2101,33 +3358,15 @@ class EngineCsoundSilence(_OutputEngine):
         self.outMin = ["csoundScore"]
 
     def _translatePoly(self):
-        """set self.polySeqStr w/ complet orc from self.polySeq"""
-        msg = []
-        msg.append(self._fmtHeadSco("", ";"))
-        for tName in self.compatNames:
-            tDict = self.polySeq[tName]
-            orcMapMode = tDict["orcMapMode"]
-            className = tDict["className"]
-            if not tDict["mute"]:
-                msg.append(self._fmtHeadTexture(className, tName, ";"))
-                esObj = tDict["esObj"]
-                data, label = self._translateCsoundSilenceStr(orcMapMode, esObj)
-                msg.append(label)
-                msg.append(data)
-            for cName in list(tDict["TC"].keys()):
-                if not tDict["TC"][cName]["mute"]:
-                    msg.append(self._fmtHeadClone(className, tName, cName, ";"))
-                    esObj = tDict["TC"][cName]["esObj"]
-                    data, label = self._translateCsoundSilenceStr(orcMapMode, esObj)
-                    msg.append(label)
-                    msg.append(data)
-        self.polySeqStr = "".join(msg)
+        """yield the complete score from self.polySeq, one event at a time"""
+        yield self._fmtHeadSco("", ";")
+        for msg in self._iterPolyStr(self._iterCsoundSilenceStr, ";"):
+            yield msg
 
     def _write(self):
         """ """
-        self._translatePoly()
         f = open(self._outFormatToFilePath("csoundScore"), "w")
-        f.write(self.polySeqStr)
+        f.writelines(self._translatePoly())
         f.close()
         self.outComplete.append("csoundScore")
         self.fpRef["fpOutputView"] = self._outFormatToFilePath("csoundScore")
@@ -2393,7 +3632,7 @@ class EnginePureDataArray(_OutputEngine):
 
 # -----------------------------------------------------------------||||||||||||--
 class EngineMidiFile(_OutputEngine):
-    """writes a midi file"""
+    """writes a midi file, and optionally renders it to audio"""
 
     def __init__(self, emObj, fpRef, ao):
         """
@@ -2406,13 +3645,16 @@ class EngineMidiFile(_OutputEngine):
         self.doc = lang.docOeMidiFile
         # define orcs that are not compatible w/ this engine
         self.orcIncompat = []  # all orchestras compatable
-        self.outAvailable = ["midiFile"]
+        self.outAvailable = ["midiFile", "midiAudio"]
         self.outMin = ["midiFile"]
+        # omit repeated status bytes; smaller files, but different bytes
+        self.runningStatus = False
         # store structured data
         self.trackList = []
 
     def _translatePoly(self):
-        """tramslates a athenaCL score to midi score"""
+        """tramslates a athenaCL score to midi score
+        note data is provided as iterators, read as the file is written"""
         trackList = []
         for tName in self.compatNames:
             tDict = self.polySeq[tName]
@@ -2421,12 +3663,12 @@ class EngineMidiFile(_OutputEngine):
             pgm = tDict["midiPgm"]
             if not tDict["mute"]:
                 esObj = tDict["esObj"]
-                midiSco = self._translateMidiList(orcMapMode, esObj)
+                midiSco = self._iterMidiList(orcMapMode, esObj)
                 trackList.append((tName, pgm, ch, midiSco))
             for cName in list(tDict["TC"].keys()):
                 if not tDict["TC"][cName]["mute"]:
                     esObj = tDict["TC"][cName]["esObj"]
-                    midiSco = self._translateMidiList(orcMapMode, esObj)
+                    midiSco = self._iterMidiList(orcMapMode, esObj)
                     trackList.append(("%s-%s" % (tName, cName), pgm, ch, midiSco))
         self.trackList = trackList
 
@@ -2439,10 +3681,30 @@ class EngineMidiFile(_OutputEngine):
 
         # TODO: get midi tempo from athenaObejct
         midiObj = midiTools.MidiScore(
-            self.trackList, self.fpRef["fnOutputPrime"], self.fpRef["optionMidiTempo"]
+            self.trackList,
+            self.fpRef["fnOutputPrime"],
+            self.fpRef["optionMidiTempo"],
+            self.runningStatus,
         )
         midiObj.write(self._outFormatToFilePath("midiFile"))
         self.outComplete.append("midiFile")
+        if "midiAudio" in self.outRequest:
+            self._render()
+
+    def _render(self):
+        """render the midi file to audio with the playback soundfont, or the
+        soundfont named by the ATHENACL_SOUNDFONT environment variable;
+        runs faster than real time, and needs no audio device"""
+        jobTools.checkpoint("engine", "midiAudio")
+        errors = renderExt.renderMidi(
+            [self._outFormatToFilePath("midiFile")],
+            [self._outFormatToFilePath("midiAudio")],
+            self.fpRef["optionMidiTempo"],
+        )
+        if errors[0] != "":
+            environment.printWarn([lang.WARN, errors[0]])
+        else:
+            self.outComplete.append("midiAudio")
 
     def _writePost(self):
         self.fpRef["fpOutputView"] = self._outFormatToFilePath("midiFile")
@@ -2592,55 +3854,23 @@ class EngineText(_OutputEngine):
         self.outMin = ["textTab"]
 
     def _translatePoly(self, delimit):
-        """set self.polySeqStr w/ complet orc from self.polySeq"""
-        msg = []
-        msg.append(self._fmtHeadSco(""))
-        for tName in self.compatNames:
-            tDict = self.polySeq[tName]
-            orcMapMode = tDict["orcMapMode"]
-            className = tDict["className"]
-            if not tDict["mute"]:
-                msg.append(
-                    self._fmtHeadTexture(
-                        className,
-                        tName,
-                    )
-                )
-                esObj = tDict["esObj"]
-                data, label = self._translateTextDelimitStr(orcMapMode, esObj, delimit)
-                msg.append(label)
-                msg.append(data)
-            for cName in list(tDict["TC"].keys()):
-                if not tDict["TC"][cName]["mute"]:
-                    msg.append(
-                        self._fmtHeadClone(
-                            className,
-                            tName,
-                            cName,
-                        )
-                    )
-                    esObj = tDict["TC"][cName]["esObj"]
-                    data, label = self._translateTextDelimitStr(
-                        orcMapMode, esObj, delimit
-                    )
-                    msg.append(label)
-                    msg.append(data)
-        self.polySeqStr = "".join(msg)
+        """yield the complete score from self.polySeq, one event at a time"""
+        yield self._fmtHeadSco("")
+        for msg in self._iterPolyStr(self._iterTextDelimitStr, "", delimit):
+            yield msg
 
     def _write(self):
         """ """
         for out in self.outRequest:
-            if out in ["textTab", "textSpace"]:
-                if out == "textTab":
-                    self._translatePoly("\t")
-                if out == "textSpace":
-                    self._translatePoly(" ")
-                fp = self._outFormatToFilePath(out)
+            if out == "textTab":
+                delimit = "\t"
+            elif out == "textSpace":
+                delimit = " "
             else:
                 continue  # cannot process anything else
-
+            fp = self._outFormatToFilePath(out)
             f = open(fp, "w")
-            f.write(self.polySeqStr)
+            f.writelines(self._translatePoly(delimit))
             f.close()
             self.outComplete.append(out)
             self.fpRef["fpOutputView"] = fp
@@ -2770,6 +4000,10 @@ class EventMode(object):
         # this automatically loads all paths in output formats
         for fmtObj in list(self.outFormatObjects.values()):
             self.fpRef[fmtObj.emKey] = self._buildPathPrime(fmtObj.ext)
+        # midi renders can be aif or wav; use wav if preferred
+        if self.fpRef["audioExt"] == ".wav":
+            fmtObj = self.outFormatObjects["midiAudio"]
+            self.fpRef[fmtObj.emKey] = self._buildPathPrime(".mid.wav")
 
         # assigned to after processing
         self.fpRef["fpOutputView"] = None  # set in write() method of subclass
@@ -2822,7 +4056,11 @@ class EventMode(object):
 
         # do compatible types, possible with many formats
         # compatible types are not dependent on auxillary numbers
-        if self.name in ["midi", "midiPercussion"] or "midiFile" in outRequest:
+        if (
+            self.name in ["midi", "midiPercussion"]
+            or "midiFile" in outRequest
+            or "midiAudio" in outRequest
+        ):
             engineRequest.append("EngineMidiFile")
 
         # check for output requests that have an engine
@@ -2977,7 +4215,9 @@ class EventMode(object):
         if style in ["fpRef"]:
             return self._docReference(usrOutRequest)
 
-    def process(self, input=None, usrOutRequest=[], refresh=1):
+    def process(
+        self, input=None, usrOutRequest=[], refresh=1, workers=0, seed=0, window=None
+    ):
         """must be called after setRootPath
         if input is None: uses local atheanObj, processes all textures and clones
         if input is a list of texture objects, will process as necessary
@@ -2987,6 +4227,11 @@ class EventMode(object):
         refresh will force the generation of new scores
         texture.score() called on creation, and edit: should be up to date
         clone.score() called on creation and edit; should be up to date
+        workers and seed are passed to Performer.flattenAll
+        if window is a start and end time, only events that start in that
+        time window are written
+        if a command is run as a job, a jobTools checkpoint is reached
+        before each engine writes; a cancelled job raises error.CancelError
         """
         # get orcObj for this mode, indepedent of any texture
         # this orc is passed to each engine; the engine must use it
@@ -3001,9 +4246,9 @@ class EventMode(object):
         # no need to store perfObj as instance variable
         perfObj = Performer()  # perform textures and clones w/ obj
         if input in [None, "all"]:
-            perfObj.flattenAll(self.ao, refresh)
+            perfObj.flattenAll(self.ao, refresh, workers, seed, window)
         else:  # its a list of textures
-            perfObj.flattenSome(input, refresh)
+            perfObj.flattenSome(input, refresh, window)
 
         # sort all event lists in this perfObj
         # not sure if sorting is always necessary
@@ -3019,6 +4264,7 @@ class EventMode(object):
         # when calling a engine, pass modeOrcObj, process in addition
         # to local texture based texture orcObj
         for engineName in list(engineLib.keys()):
+            jobTools.checkpoint("engine", engineName)
             try:  # will write orchestra if necessary
                 # only pass a fpRef to the polySeq to the engine
                 engineLib[engineName].write(perfObj.polySeq, outRequest)
@@ -3112,6 +4358,366 @@ class Test(unittest.TestCase):
             a.sort()  # maually sort
             a.retrograde(fmt)
 
+    def testSnapshot(self):
+        from athenaCL.libATH.libTM import texture
+        from athenaCL.libATH import clone
+
+        ti = texture.factory("LineGroove")
+        ti.loadDefault()
+        ti.score()
+        src = ti.esObj.copy()
+        a = ti.getScore()
+        b = ti.getScore()
+        self.assertTrue(a.list() is b.list())
+
+        # by default, a clone shifts the time of every event
+        c = clone.Clone("c", "t")
+        c.loadDefault(ti.auxNo, "num")
+        c.score(a, ti.getRefClone())
+        post = c.getScore()
+        self.assertNotEqual(post.getArray("time"), src.getArray("time"))
+        self.assertEqual(a.list(), src.list())
+        self.assertEqual(ti.esObj.list(), src.list())
+
+        # changes through item access are private to one object
+        b[0]["amp"] = -1
+        b.append(copy.deepcopy(src[0]))
+        self.assertEqual(ti.esObj.list(), src.list())
+        self.assertEqual(len(b), len(src) + 1)
+        b.sort()
+        b.retrograde("eventInverse")
+        self.assertEqual(a.list(), src.list())
+
+    def testPerformerWorkers(self):
+        from athenaCL.libATH import athenaObj
+
+        ai = athenaObj.Interpreter("cgi")
+        for cmd in [
+            "EMo cn",
+            "TMo lc",
+            "TIn a 3",
+            "TIe a ru,.2,.9",
+            "TCn a1",
+            "TCe a fma,l,(ru,.2,.5)",
+            "TMo lg",
+            "TIn b 3",
+            "TIe r pt,(bg,rc,(2,4,8)),(c,1),(c,1),(c,1)",
+            "TIn c 3",
+        ]:
+            ok, result = ai.cmd(cmd, errorMode="return")
+            self.assertTrue(ok, result)
+
+        def flatten(workers, seed=0):
+            random.seed(1)  # scores must not depend on this
+            ai.ao.scoreCache.clear()
+            a = Performer()
+            a.flattenAll(ai.ao, 1, workers, seed)
+            post = {}
+            for tName in a.polySeq:
+                post[tName] = a.polySeq[tName]["esObj"].list()
+                for cName in a.polySeq[tName]["TC"]:
+                    post[tName, cName] = a.polySeq[tName]["TC"][cName]["esObj"].list()
+            return post
+
+        post = flatten(1)
+        self.assertEqual(len(post), 4)
+        self.assertEqual(post, flatten(1))
+        self.assertEqual(post, flatten(3))
+        post = flatten(3, 2)
+        self.assertNotEqual(post, flatten(1))
+        self.assertEqual(post, flatten(3, 2))
+        # installed worker scores are available from textures and clones
+        self.assertEqual(ai.ao.textureLib["a"].getScore().list(), post["a"])
+        c = ai.ao.cloneLib.get("a", "a1")
+        self.assertEqual(c.getScore().list(), post["a", "a1"])
+
+    def testPerformerWindow(self):
+        from athenaCL.libATH import athenaObj
+
+        ai = athenaObj.Interpreter("cgi")
+        for cmd in [
+            "EMo cn",
+            "TIn a 3",
+            "TIe a ru,.2,.9",
+            "TCn a1",  # shifts event times by default
+            "TIn b 3",
+            "TIe r pt,(bg,rc,(2,4,8)),(c,1),(c,1),(c,1)",
+        ]:
+            ok, result = ai.cmd(cmd, errorMode="return")
+            self.assertTrue(ok, result)
+
+        def flatten(workers, window=None):
+            ai.ao.scoreCache.clear()
+            a = Performer()
+            a.flattenAll(ai.ao, 1, workers, 3, window)
+            post = {}
+            for tName in a.polySeq:
+                post[tName] = a.polySeq[tName]["esObj"].list()
+                for cName in a.polySeq[tName]["TC"]:
+                    post[tName, cName] = a.polySeq[tName]["TC"][cName]["esObj"].list()
+            return post
+
+        for workers in [1, 2]:
+            src = flatten(workers)
+            post = flatten(workers, (4, 9))
+            self.assertEqual(set(post.keys()), set(src.keys()))
+            for key in src:
+                match = [e for e in src[key] if 4 <= e["time"] < 9]
+                self.assertNotEqual(match, [])
+                self.assertEqual(post[key], match)
+            # partial scores are not cached
+            self.assertEqual(len(ai.ao.scoreCache), 2)
+
+    def testMidiAudio(self):
+        from athenaCL.libATH import athenaObj
+
+        ao = athenaObj.AthenaObject()
+        a = EventMode(ao, "cn")
+        a.setRootPath()
+        a._initRefNames()
+        a._initRefPaths()
+        # a midi render needs the midi file engine, in any event mode
+        engineLib = a._engineAllocate(["midiAudio"])
+        self.assertIn("EngineMidiFile", engineLib)
+        path = a.outFormatToFilePath("midiAudio")
+        if a.fpRef["audioExt"] == ".wav":
+            self.assertTrue(path.endswith(".mid.wav"))
+        else:
+            self.assertTrue(path.endswith(".mid.aif"))
+        self.assertNotEqual(path, a.outFormatToFilePath("midiFile"))
+
+    def testMidiAudioRender(self):
+        import io
+        from athenaCL.libATH import athenaObj
+
+        ai = athenaObj.Interpreter("cgi")
+        for cmd in ["EMo m", "TIn a 0", "TIe t 0,2"]:
+            ok, result = ai.cmd(cmd, errorMode="return")
+            self.assertTrue(ok, result)
+        a = EventMode(ai.ao, "m")
+        a.setRootPath()
+        midiPath = a.outFormatToFilePath("midiFile")
+        audioPath = a.outFormatToFilePath("midiAudio")
+
+        # without a midi file the render fails; the error is a warning
+        engine = EngineMidiFile(a, a.fpRef, ai.ao)
+        stderr = sys.stderr
+        sys.stderr = io.StringIO()
+        try:
+            engine._render()
+            warning = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+        self.assertNotIn("midiAudio", engine.outComplete)
+        self.assertIn(lang.WARN, warning)
+        self.assertFalse(os.path.exists(audioPath))
+
+        if renderExt.soundFont() == None:
+            self.skipTest("no soundfont to render with")
+        ok, msg, outComplete = a.process(None, ["midiFile", "midiAudio"])
+        self.assertTrue(ok, msg)
+        self.assertIn("midiAudio", outComplete)
+        f = open(audioPath, "rb")
+        header = f.read(12)
+        f.close()
+        if audioPath.endswith(".wav"):
+            self.assertEqual((header[:4], header[8:]), (b"RIFF", b"WAVE"))
+        else:
+            self.assertEqual((header[:4], header[8:]), (b"FORM", b"AIFF"))
+        for path in [midiPath, audioPath]:
+            os.remove(path)
+
+    def testInterpolate(self):
+        # values of three events and the frames between them, by method
+        known = {
+            "linear": [
+                (0, 0.5, 0.0, [0, "x", 10]),
+                (0.5, 0.5, 0.25, [1.0, "x", 12.5]),
+                (1.0, 0.5, 0.5, [2.0, "x", 15.0]),
+                (1.5, 0.5, 0.75, [3.0, "x", 17.5]),
+                (2, 1, 1.0, [4, "y", 20]),
+                (3.0, 1, 0.5, [2.0, "y", 10.0]),
+                (4, 2, 0.0, [0, "z", 0]),
+            ],
+            # aux values are interpolated between their own start and end
+            "halfCosine": [
+                (0, 0.5, 0.0, [0, "x", 10]),
+                (0.29289322, 0.5, 0.14644661, [0.58578644, "x", 11.46446609]),
+                (1.0, 0.5, 0.5, [2.0, "x", 15.0]),
+                (1.70710678, 0.5, 0.85355339, [3.41421356, "x", 18.53553391]),
+                (2, 1, 1.0, [4, "y", 20]),
+                (3.0, 1, 0.5, [2.0, "y", 10.0]),
+                (4, 2, 0.0, [0, "z", 0]),
+            ],
+            "power": [
+                (0, 0.5, 0.0, [0, "x", 10]),
+                (0.03125, 0.5, 0.015625, [0.0625, "x", 10.15625]),
+                (0.25, 0.5, 0.125, [0.5, "x", 11.25]),
+                (0.84375, 0.5, 0.421875, [1.6875, "x", 14.21875]),
+                (2, 1, 1.0, [4, "y", 20]),
+                (2.25, 1, 0.125, [0.5, "y", 2.5]),
+                (4, 2, 0.0, [0, "z", 0]),
+            ],
+        }
+
+        def rounded(value):
+            if drawer.isNum(value):
+                return round(value, 8)
+            return value
+
+        for method, exponent in [("linear", 0), ("halfCosine", 0), ("power", 2.0)]:
+            a = EventSequence()
+            a.append({"time": 0, "sus": 2, "amp": 0.0, "aux": [0, "x", 10]})
+            a.append({"time": 2, "sus": 2, "amp": 1.0, "aux": [4, "y", 20]})
+            a.append({"time": 4, "sus": 2, "amp": 0.0, "aux": [0, "z", 0]})
+            tFrameArray = [
+                (0, 0.5, 1, method, exponent),
+                (0.5, 0.5, 0),
+                (1, 0.5, 0),
+                (1.5, 0.5, 0),
+                (2, 1, 1, method, exponent),
+                (3, 1, 0),
+                (4, 2, 1, method, exponent),
+            ]
+            a.interpolate(tFrameArray, 1, ["time", "amp", "aux"])
+            post = [
+                (
+                    rounded(e["time"]),
+                    e["sus"],
+                    rounded(e["amp"]),
+                    [rounded(x) for x in e["aux"]],
+                )
+                for e in a
+            ]
+            self.assertEqual(post, known[method])
+
+    def testEventViews(self):
+        # shared or not, events are views; lists are only changed by assigning
+        for shared in [False, True]:
+            a = EventSequence()
+            a.append({"time": 0, "amp": 0.5, "aux": [1, 2]})
+            a.append({"time": 1, "amp": 0.5, "aux": [3, 4]})
+            if shared:
+                b = a.snapshot()
+            a[0]["aux"][0] = 10
+            self.assertEqual(a[0]["aux"], [1, 2])
+            a[0]["aux"] = [10, 2]
+            a[-1]["amp"] = 1
+            self.assertEqual(a[0]["aux"], [10, 2])
+            self.assertEqual([e["amp"] for e in a[:]], [0.5, 1])
+            self.assertRaises(IndexError, a.__getitem__, 2)
+            if shared:
+                self.assertEqual(b[0]["aux"], [1, 2])
+                self.assertEqual(b[1]["amp"], 0.5)
+
+    def testScoreCache(self):
+        from athenaCL.libATH import athenaObj
+
+        ai = athenaObj.Interpreter("cgi")
+        for cmd in [
+            "EMo cn",
+            "TIn a 3",
+            "TIe a ru,.2,.9",
+            "TCn a1",
+            "TCe a fma,l,(ru,.2,.5)",
+            "TIn b 3",
+            "TIe r pt,(bg,rc,(2,4,8)),(c,1),(c,1),(c,1)",
+        ]:
+            ok, result = ai.cmd(cmd, errorMode="return")
+            self.assertTrue(ok, result)
+        cache = ai.ao.scoreCache
+
+        def flatten(clear):
+            if clear:
+                cache.clear()
+            a = Performer()
+            a.flattenAll(ai.ao, 1, 1, 0)
+            post = {}
+            for tName in a.polySeq:
+                post[tName] = a.polySeq[tName]["esObj"].list()
+                for cName in a.polySeq[tName]["TC"]:
+                    post[tName, cName] = a.polySeq[tName]["TC"][cName]["esObj"].list()
+            return post
+
+        post = flatten(1)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 3, 3))
+        self.assertEqual(post, flatten(0))
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+        self.assertTrue(cache.byteCount > 0)
+        # changes to cached scores are not stored
+        ai.ao.textureLib["a"].esObj[0]["amp"] = -1
+        self.assertEqual(post, flatten(0))
+
+        # an edited clone is re-scored alone; an edited texture w/ its clones
+        for cmd, hits in [
+            ("TIo a", None),
+            ("TCe a fma,l,(c,.5)", 2),
+            ("TIe a ru,.1,.3", 1),
+        ]:
+            ok, result = ai.cmd(cmd, errorMode="return")
+            self.assertTrue(ok, result)
+            if hits == None:
+                continue
+            cache.hits = 0
+            post = flatten(0)
+            self.assertEqual(cache.hits, hits)
+            self.assertEqual(post, flatten(1))
+
+        # scores are removed, least recently used first, to fit maxEvents
+        cache.maxEvents = len(post["b"])
+        flatten(1)
+        self.assertEqual(cache.eventCount, len(post["b"]))
+        self.assertEqual(len(cache), 1)
+
+    def testEventSequenceColumnar(self):
+        from athenaCL.libATH.libTM import texture
+
+        ti = texture.factory("LineCluster")
+        ti.loadDefault(refresh=0)
+        ti.editPmtrObj("ampQ", "ru,.2,.9", refresh=0)
+        ti.score()
+        src = ti.getScore()
+        # add events that can not be stored in columns
+        src.append({"time": 3, "dur": 0.5, "aux": ["a", 2], "extra": (1, 2)})
+        src.append({"time": 1, "dur": None, "comment": [[0, 1]]})
+
+        a = EventSequenceColumnar()
+        for event in src.list():
+            a.append(event)
+        self.assertEqual(len(a), len(src))
+        self.assertEqual(copy.deepcopy(a.list()), src.list())
+        for key in _EVENT_KEYS:
+            if key in ("time", "dur"):
+                self.assertEqual(a.getArray(key), src.getArray(key))
+            self.assertEqual(a[0][key], src[0][key])
+            self.assertEqual(type(a[0][key]), type(src[0][key]))
+        self.assertEqual(a[-2]["extra"], (1, 2))
+        self.assertEqual(list(a[-1].keys()), ["time", "dur", "comment"])
+        self.assertRaises(KeyError, a[-1].__getitem__, "aux")
+
+        # edits, deletion, and copies
+        b = a.copy()
+        b[0]["amp"] = "x"
+        b[0]["aux"] = [0.25, 3]
+        b[1] = {"time": 2.0, "dur": 1.0}
+        del b[2]
+        self.assertEqual(b[0]["amp"], "x")
+        self.assertEqual(b[0]["aux"], [0.25, 3])
+        self.assertEqual(b[1].copy(), {"time": 2.0, "dur": 1.0})
+        self.assertEqual(len(b), len(a) - 1)
+        self.assertEqual(a[0].copy(), src[0])
+
+        # sort, retrograde, and array access on full events
+        del a[-2:]
+        del src[-2:]
+        for esObj in (a, src):
+            esObj.sort()
+            esObj.retrograde("timeInverse")
+            esObj.setArray("amp", [x * 0.5 for x in esObj.getArray("amp")])
+        self.assertEqual(copy.deepcopy(a.list()), src.list())
+        self.assertEqual(a.getArray("aux"), src.getArray("aux"))
+        self.assertEqual(a.getArray("comment"), src.getArray("comment"))
+
 
 # -----------------------------------------------------------------||||||||||||--
 
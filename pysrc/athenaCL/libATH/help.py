@@ -403,13 +403,13 @@ class HelpDoc:
     EMi_usage = "emi"
 
     # -----------------------------------------------------------------------||--
-    ELn = "ELn: EventList: New: Create a new event list, in whatever formats are specified within the active EventMode and EventOutput. Generates new events for all Textures and Clones that are not muted. Specific output formats are determined by the active EventMode (EMo) and selected output formats (EOo)."
-    ELn_usage = "eln filename.xml"
+    ELn = "ELn: EventList: New: Create a new event list, in whatever formats are specified within the active EventMode and EventOutput. Generates new events for all Textures and Clones that are not muted. Specific output formats are determined by the active EventMode (EMo) and selected output formats (EOo). An optional time window, given as start and end times in seconds separated by a comma, limits the event list to events that start within that window; if the window is given without a file name, a temporary file is used. Textures without Clones only process and store events within the window."
+    ELn_usage = "eln [filename.xml] [start,end]"
 
     ELw = "ELw: EventList: Save: Write event lists stored in Textures and Clones, in whatever formats specified within the active EventMode and EventOutput; new event lists are not generated, and output will always be identical."
     ELw_usage = "elw filename.xml"
 
-    ELv = "ELv: EventList: View: Opens the last event list created in the current session as a text document."
+    ELv = "ELv: EventList: View: Opens the last event list created in the current session as a text document, and reports use of the score cache: when score workers are set with APsco, ELn stores each texture and clone score, and reuses scores of textures and clones that have not changed."
     ELv_usage = "elv"
 
     ELh = "ELh: EventList: Hear: If possible, opens and presents to the user the last audible EventList output (audio file, MIDI file) created in the current session."
@@ -422,14 +422,14 @@ class HelpDoc:
     ELauto_usage = "elauto"
 
     # -----------------------------------------------------------------------||--
-    AOw = "AOw: AthenaObject: Save: Saves an AthenaObject file, containing all Paths, Textures, Clones, and environment settings."
-    AOw_usage = "aow filename.xml"
+    AOw = "AOw: AthenaObject: Save: Saves an AthenaObject file, containing all Paths, Textures, Clones, and environment settings. Files named with a .aob extension are saved in a compact binary format that loads faster than XML."
+    AOw_usage = "aow filename.xml|filename.aob"
 
-    AOl = "AOl: AthenaObject: Load: Load an athenaCL XML AthenaObject. Loading an AthenaObject will overwrite any objects in the current AthenaObject."
-    AOl_usage = "aol filename.xml"
+    AOl = "AOl: AthenaObject: Load: Load an athenaCL AthenaObject, saved in the binary .aob format or in XML; XML AthenaObjects of earlier versions are still accepted. Loading an AthenaObject will overwrite any objects in the current AthenaObject."
+    AOl_usage = "aol filename.xml|filename.aob"
 
-    AOmg = "AOmg: AthenaObject: Merge: Merges a selected XML AthenaObject with the current AthenaObject."
-    AOmg_usage = "aomg filename.xml"
+    AOmg = "AOmg: AthenaObject: Merge: Merges a selected AthenaObject, saved in the binary .aob format or in XML, with the current AthenaObject."
+    AOmg_usage = "aomg filename.xml|filename.aob"
 
     AOrm = "AOrm: AthenaObject: Remove: Reinitialize the AthenaObject, destroying all Paths, Textures, and Clones."
     AOrm_usage = "aorm [confirm]"
@@ -445,6 +445,9 @@ class HelpDoc:
     APr = "APr: AthenaPreferences: Refresh: When refresh mode is active, every time a Texture or Clone is edited, a new event list is calculated in order to test ParameterObject compatibility and to find absolute time range. When refresh mode is inactive, editing Textures and Clones does not test event list production, and is thus significantly faster."
     APr_usage = "apr"
 
+    APsco = "APsco: AthenaPreferences: Score: Set the number of worker processes used to score Textures and their Clones with ELn and ELw, and optionally the seed from which the random numbers of each Texture are derived. With zero workers, Textures are scored one after another, sharing the random number generator. With one or more workers, each Texture and its Clones use a random stream derived from the seed and the Texture name, producing the same event lists with any number of workers; where worker processes are not available, Textures are scored one after another."
+    APsco_usage = "apsco workerCount [seed]"
+
     APwid = "APwid: AthenaPreferences: Width: Manually set the number of characters displayed per line during an athenaCL session. Use of this preference is only necessary on platforms that do not provide a full-featured terminal envrionment."
     APwid_usage = "apwid characterWidth"
 
@@ -11,6 +11,10 @@
 # -----------------------------------------------------------------||||||||||||--
 
 import unittest
+import os
+import struct
+import re
+import ast
 
 
 from athenaCL.libATH import drawer
@@ -19,8 +23,6 @@ from athenaCL.libATH import language
 from athenaCL.libATH import error
 
 lang = language.LangObj()
-from athenaCL.libATH.libPmtr import basePmtr
-from athenaCL.libATH.libPmtr import parameter
 from athenaCL.libATH import xmlTools
 from xmlToolsExt import xmlToPy
 
@@ -50,21 +52,157 @@ def extractXML(path):
 
 
 # -----------------------------------------------------------------||||||||||||--
-# evalues raw string data from xml intp proper lists and python data structures
-# strings cannot be evaluated, as this causes a name error
-# all other data objects, however, should be evaluated
+# decode raw string data from xml into proper lists and python data structures
+# only the literals athenaCL writes (numbers, strings, None/True/False, and
+# tuples, lists, and dicts of these) are decoded; anything else stays a string
+
+_LITERAL_TOKEN = re.compile(
+    r"""[ \t\r\n]*(?:
+    (?P<num>[+-]?(?:
+        (?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?
+        |\d+[eE][+-]?\d+
+        |[1-9]\d*|0+)(?![\w.]))
+    |(?P<str>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+    |(?P<name>None|True|False)(?![\w.])
+    |(?P<punct>[()\[\]{},:])
+    |(?P<end>\Z))""",
+    re.VERBOSE,
+)
+
+# first characters that can begin a decodable literal
+_LITERAL_START = frozenset("+-.0123456789([{'\"NTF")
+_LITERAL_NAME = {"None": None, "True": True, "False": False}
+
+
+class _LiteralError(Exception):
+    pass
+
+
+def _literalTokenize(valueStr):
+    """return a list of (kind, text) pairs, ending with an end token"""
+    tokens = []
+    pos = 0
+    match = _LITERAL_TOKEN.match
+    while 1:
+        m = match(valueStr, pos)
+        if m is None:
+            raise _LiteralError
+        kind = m.lastgroup
+        tokens.append((kind, m.group(kind)))
+        if kind == "end":
+            return tokens
+        pos = m.end()
+
+
+def _literalValue(tokens, i):
+    """parse one value starting at token index i; return value, next index"""
+    kind, text = tokens[i]
+    if kind == "num":
+        for c in text:
+            if c in ".eE":
+                return float(text), i + 1
+        return int(text), i + 1
+    elif kind == "str":
+        if "\\" in text:
+            return ast.literal_eval(text), i + 1
+        return text[1:-1], i + 1
+    elif kind == "name":
+        return _LITERAL_NAME[text], i + 1
+    elif kind == "punct":
+        if text == "(":
+            items, i, comma = _literalItems(tokens, i + 1, ")")
+            if len(items) == 1 and not comma:
+                return items[0], i  # parenthesized value
+            return tuple(items), i
+        elif text == "[":
+            items, i, comma = _literalItems(tokens, i + 1, "]")
+            return items, i
+        elif text == "{":
+            return _literalDict(tokens, i + 1)
+    raise _LiteralError
+
+
+def _literalItems(tokens, i, close):
+    """parse comma separated values up to a closing bracket; return the
+    values, the next index, and if a comma was found"""
+    items = []
+    comma = False
+    while 1:
+        if tokens[i] == ("punct", close):
+            return items, i + 1, comma
+        value, i = _literalValue(tokens, i)
+        items.append(value)
+        if tokens[i] == ("punct", ","):
+            comma = True
+            i += 1
+        elif tokens[i] != ("punct", close):
+            raise _LiteralError
+
+
+def _literalDict(tokens, i):
+    """parse a dictionary after its opening brace; return dict, next index"""
+    post = {}
+    while 1:
+        if tokens[i] == ("punct", "}"):
+            return post, i + 1
+        key, i = _literalValue(tokens, i)
+        if tokens[i] != ("punct", ":"):
+            raise _LiteralError
+        value, i = _literalValue(tokens, i + 1)
+        try:
+            post[key] = value
+        except TypeError:  # unhashable key
+            raise _LiteralError
+        if tokens[i] == ("punct", ","):
+            i += 1
+        elif tokens[i] != ("punct", "}"):
+            raise _LiteralError
+
+
+def decodeLiteral(valueStr):
+    """decode a string written by athenaCL into python data; strings that
+    are not literals are returned unchanged
+
+    >>> decodeLiteral("('bg', 'rc', [2, 3.5])")
+    ('bg', 'rc', [2, 3.5])
+    >>> decodeLiteral('None'), decodeLiteral('-12'), decodeLiteral('1,')
+    (None, -12, (1,))
+    >>> decodeLiteral('LineGroove'), decodeLiteral('2.0.0-a15')
+    ('LineGroove', '2.0.0-a15')
+    """
+    src = valueStr
+    if src[:1] in (" ", "\t"):  # as eval, ignore leading blanks
+        src = src.lstrip(" \t")
+    if not src or src[0] not in _LITERAL_START:
+        return valueStr
+    try:
+        tokens = _literalTokenize(src)
+        value, i = _literalValue(tokens, 0)
+        if tokens[i] == ("punct", ","):  # an unbracketed tuple
+            items = [value]
+            i += 1
+            while tokens[i][0] != "end":
+                value, i = _literalValue(tokens, i)
+                items.append(value)
+                if tokens[i] == ("punct", ","):
+                    i += 1
+                elif tokens[i][0] != "end":
+                    raise _LiteralError
+            value = tuple(items)
+        if tokens[i][0] != "end":
+            raise _LiteralError
+    except (_LiteralError, ValueError, SyntaxError):
+        return valueStr
+    return value
+
+
 def _evalRecurse(data):
-    """recursively evaluate data in dictionaries; if data is a string,
-    dont evaluate if data is a dict, recurse"""
-    keyList = list(data.keys())
-    for key in keyList:
-        if drawer.isDict(data[key]):
-            _evalRecurse(data[key])
+    """recursively decode data in dictionaries; if data is a dict, recurse"""
+    for key, value in data.items():
+        if drawer.isDict(value):
+            _evalRecurse(value)
         else:  # not a dictionary
-            try:
-                data[key] = eval(data[key])
-            except (NameError, SyntaxError):  # its a string
-                pass
+            data[key] = decodeLiteral(value)
 
 
 def evalObjectDictionary(aData, pData, tData):
@@ -105,6 +243,140 @@ def writeXML(filePath, aData, pData, tData):
     f.close()
 
 
+# -----------------------------------------------------------------||||||||||||--
+# compact binary athenaObject: a header and format version, followed by the
+# data dictionaries in a type-tagged encoding defined here; each value is a
+# one byte tag followed by its data; sizes and counts are 4 byte unsigned
+# big-endian integers; athenaCL version migration is done, as with xml, by
+# BackwardsCompat on aData['version']
+
+BINARY_EXTENSION = ".aob"
+BINARY_HEAD = b"athenaObject\x00"
+BINARY_VERSION = 1
+
+_SIZE = struct.Struct(">I")
+_FLOAT = struct.Struct(">d")
+
+
+def _binaryEncode(value, parts):
+    """append the encoding of value to the list of bytes parts
+    raises ValueError for values that have no encoding
+
+    >>> parts = []
+    >>> _binaryEncode({'a': (1, -2.5)}, parts)
+    >>> _binaryDecode(b''.join(parts), 0)
+    ({'a': (1, -2.5)}, 31)
+    """
+    if value is None:
+        parts.append(b"N")
+    elif value is True:
+        parts.append(b"T")
+    elif value is False:
+        parts.append(b"F")
+    elif isinstance(value, int):
+        data = value.to_bytes(value.bit_length() // 8 + 1, "big", signed=True)
+        parts.append(b"i" + _SIZE.pack(len(data)) + data)
+    elif isinstance(value, float):
+        parts.append(b"f" + _FLOAT.pack(value))
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        parts.append(b"s" + _SIZE.pack(len(data)) + data)
+    elif isinstance(value, (list, tuple)):
+        tag = b"l" if isinstance(value, list) else b"t"
+        parts.append(tag + _SIZE.pack(len(value)))
+        for item in value:
+            _binaryEncode(item, parts)
+    elif isinstance(value, dict):
+        parts.append(b"d" + _SIZE.pack(len(value)))
+        for key, item in value.items():
+            _binaryEncode(key, parts)
+            _binaryEncode(item, parts)
+    else:
+        raise ValueError(
+            "cannot write %s to a binary AthenaObject" % type(value).__name__
+        )
+
+
+def _binaryDecode(doc, i):
+    """decode the value starting at index i of doc; return the value and the
+    index after it; raises ValueError for malformed data
+    """
+    tag = doc[i : i + 1]
+    i = i + 1
+    if tag == b"N":
+        return None, i
+    elif tag == b"T":
+        return True, i
+    elif tag == b"F":
+        return False, i
+    elif tag == b"f":
+        return _FLOAT.unpack_from(doc, i)[0], i + _FLOAT.size
+    size = _SIZE.unpack_from(doc, i)[0]
+    i = i + _SIZE.size
+    if tag in (b"i", b"s"):
+        data = doc[i : i + size]
+        if len(data) != size:
+            raise ValueError("truncated data")
+        if tag == b"i":
+            return int.from_bytes(data, "big", signed=True), i + size
+        return data.decode("utf-8"), i + size
+    elif tag in (b"l", b"t"):
+        items = []
+        for x in range(size):
+            item, i = _binaryDecode(doc, i)
+            items.append(item)
+        return (items if tag == b"l" else tuple(items)), i
+    elif tag == b"d":
+        value = {}
+        for x in range(size):
+            key, i = _binaryDecode(doc, i)
+            value[key], i = _binaryDecode(doc, i)
+        return value, i
+    raise ValueError("unknown tag %r" % tag)
+
+
+def isBinary(path):
+    """return True if the file at path is a binary athenaObject"""
+    with open(path, "rb") as f:
+        head = f.read(len(BINARY_HEAD))
+    return head == BINARY_HEAD
+
+
+def writeBinary(filePath, aData, pData, tData):
+    """write athenaObject as a binary file
+    provide the same three dictionaries as given to writeXML
+    raises ValueError if the data has values that cannot be encoded
+    """
+    parts = [BINARY_HEAD + bytes([BINARY_VERSION])]
+    _binaryEncode({"athena": aData, "paths": pData, "textures": tData}, parts)
+    with open(filePath, "wb") as f:
+        f.write(b"".join(parts))
+
+
+def extractBinary(path):
+    """open a binary athenaObject and return data dictionaries
+    raises ValueError if the file is not a readable binary athenaObject
+    """
+    with open(path, "rb") as f:
+        doc = f.read()
+    if len(doc) <= len(BINARY_HEAD) or doc[: len(BINARY_HEAD)] != BINARY_HEAD:
+        raise ValueError("not a binary AthenaObject")
+    version = doc[len(BINARY_HEAD)]
+    if version > BINARY_VERSION:
+        raise ValueError("binary AthenaObject format %s not supported" % version)
+    # changes to the binary layout should be updated here by version
+    try:
+        data, i = _binaryDecode(doc, len(BINARY_HEAD) + 1)
+    except (ValueError, struct.error, UnicodeDecodeError, TypeError, RecursionError):
+        raise ValueError("corrupt binary AthenaObject")
+    if i != len(doc) or not isinstance(data, dict):
+        raise ValueError("corrupt binary AthenaObject")
+    try:
+        return data["athena"], data["paths"], data["textures"]
+    except KeyError:
+        raise ValueError("corrupt binary AthenaObject")
+
+
 # -----------------------------------------------------------------||||||||||||--
 # backwards compat object deals with problems
 class BackwardsCompat:
@@ -120,6 +392,8 @@ class BackwardsCompat:
 
     def _waveReplace(self, argSrc):
         """always returns a list, not a tuple"""
+        from athenaCL.libATH.libPmtr import parameter  # only for old files
+
         arg = list(argSrc[:])
         if not drawer.isStr(arg[0]):
             return arg  # dont alter
@@ -220,6 +494,8 @@ class BackwardsCompat:
         smaller aux value, extra Q keys exist that should not by the aux count
         this causes errors elsewhere, and his been fixed
         this method looks a the aux and removes any extra aux like things"""
+        from athenaCL.libATH.libPmtr import basePmtr  # only for old files
+
         t = self.tData
         for tName in list(t["textureLib"].keys()):
             auxNo = t["textureLib"][tName]["auxNo"]
@@ -296,6 +572,80 @@ class Test(unittest.TestCase):
     def testDummy(self):
         self.assertEqual(True, True)
 
+    def testDecodeLiteral(self):
+        # literals are decoded as eval would
+        for src in [
+            "44100",
+            "-0.5",
+            ".5e-3",
+            "None",
+            "False",
+            "[(0,)]",
+            "('c', 0.5)",
+            "('bg', 'rc', [2, 3])",
+            "{'a': (1, -2), 3: [None, True]}",
+            "1, 2,",
+            "()",
+            "'it\\'s'",
+            " 3",
+        ]:
+            post = decodeLiteral(src)
+            self.assertEqual(post, eval(src))
+            self.assertEqual(type(post), type(eval(src)))
+        # anything else is a string, including names eval would find
+        for src in [
+            "",
+            "LineGroove",
+            "2.0.0-a15",
+            "rb,.4,.4,.7,.9",
+            "007",
+            "1-3",
+            "int",
+            "Nonesuch",
+            "(1,,)",
+            "[1, 2",
+        ]:
+            self.assertEqual(decodeLiteral(src), src)
+
+    def testBinary(self):
+        aData = {"version": "2.0.0", "audioRate": 44100, "fpLastDir": ""}
+        pData = {"pathLib": {"a": {"psPath": [(0, 2), (4,)]}}}
+        tData = {"textureLib": {"3": {"mute": 0, "tName": "3"}}, "cloneLib": {}}
+        fp = environment.getTempFile(BINARY_EXTENSION)
+        writeBinary(fp, aData, pData, tData)
+        self.assertEqual(isBinary(fp), True)
+        self.assertEqual(extractBinary(fp), (aData, pData, tData))
+        # tuples, lists and other types are read back as written
+        tData["textureLib"]["3"]["pmtrQDict"] = {
+            "inst": ("staticInst", 3, "csoundNative"),
+            "ampQ": ["c", -0.25, None, True, False, 2**70, "\u00e9"],
+        }
+        writeBinary(fp, aData, pData, tData)
+        post = extractBinary(fp)
+        self.assertEqual(post, (aData, pData, tData))
+        self.assertEqual(repr(post[2]), repr(tData))
+        # values without an encoding are an error, and nothing is written
+        os.remove(fp)
+        self.assertRaises(ValueError, writeBinary, fp, aData, pData, {"a": {1, 2}})
+        self.assertEqual(os.path.exists(fp), False)
+        # truncated data is not read
+        writeBinary(fp, aData, pData, tData)
+        with open(fp, "r+b") as f:
+            f.truncate(os.path.getsize(fp) - 3)
+        self.assertRaises(ValueError, extractBinary, fp)
+        # a newer format version is not read
+        with open(fp, "r+b") as f:
+            f.seek(len(BINARY_HEAD))
+            f.write(bytes([BINARY_VERSION + 1]))
+        self.assertRaises(ValueError, extractBinary, fp)
+        os.remove(fp)
+        # xml files are not binary
+        fp = environment.getTempFile(".xml")
+        writeXML(fp, aData, pData, tData)
+        self.assertEqual(isBinary(fp), False)
+        self.assertRaises(ValueError, extractBinary, fp)
+        os.remove(fp)
+
 
 # -----------------------------------------------------------------||||||||||||--
 if __name__ == "__main__":
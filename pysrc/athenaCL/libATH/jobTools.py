@@ -0,0 +1,136 @@
+#!/usr/local/bin/python
+# -----------------------------------------------------------------||||||||||||--
+# Name:          jobTools.py
+# Purpose:       progress and cancellation for commands run as jobs.
+#
+# Authors:       athenaCL contributors
+#
+# Copyright:     (c) 2026 athenaCL contributors
+# License:       GPL
+# -----------------------------------------------------------------||||||||||||--
+import unittest, doctest
+
+from athenaCL.libATH import error
+
+_MOD = "jobTools.py"
+
+# a command run as a job reaches a checkpoint at each texture and clone it
+# scores and at each engine that writes its output; at each checkpoint the
+# job's progress function is called with the job id, a stage name
+# ('texture', 'clone', or 'engine') and the name of the object; if the
+# progress function returns True, or if cancel() was called, the command
+# is stopped at the checkpoint by raising error.CancelError
+
+# the job in progress; None if commands are not run as jobs
+_activeJob = None
+
+
+# -----------------------------------------------------------------||||||||||||--
+class Job(object):
+    """a command in progress
+
+    >>> a = Job(3)
+    >>> a.checkpoint('texture', 'a')
+    >>> a.cancel()
+    >>> try: a.checkpoint('texture', 'b')
+    ... except error.CancelError as e: print(e)
+    job 3 cancelled at texture b
+    """
+
+    def __init__(self, jobId, progress=None):
+        self.jobId = jobId
+        self.cancelled = False
+        self._progress = progress  # called w/ jobId, stage, name
+        self._prior = None  # job active before this job was started
+
+    def cancel(self):
+        """stop this job at the next checkpoint"""
+        self.cancelled = True
+
+    def checkpoint(self, stage, name=""):
+        """report progress, and raise error.CancelError if cancelled"""
+        if self._progress != None and self._progress(self.jobId, stage, str(name)):
+            self.cancelled = True
+        if self.cancelled:
+            raise error.CancelError(
+                "job %s cancelled at %s %s" % (self.jobId, stage, name)
+            )
+
+
+# -----------------------------------------------------------------||||||||||||--
+def start(jobId, progress=None):
+    """make a new job the active job, and return it; jobs started while
+    another is active are nested, and must be stopped in reverse order"""
+    global _activeJob
+    job = Job(jobId, progress)
+    job._prior = _activeJob
+    _activeJob = job
+    return job
+
+
+def stop(job):
+    """end a job started with start(), restoring the job active before"""
+    global _activeJob
+    assert _activeJob is job
+    _activeJob = job._prior
+
+
+def active():
+    """return the active job, or None"""
+    return _activeJob
+
+
+def checkpoint(stage, name=""):
+    """checkpoint of the active job, if any; does nothing if no command
+    is run as a job
+
+    >>> checkpoint('engine', 'csoundNative')
+    """
+    if _activeJob != None:
+        _activeJob.checkpoint(stage, name)
+
+
+# -----------------------------------------------------------------||||||||||||--
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def testDummy(self):
+        self.assertEqual(True, True)
+
+    def testProgress(self):
+        post = []
+
+        def progress(jobId, stage, name):
+            post.append((jobId, stage, name))
+            return len(post) == 3  # cancel at third checkpoint
+
+        job = start(7, progress)
+        try:
+            checkpoint("texture", "a")
+            checkpoint("clone", "a1")
+            self.assertRaises(error.CancelError, checkpoint, "engine", "x")
+        finally:
+            stop(job)
+        self.assertEqual(post[1], (7, "clone", "a1"))
+        self.assertEqual(active(), None)
+        checkpoint("texture", "b")  # no job: no effect
+        self.assertEqual(len(post), 3)
+
+    def testNested(self):
+        a = start(1)
+        b = start(2)
+        self.assertTrue(active() is b)
+        stop(b)
+        a.cancel()
+        self.assertRaises(error.CancelError, checkpoint, "texture", "a")
+        stop(a)
+        self.assertEqual(active(), None)
+
+
+# -----------------------------------------------------------------||||||||||||--
+if __name__ == "__main__":
+    from athenaCL.test import baseTest
+
+    baseTest.main(Test)
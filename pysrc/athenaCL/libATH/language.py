@@ -484,6 +484,7 @@ Apple, Macintosh, Mac OS, and QuickTime are trademarks or registered trademarks
     )
     msgELnoScores = "too many rests: no events were created.\n"
     msgELviewInit = "EventList view initiated: %s\n"
+    msgELscoreCache = "%s hits, %s misses, %s scores, %s events, %s bytes"
     msgELnameScore = 'name an EventList. use a ".xml" extension:'
     msgELbadScoreName = 'EventList files must end with a ".xml" extension.\n'
     msgELrenderError = (
@@ -502,8 +503,8 @@ Apple, Macintosh, Mac OS, and QuickTime are trademarks or registered trademarks
     msgELauto = "csound auto score render control set to %s.\n"
 
     msgAObadWidth = "the character width should be between 30 and 300. try again.\n"
-    msgAObadName = 'AthenaObject files must end with a ".xml" extension. try again.\n'
-    msgAOnameFile = 'name this AthenaObject. use a ".xml" extension:'
+    msgAObadName = 'AthenaObject files must end with a ".xml" or ".aob" extension. try again.\n'
+    msgAOnameFile = 'name this AthenaObject. use a ".xml" or ".aob" extension:'
     msgAOselectFile = "select an AthenaObject file:"
     msgAOcreateFirst = 'create a path or a texture first: enter "PIn" to begin.\n'
     msgAOnotXML = TAB + "this is not an AthenaObject xml document.\n"
@@ -515,6 +516,9 @@ Apple, Macintosh, Mac OS, and QuickTime are trademarks or registered trademarks
     msgAPgfxConfirm = "graphics format changed to %s.\n"
     msgAPcursorTool = "cursor tool set to %s.\n"
     msgAPrefreshMode = "refresh mode set to %s.\n"
+    msgAPscore = "score workers set to %s, seed set to %s.\n"
+    msgAPscoreGetWorkers = "enter a number of score worker processes:"
+    msgAPscoreBadWorkers = "enter an integer from 0 to 256."
 
     # -----------------------------------------------------------------------||--
     salutationAm0 = "welcome"
@@ -24,12 +24,21 @@ class Orchestra(object):
 
     this orchestra, as 'generic', is used by EngineAudioFile to
     limit amp values; assumes native unit interval representation
+
+    orchestras obtained from orc.factory are shared by all textures and
+    engines, and are not copied when textures or parameters are copied
     """
 
     def __init__(self):
         self.name = None
         self._instrNumbers = None  # access w/ methods, not by looking at this attr
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     # -----------------------------------------------------------------------||--
     # public interface methods
     def instNoValid(self, iNo):
@@ -99,6 +108,24 @@ class Orchestra(object):
             raise ValueError("bad parameter name in orchestra")
         return val
 
+    def postMapFunc(self, iNo, pmtr, orcMapMode=1):
+        """return a function of one value that does the same mapping as
+        postMap for this instrument, parameter, and orcMapMode; used by
+        engines to map all values of a texture; subclasses may return
+        functions that look up instrument data only once
+        """
+        if pmtr == "amp":
+            postMapAmp = self._postMapAmp
+            return lambda val: postMapAmp(iNo, val, orcMapMode)
+        elif pmtr == "pan":
+            postMapPan = self._postMapPan
+            return lambda val: postMapPan(iNo, val, orcMapMode)
+        elif pmtr == "ps":
+            postMapPs = self._postMapPs
+            return lambda val: postMapPs(iNo, val)
+        else:  # this shoudl never happen
+            raise ValueError("bad parameter name in orchestra")
+
     # -----------------------------------------------------------------------||--
     # mappings of psReal, amp, pan; only applied of mix mode is on
     # mapings done before limits
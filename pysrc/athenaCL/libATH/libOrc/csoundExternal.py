@@ -66,9 +66,8 @@ class CsoundExternal(baseOrc.Orchestra):
     def getInstPreset(self, iNo, auxNo=None):
         """"""
         assert auxNo != None  # must be provided
-        # provide auxNo as aregument, setting internal to appropriate aux value
-        self._dummyInst = InstrumentCsoundExternal(auxNo)
-        return self._dummyInst.getPresetDict()  # will returns empty dict
+        # orchestras are shared, so do not store the per-texture instrument
+        return InstrumentCsoundExternal(auxNo).getPresetDict()  # empty dict
 
     def getInstName(self, iNo):
         return self._dummyInst.name
@@ -172,21 +171,43 @@ class CsoundSilence(baseOrc.Orchestra):
     # assume pan is floating point 0 to 1
     # -----------------------------------------------------------------------||--
     # mappings of psReal, amp, pan; only applied of mix mode is on
+    def postMapFunc(self, iNo, pmtr, orcMapMode=1):
+        """mappings do not depend on instrument or orcMapMode"""
+        if pmtr == "amp":
+            return _postMapAmp
+        elif pmtr == "pan":
+            return _postMapPan
+        elif pmtr == "ps":
+            return _postMapPs
+        return baseOrc.Orchestra.postMapFunc(self, iNo, pmtr, orcMapMode)
+
     def _postMapPs(self, iNo, val):
-        val = pitchTools.psToMidi(val, "noLimit")
-        return val
+        return _postMapPs(val)
 
     # use floating point midi amp values
     def _postMapAmp(self, iNo, val, orcMapMode=1):
-        val = val * 127.0
-        if val < 0:
-            val = 0  # we can assume tt amps are never negative
-        return val
+        return _postMapAmp(val)
 
     def _postMapPan(self, iNo, val, orcMapMode=1):  # assume b/n 0 and 1
-        if val < 0 or val > 1:
-            val = val % 1.0
-        return val
+        return _postMapPan(val)
+
+
+# mappings for csoundSilence, the same for all instruments and orcMapModes
+def _postMapPs(val):
+    return pitchTools.psToMidi(val, "noLimit")
+
+
+def _postMapAmp(val):
+    val = val * 127.0
+    if val < 0:
+        val = 0  # we can assume tt amps are never negative
+    return val
+
+
+def _postMapPan(val):
+    if val < 0 or val > 1:
+        val = val % 1.0
+    return val
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -21,6 +21,19 @@ lang = language.LangObj()
 from athenaCL.libATH.libOrc import baseOrc
 
 
+def _limitPan(val):
+    """limit pan values b/n 0 and 1 by modulo 1"""
+    if val < 0 or val > 1:
+        val = val % 1.0
+    return val
+
+
+# instrument objects, created on first access and shared by all orchestras
+_instrObjDict = {}
+# orchestra source, without title, for each (noChannels, instrument numbers)
+_orcSrcCache = {}
+
+
 class CsoundNative(baseOrc.Orchestra):
     """built-in csound instruments"""
 
@@ -31,7 +44,6 @@ class CsoundNative(baseOrc.Orchestra):
         baseOrc.Orchestra.__init__(self)
 
         self.name = "csoundNative"
-        self.srcStr = None  # string representation for writing
 
         self._headMono = """
 sr       = 44100
@@ -170,13 +182,6 @@ nchnls = 4
             241,  # 1.4.3
         )
 
-        # on initialization, load a dictionary of objects for use
-        self._instrObjDict = {}
-        globalDict = globals()
-        for iNo in self._instrNumbers:
-            objAttr = globalDict["Inst%i" % iNo]
-            self._instrObjDict[iNo] = objAttr()  # instantiate obj
-
     # -----------------------------------------------------------------------||--
     def instNoValid(self, iNo):
         """test if an instrument number is valid
@@ -205,8 +210,11 @@ nchnls = 4
         return "".join(msg)
 
     def getInstObj(self, iNo):
-        if iNo in list(self._instrObjDict.keys()):  # already loaded
-            return self._instrObjDict[iNo]  # call attribute of module to get object
+        if iNo in _instrObjDict:  # already loaded
+            return _instrObjDict[iNo]
+        elif iNo in self._instrNumbers:  # call attribute of module to get object
+            _instrObjDict[iNo] = globals()["Inst%i" % iNo]()
+            return _instrObjDict[iNo]
         else:
             raise ValueError("bad insturment number given: %s" % iNo)
 
@@ -216,35 +224,38 @@ nchnls = 4
         return self._fTables
 
     def constructOrc(self, noChannels=2, instList=None):
-        """buildes a string of an entire orchestra
+        """returns a string of an entire orchestra
         provides proper header and output sections based on
-        number of channels
+        number of channels; source for each channel count and
+        instrument list is built once and reused
 
         >>> a = CsoundNative()
-        >>> a.constructOrc(2, [3,4,5])
-        >>> len(a.srcStr)
-        4418
+        >>> post = a.constructOrc(2, [3,4,5])
+        >>> ';--i4--sineUnitEnvelope' in post
+        True
         """
-        self.noChannels = noChannels
-        msg = []
-        msg.append(self._orcTitle())
-        if self.noChannels == 1:
-            msg.append(self._headMono)
-        elif self.noChannels == 2:
-            msg.append(self._headStereo)
-        elif self.noChannels == 4:
-            msg.append(self._headQuad)
-
-        # self.instrObjDict = {}
         if instList == None:  # if not given, add all instruments
             instList = self.instNoList()
+        valid = []
         for number in instList:
             if not self.instNoValid(number):
                 print(lang.WARN, "instrument %i not available." % number)
                 continue
-            instrObj = self.getInstObj(number)
-            msg.append(instrObj.buildInstrDef(noChannels))
-        self.srcStr = "".join(msg)
+            valid.append(number)
+        key = (noChannels, tuple(valid))
+        if key not in _orcSrcCache:
+            msg = []
+            if noChannels == 1:
+                msg.append(self._headMono)
+            elif noChannels == 2:
+                msg.append(self._headStereo)
+            elif noChannels == 4:
+                msg.append(self._headQuad)
+            for number in valid:
+                instrObj = self.getInstObj(number)
+                msg.append(instrObj.buildInstrDef(noChannels))
+            _orcSrcCache[key] = "".join(msg)
+        return self._orcTitle() + _orcSrcCache[key]
 
     def getInstInfo(self, iNo=None):
         """returns a dictionary of instrNo : (Name, pNo, pInfo)
@@ -321,6 +332,33 @@ nchnls = 4
     # 84 dB = 15848.926
     # 90 dB = 31622.764 (abs max around 32767)
 
+    def postMapFunc(self, iNo, pmtr, orcMapMode=1):
+        """
+        >>> a = CsoundNative()
+        >>> a.postMapFunc(6, 'amp')(.5)
+        45.0
+        >>> a.postMapFunc(6, 'pan', 0)(1.25)
+        0.25
+        """
+        if pmtr == "amp":
+            # get max amp value form inst once
+            ampMax = float(self.getInstObj(iNo).postMapAmp[1])
+
+            def postMap(val):
+                if orcMapMode:  # optional map; allow values greater then 1
+                    val = val * ampMax
+                # always limit
+                if val < 0:
+                    val = 0  # we can assume tt amps are never negative
+                return val
+
+            return postMap
+        elif pmtr == "pan":
+            return _limitPan
+        elif pmtr == "ps":
+            return pitchTools.psToPch
+        return baseOrc.Orchestra.postMapFunc(self, iNo, pmtr, orcMapMode)
+
     def _postMapPs(self, iNo, val):
         """
         >>> a = CsoundNative()
@@ -354,9 +392,7 @@ nchnls = 4
         if orcMapMode:  # optional map
             pass  # values are expected b/n 0 and 1
         # always limit: modulo 1
-        if val < 0 or val > 1:
-            val = val % 1.0
-        return val
+        return _limitPan(val)
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -404,12 +440,11 @@ class InstrumentCsound(baseOrc.Instrument):
         """returns a string of all the code needed for this instrument"""
         orcString = self.getInstrHeader()
         orcString = orcString + self.orcCode
-        self.noChannels = noChannels
-        if self.noChannels == 1:
+        if noChannels == 1:
             orcString = orcString + self.monoOutput
-        elif self.noChannels == 2:
+        elif noChannels == 2:
             orcString = orcString + self.stereoOutput
-        elif self.noChannels == 4:
+        elif noChannels == 4:
             orcString = orcString + self.quadOutput
         return orcString
 
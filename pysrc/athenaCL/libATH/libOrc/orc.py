@@ -9,6 +9,7 @@
 # License:       GPL
 # -----------------------------------------------------------------||||||||||||--
 
+import importlib
 import unittest, doctest
 
 
@@ -17,12 +18,6 @@ from athenaCL.libATH import language
 
 lang = language.LangObj()
 
-from athenaCL.libATH.libOrc import csoundNative
-from athenaCL.libATH.libOrc import csoundExternal
-from athenaCL.libATH.libOrc import superColliderNative
-from athenaCL.libATH.libOrc import generalMidi
-from athenaCL.libATH.libOrc import baseOrc
-
 orcNames = {
     "g": "generic",
     "ce": "csoundExternal",
@@ -36,6 +31,22 @@ orcNames = {
 # orcIncompat delcared in baseOrc and included as internal attribute
 # for each orc
 
+# module and class name of each orchestra; modules are imported on first use,
+# as instrument libraries such as csoundNative are large
+orcClasses = {
+    "generic": ("baseOrc", "Orchestra"),  # only used wtih audioFile format
+    "csoundNative": ("csoundNative", "CsoundNative"),
+    "generalMidi": ("generalMidi", "GeneralMidi"),
+    "generalMidiPercussion": ("generalMidi", "GeneralMidiPercussion"),
+    "csoundSilence": ("csoundExternal", "CsoundSilence"),
+    "csoundExternal": ("csoundExternal", "CsoundExternal"),
+    "superColliderNative": ("superColliderNative", "SuperColliderNative"),
+}
+
+# one orchestra object per name, shared by all textures, parameters and
+# engines; orchestras hold no per-texture state and must not be modified
+_orcRegistry = {}
+
 
 # -----------------------------------------------------------------||||||||||||--
 def orcTypeParser(typeName):
@@ -47,24 +58,23 @@ def orcTypeParser(typeName):
 
 
 def factory(orcName):
+    """return the shared orchestra object for an orchestra name
+
+    >>> factory('gm').name
+    'generalMidi'
+    >>> factory('cn') is factory('csoundNative')
+    True
+    """
     orcName = orcTypeParser(orcName)
     assert orcName != None
-    if orcName == "generic":  # only used wtih audioFile format
-        return baseOrc.Orchestra()  # get the base orchestra
-    elif orcName == "csoundNative":
-        return csoundNative.CsoundNative()
-    elif orcName == "generalMidi":
-        return generalMidi.GeneralMidi()
-    elif orcName == "generalMidiPercussion":
-        return generalMidi.GeneralMidiPercussion()
-    elif orcName == "csoundSilence":
-        return csoundExternal.CsoundSilence()
-    elif orcName == "csoundExternal":
-        return csoundExternal.CsoundExternal()
-    elif orcName == "superColliderNative":
-        return superColliderNative.SuperColliderNative()
-    else:
+    if orcName in _orcRegistry:
+        return _orcRegistry[orcName]
+    if orcName not in orcClasses:
         raise ValueError("bad orchestra name: %s" % orcName)
+    modName, className = orcClasses[orcName]
+    mod = importlib.import_module("athenaCL.libATH.libOrc.%s" % modName)
+    _orcRegistry[orcName] = getattr(mod, className)()
+    return _orcRegistry[orcName]
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -108,6 +118,33 @@ class Test(unittest.TestCase):
                     post = a.getInstPreset(iNo)
             a.constructOrc()
 
+    def testShared(self):
+        import copy
+
+        a = factory("csoundNative")
+        self.assertTrue(a is factory("cn"))
+        self.assertTrue(copy.deepcopy(a) is a)
+        self.assertTrue(a.getInstObj(3) is factory("cn").getInstObj(3))
+
+    def testSharedAuxNo(self):
+        from athenaCL.libATH import athenaObj
+
+        a = factory("csoundExternal")
+        a.getInstPreset(3, 7)
+        self.assertEqual(a.getInstAuxNo(3), 1)
+
+        ai = athenaObj.Interpreter()
+        for cmd in ["EMo ce", "TIn a 3 2", "TIn b 3 7"]:
+            ok, msg = ai.cmd(cmd, errorMode="return")
+            self.assertTrue(ok)
+        self.assertEqual(ai.ao.textureLib["a"].auxNo, 2)
+        self.assertEqual(ai.ao.textureLib["b"].auxNo, 7)
+        for cmd in ["TIo a", "TIe i 4"]:
+            ok, msg = ai.cmd(cmd, errorMode="return")
+            self.assertTrue(ok)
+        self.assertEqual(ai.ao.textureLib["a"].auxNo, 1)
+        self.assertEqual(ai.ao.textureLib["b"].auxNo, 7)
+
 
 # -----------------------------------------------------------------||||||||||||--
 
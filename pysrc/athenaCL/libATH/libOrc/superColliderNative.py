@@ -24,6 +24,11 @@ from athenaCL.libATH import prefTools
 
 environment = prefTools.Environment(_MOD)
 
+# instrument objects, created on first access and shared by all orchestras
+_instrObjDict = {}
+# orchestra source for each (noChannels, instrument numbers)
+_orcSrcCache = {}
+
 
 class SuperColliderNative(baseOrc.Orchestra):
     """built-in csound instruments"""
@@ -32,20 +37,12 @@ class SuperColliderNative(baseOrc.Orchestra):
         baseOrc.Orchestra.__init__(self)
 
         self.name = "superColliderNative"
-        self.srcStr = None  # string representation for writing
 
         self._instrNumbers = [
             0,
             10,
         ]
 
-        # on initialization, load a dictionary of objects for use
-        self._instrObjDict = {}
-        globalDict = globals()
-        for iNo in self._instrNumbers:
-            objAttr = globalDict["Inst%i" % iNo]
-            self._instrObjDict[iNo] = objAttr()  # instantiate obj
-
     # -----------------------------------------------------------------------||--
     def instNoValid(self, iNo):
         """test if an instrument number is valid"""
@@ -62,30 +59,38 @@ class SuperColliderNative(baseOrc.Orchestra):
         return self._instrNumbers
 
     def getInstObj(self, iNo):
-        if iNo in list(self._instrObjDict.keys()):  # already loaded
-            return self._instrObjDict[iNo]  # call attribute of module to get object
+        if iNo in _instrObjDict:  # already loaded
+            return _instrObjDict[iNo]
+        elif iNo in self._instrNumbers:  # call attribute of module to get object
+            _instrObjDict[iNo] = globals()["Inst%i" % iNo]()
+            return _instrObjDict[iNo]
         else:
             raise ValueError("bad instrument number given: %s" % iNo)
 
     def constructOrc(self, noChannels=2, instList=None):
-        """buildes a string of an entire orchestra
+        """returns a string of an entire orchestra
         provides proper header and output sections based on
-        number of channels
+        number of channels; source for each channel count and
+        instrument list is built once and reused
         """
-        self.noChannels = noChannels
-        msg = []
-        # self.instrObjDict = {}
         if instList == None:  # if not given, add all instruments
             instList = self.instNoList()
+        valid = []
         for number in instList:
             if not self.instNoValid(number):
                 environment.printWarn(
                     [lang.WARN, "instrument %i not available." % number]
                 )
                 continue
-            instrObj = self.getInstObj(number)
-            msg.append(instrObj.buildInstrDef(noChannels))
-        self.srcStr = "".join(msg)
+            valid.append(number)
+        key = (noChannels, tuple(valid))
+        if key not in _orcSrcCache:
+            msg = []
+            for number in valid:
+                instrObj = self.getInstObj(number)
+                msg.append(instrObj.buildInstrDef(noChannels))
+            _orcSrcCache[key] = "".join(msg)
+        return _orcSrcCache[key]
 
     def getInstInfo(self, iNo=None):
         """returns a dictionary of instrNo : (Name, pNo, pInfo)
@@ -213,16 +218,14 @@ s.sendSynthDef("%s");
         >>> a.stereoOutput in post
         True
         """
-        self.noChannels = noChannels
-
         msg = []
         msg.append(self.getInstHeader())
         msg.append(self.orcCode)
-        if self.noChannels == 1:
+        if noChannels == 1:
             msg.append(self.monoOutput)
-        elif self.noChannels == 2:
+        elif noChannels == 2:
             msg.append(self.stereoOutput)
-        elif self.noChannels == 4:
+        elif noChannels == 4:
             msg.append(self.quadOutput)
         msg.append(self.getInstFooter())
         return "".join(msg)
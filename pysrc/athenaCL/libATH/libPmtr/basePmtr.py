@@ -463,6 +463,11 @@ class Parameter(object):
     def __call__(self, t=None, refDict=None):
         pass
 
+    def evaluate(self, tArray, refDict=None):
+        """return a list of values, one for each time in tArray, as if
+        called for each in order; subclasses may provide faster versions"""
+        return [self(t, refDict) for t in tArray]
+
     def reset(self):
         """reset any counters or order managers; always called before scoring"""
         pass
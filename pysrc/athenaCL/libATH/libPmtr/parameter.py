@@ -270,6 +270,60 @@ pmtrLibNames = {
     "f": "filterPmtrObjs",
 }
 
+
+# -----------------------------------------------------------------||||||||||||--
+# developer mode: if true, parameter modules are reloaded on every lookup,
+# permitting edits to parameter object source in a running session
+HOT_RELOAD = False
+
+
+def _buildTypeRegistry():
+    """for each library name, map lower-case acronyms and full names
+    to class names; None maps all libraries. earlier entries take precedence,
+    matching the order of a linear search of each name dictionary
+
+    >>> post = _buildTypeRegistry()
+    >>> post['rthmPmtrObjs']['ba'], post[None]['randomuniform']
+    ('binaryAccent', 'randomUniform')
+    """
+    post = {}
+    for libName, pmtrNames in (
+        ("genPmtrObjs", genPmtrNames),
+        ("rthmPmtrObjs", rthmPmtrNames),
+        ("textPmtrObjs", textPmtrNames),
+        ("clonePmtrObjs", clonePmtrNames),
+        ("filterPmtrObjs", filterPmtrNames),
+        (None, allPmtrNames),
+    ):
+        lookup = {}
+        for key, className in list(pmtrNames.items()):
+            lookup.setdefault(key, className)
+            lookup.setdefault(className.lower(), className)
+        post[libName] = lookup
+    return post
+
+
+def _buildClassRegistry():
+    """map capitalized class names to the first module in pmtrModules
+    that defines them
+
+    >>> post = _buildClassRegistry()
+    >>> post['RandomUniform'] == valueSingleOmde, post['Constant'] == valueSingle
+    (True, True)
+    """
+    post = {}
+    for name in allPmtrObjs:
+        objType = name[0].upper() + name[1:]
+        for mod in pmtrModules:
+            if hasattr(mod, objType):
+                post[objType] = mod
+                break
+    return post
+
+
+_pmtrTypeRegistry = _buildTypeRegistry()
+_pmtrClassRegistry = _buildClassRegistry()
+
 # -----------------------------------------------------------------||||||||||||--
 # parameter objects to add:
 
@@ -421,31 +475,13 @@ def pmtrTypeParser(typeName, libName="genPmtrObjs"):
     # print _MOD, 'pmtrTypeParser', typeName, libName
 
     usrStr = drawer.strScrub(typeName, "lower")
-    # get all parameter names in a dictionary
-    if libName == "genPmtrObjs":
-        pmtrNames = genPmtrNames
-    elif libName == "rthmPmtrObjs":
-        pmtrNames = rthmPmtrNames
-    elif libName == "textPmtrObjs":
-        pmtrNames = textPmtrNames
-    elif libName == "clonePmtrObjs":
-        pmtrNames = clonePmtrNames
-    elif libName == "filterPmtrObjs":
-        pmtrNames = filterPmtrNames
-    elif libName == None:
-        pmtrNames = allPmtrNames
-
-    else:
+    if libName not in _pmtrTypeRegistry:
         raise error.ParameterObjectSyntaxError(
             "no parameter library named: %r" % libName
         )
-
-    for key in list(pmtrNames.keys()):
-        className = pmtrNames[key]
-        if usrStr == key:
-            return className
-        elif usrStr == className.lower():
-            return className
+    className = _pmtrTypeRegistry[libName].get(usrStr)
+    if className != None:
+        return className
     # if not mattched, raise an error
     raise error.ParameterObjectSyntaxError(
         "no parameter named %r in %s" % (usrStr, pmtrLibTitle(libName))
@@ -478,14 +514,17 @@ def locator(usrStr, libName=None):
             "name error: no parameter named %r" % usrStr
         )
     objType = objType[0].upper() + objType[1:]
-    modFound = None
-    # this actually looks through external module files
-    for mod in pmtrModules:  # look through all mods for
-        reload(mod)
-        classList = dir(mod)
-        if objType in classList:
-            modFound = mod
-            break
+    if HOT_RELOAD:
+        modFound = None
+        # this actually looks through external module files
+        for mod in pmtrModules:  # look through all mods for
+            reload(mod)
+            classList = dir(mod)
+            if objType in classList:
+                modFound = mod
+                break
+    else:
+        modFound = _pmtrClassRegistry.get(objType)
     if modFound == None:  # failure
         raise error.ParameterObjectSyntaxError(
             "name error: no parameter named %r" % usrStr
@@ -504,7 +543,8 @@ def factory(rawArgs, libName=None, refDict=None):
     rawArgs is a list of python data types, starting with the po name
     exceptions that may be raised: error.ParameterObjectSyntaxError
     """
-    reload(basePmtr)  # reload base class
+    if HOT_RELOAD:
+        reload(basePmtr)  # reload base class
     if not drawer.isList(rawArgs):
         rawArgs = eval(drawer.restringulator(rawArgs))
         # if only string, we have only one argument, no commas
@@ -585,6 +625,19 @@ class Test(unittest.TestCase):
         for key, value in list(allPmtrNames.items()):
             post = factory(key)
 
+    def testClassRegistry(self):
+        self.assertEqual(len(_pmtrClassRegistry), len(allPmtrObjs))
+        for name in allPmtrObjs:
+            objType = name[0].upper() + name[1:]
+            mod = _pmtrClassRegistry[objType]
+            self.assertTrue(hasattr(mod, objType))
+            # no module before it in pmtrModules defines the class
+            for other in pmtrModules[: pmtrModules.index(mod)]:
+                self.assertFalse(hasattr(other, objType))
+        self.assertEqual(_pmtrClassRegistry["RandomUniform"], valueSingleOmde)
+        self.assertEqual(_pmtrClassRegistry["Constant"], valueSingle)
+        self.assertEqual(_pmtrClassRegistry["BinaryAccent"], rhythmSingle)
+
     # -----------------------------------------------------------------------||--
     def _parameterRunner(self, obj, count=10, refDict=None):
         """basic procedures for testing"""
@@ -965,6 +1018,24 @@ class Test(unittest.TestCase):
         args = ("breakPointPower", "e", "l", ((0, 0), (5, 1), (10, 0.5)), 2)
         self._parameterRunner(factory(args), 20)
 
+    def testBreakPointEvaluate(self):
+        # batch evaluation matches calling for each time in order
+        for args in (
+            ("breakPointLinear", "e", "l", ((0, 0), (5, 1), (10, 0.5))),
+            ("breakPointPower", "t", "s", ((0, 0), (5, 1), (10, 0.5)), 2),
+            ("breakGraphHalfCosine", "t", "l", ("bg", "rc", (1, 3)), ("ru", 0, 1), 6),
+            ("envelopeGeneratorUnit", "l", 3, ("c", 5), ("c", 0.5), ("c", 0.2), 0, 1),
+        ):
+            tArray = [x * 0.75 for x in range(40)]
+            obj = factory(args)
+            random.seed(3)
+            obj.reset()
+            post = [obj(t) for t in tArray]
+            random.seed(3)
+            obj.reset()
+            self.assertEqual(obj.evaluate(tArray), post)
+            self.assertEqual(obj.currentValue, post[-1])
+
     # -----------------------------------------------------------------------||--
     def testLineSegment(self):
         args = ("ls", "e", 10, 0, 5)
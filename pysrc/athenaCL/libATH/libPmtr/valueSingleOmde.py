@@ -706,9 +706,26 @@ class RandomWeibull(_RandomTwoArg):
         self.obj = rand.WeibullRandom(self.argA, self.argB)  # omde object
 
 
+# -----------------------------------------------------------------||||||||||||--
+class _BreakPointFunction(basePmtr.Parameter):
+    """base for ParameterObjects that get values from an omde break point
+    function in self.obj; if step is event, event counts are used as times"""
+
+    step = None
+
+    def evaluate(self, tArray, refDict=None):
+        if self.step == "event":  # if use events, not time
+            tArray = list(range(self.i, self.i + len(tArray)))
+            self.i = self.i + len(tArray)
+        valArray = self.obj.evaluate(tArray)
+        if valArray:
+            self.currentValue = valArray[-1]
+        return valArray
+
+
 # -----------------------------------------------------------------||||||||||||--
 # break point functions from omde
-class _BreakPoint(basePmtr.Parameter):
+class _BreakPoint(_BreakPointFunction):
     def __init__(self, args, refDict):
         basePmtr.Parameter.__init__(self, args, refDict)  # call base init
         self.type = None  # assigned in subclass
@@ -977,7 +994,7 @@ class BreakPointFlat(_BreakPoint):
 
 # -----------------------------------------------------------------||||||||||||--
 # dynamic break point functions from omde
-class _BreakGraph(basePmtr.Parameter):
+class _BreakGraph(_BreakPointFunction):
     def __init__(self, args, refDict):
         basePmtr.Parameter.__init__(self, args, refDict)  # call base init
         self.type = None  # assigned in subclass
@@ -1350,7 +1367,7 @@ class LineSegment(basePmtr.Parameter):
 #         return 1, '' # all good
 
 
-class EnvelopeGeneratorTrapezoid(basePmtr.Parameter):
+class EnvelopeGeneratorTrapezoid(_BreakPointFunction):
     def __init__(self, args, refDict):
         basePmtr.Parameter.__init__(self, args, refDict)  # call base init
         self.type = "envelopeGeneratorTrapezoid"
@@ -1544,7 +1561,7 @@ class EnvelopeGeneratorTrapezoid(basePmtr.Parameter):
 
 
 # -----------------------------------------------------------------||||||||||||--
-class EnvelopeGeneratorUnit(basePmtr.Parameter):
+class EnvelopeGeneratorUnit(_BreakPointFunction):
     def __init__(self, args, refDict):
         basePmtr.Parameter.__init__(self, args, refDict)  # call base init
         self.type = "envelopeGeneratorUnit"
@@ -1680,7 +1697,7 @@ class EnvelopeGeneratorUnit(basePmtr.Parameter):
 
 
 # -----------------------------------------------------------------||||||||||||--
-class EnvelopeGeneratorAdsr(basePmtr.Parameter):
+class EnvelopeGeneratorAdsr(_BreakPointFunction):
     def __init__(self, args, refDict):
         basePmtr.Parameter.__init__(self, args, refDict)  # call base init
         self.type = "envelopeGeneratorAdsr"
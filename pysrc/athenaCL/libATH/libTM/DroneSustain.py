@@ -29,6 +29,8 @@ class DroneSustain(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "DroneSustain"
+        # events only move earlier by the maximum time offset
+        self.timeOrdered = 1
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "maxTimeOffset",
@@ -67,6 +69,8 @@ class DroneSustain(baseTexture.Texture):
 
         # create a list of chords from the appropriate pitch mode
         for pathPos in self.getPathPos():
+            if self._windowEnded(tCurrent - abs(textMaxTimeOffset)):
+                break
             chordCurrent = self.getPitchGroup(pathPos)
             multisetCurrent = self.getMultiset(pathPos)
 
@@ -32,6 +32,8 @@ class HarmonicAssembly(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "HarmonicAssembly"
+        # events only move earlier by the maximum time offset
+        self.timeOrdered = 1
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "maxTimeOffset",
@@ -101,6 +103,8 @@ class HarmonicAssembly(baseTexture.Texture):
         self.gaussPmtrObj = parameter.factory(("randomGauss", 0.5, 0.1, -1, 1))
 
         while tCurrent < tEnd:
+            if self._windowEnded(tCurrent - abs(textMaxTimeOffset)):
+                break
             # takes absolute value, and proportionally weight toward nearest int
             # modulus of path length
             pathPos = (
@@ -135,6 +139,8 @@ class HarmonicAssembly(baseTexture.Texture):
             for k in range(multisetCount):
                 if tCurrent > tEnd:
                     break
+                if self._windowEnded(tCurrent - abs(textMaxTimeOffset)):
+                    break
 
                 # determine how many pitches in this simultaneity
                 # abs value, rounded to nearest integer
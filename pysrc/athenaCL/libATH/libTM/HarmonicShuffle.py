@@ -32,6 +32,8 @@ class HarmonicShuffle(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "HarmonicShuffle"
+        # events only move earlier by the maximum time offset
+        self.timeOrdered = 1
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "multisetSelectorControl",
@@ -96,6 +98,8 @@ class HarmonicShuffle(baseTexture.Texture):
         self.gaussPmtrObj = parameter.factory(("randomGauss", 0.5, 0.1, -1, 1))
 
         while tCurrent < tEnd:
+            if self._windowEnded(tCurrent - abs(textMaxTimeOffset)):
+                break
             pathPos = selectorMultisetPos()  # select path position
 
             chordCurrent = self.getPitchGroup(pathPos)
@@ -121,6 +125,8 @@ class HarmonicShuffle(baseTexture.Texture):
             for k in range(multisetCount):
                 if tCurrent > tEnd:
                     break
+                if self._windowEnded(tCurrent - abs(textMaxTimeOffset)):
+                    break
 
                 # create a selector to get pitches from chord as index values
                 # only need to create one for each chord
@@ -64,6 +64,8 @@ class InterpolateFill(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "InterpolateFill"
+        # events are interpolated after scoring; all must be stored
+        self.windowStore = 0
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "pitchSelectorControl",
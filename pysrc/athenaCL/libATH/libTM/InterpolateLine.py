@@ -62,6 +62,8 @@ class InterpolateLine(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "InterpolateLine"
+        # events are interpolated after scoring; all must be stored
+        self.windowStore = 0
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "pitchSelectorControl",
@@ -31,6 +31,8 @@ class LineCluster(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "LineCluster"
+        # parallel voice delays are never negative
+        self.timeOrdered = 1
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "parallelMotionList",
@@ -71,6 +73,8 @@ class LineCluster(baseTexture.Texture):
 
         # create a list of chords from the appropriate pitch mode
         for pathPos in self.getPathPos():
+            if self._windowEnded(tCurrent):
+                break
             chordCurrent = self.getPitchGroup(pathPos)
             multisetCurrent = self.getMultiset(pathPos)
 
@@ -89,7 +93,7 @@ class LineCluster(baseTexture.Texture):
                 octCurrent = self.getOct(tCurrent)  # choose OCTAVE
 
             while 1:  # PITCH in CHORD
-                if tCurrent >= tEndSet:
+                if tCurrent >= tEndSet or self._windowEnded(tCurrent):
                     break
 
                 bpm, pulse, dur, sus, acc = self.getRhythm(tCurrent)  # choose RHYTHM
@@ -111,16 +115,23 @@ class LineCluster(baseTexture.Texture):
                     octCurrent = self.getOct(tCurrent)  # choose OCTAVE
 
                 # subprocess psChord is a list of PCH's needed to make chord,
-                psChord = []
-                for pitchSpace in chordCurrent:
-                    if textFieldLevel == "voice":
-                        transCurrent = self.getField(tCurrent)  # choose PITCHFIELD
-                    if textOctaveLevel == "voice":
-                        octCurrent = self.getOct(tCurrent)  # choose OCTAVE
-                    psReal = pitchTools.psToTempered(
-                        pitchSpace, octCurrent, self.temperamentObj, transCurrent
+                if textFieldLevel == "voice" or textOctaveLevel == "voice":
+                    psChord = []
+                    for pitchSpace in chordCurrent:
+                        if textFieldLevel == "voice":
+                            transCurrent = self.getField(tCurrent)  # choose PITCHFIELD
+                        if textOctaveLevel == "voice":
+                            octCurrent = self.getOct(tCurrent)  # choose OCTAVE
+                        psReal = pitchTools.psToTempered(
+                            pitchSpace, octCurrent, self.temperamentObj, transCurrent
+                        )
+                        psChord.append(psReal)
+                else:  # temper the chord at once
+                    psChord = pitchTools.psListToTempered(
+                        chordCurrent, octCurrent, self.temperamentObj, transCurrent
                     )
-                    psChord.append(psReal)
+                    if chordCurrent:  # last voice, as after a loop
+                        pitchSpace = chordCurrent[-1]
 
                 # amp and pan done for each chord, not voice
                 amp = self.getAmp(tCurrent) * acc
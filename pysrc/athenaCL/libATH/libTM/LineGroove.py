@@ -26,6 +26,8 @@ class LineGroove(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "LineGroove"
+        # parallel voice delays are never negative
+        self.timeOrdered = 1
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "parallelMotionList",
@@ -63,6 +65,8 @@ class LineGroove(baseTexture.Texture):
 
         # create a list of chords from the appropriate pitch mode
         for pathPos in self.getPathPos():
+            if self._windowEnded(tCurrent):
+                break
             chordCurrent = self.getPitchGroup(pathPos)
             multisetCurrent = self.getMultiset(pathPos)
 
@@ -79,7 +83,7 @@ class LineGroove(baseTexture.Texture):
                 octCurrent = self.getOct(tCurrent)  # choose OCTAVE
 
             while 1:  # pitch in chord
-                if tCurrent >= tEndSet:
+                if tCurrent >= tEndSet or self._windowEnded(tCurrent):
                     break
                 # choose pc from chord
                 ps = chordCurrent[selectorChordPos()]  # get position w/n chord
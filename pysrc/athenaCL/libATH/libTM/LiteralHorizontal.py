@@ -29,6 +29,7 @@ class LiteralHorizontal(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "LiteralHorizontal"
+        self.timeOrdered = 1
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "loopWithinSet",
@@ -66,6 +67,8 @@ class LiteralHorizontal(baseTexture.Texture):
 
         # create a list of chords from the appropriate pitch mode
         for pathPos in self.getPathPos():
+            if self._windowEnded(tCurrent):
+                break
             chordCurrent = self.getPitchGroup(pathPos)
             multisetCurrent = self.getMultiset(pathPos)
 
@@ -84,7 +87,7 @@ class LiteralHorizontal(baseTexture.Texture):
                 octCurrent = self.getOct(tCurrent)  # choose OCTAVE
 
             while 1:  # PITCH in CHORD
-                if tCurrent >= tEndSet:
+                if tCurrent >= tEndSet or self._windowEnded(tCurrent):
                     break
 
                 ps = chordCurrent[chordIndex]  # choose PC from CHORD
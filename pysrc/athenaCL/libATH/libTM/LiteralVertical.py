@@ -31,6 +31,8 @@ class LiteralVertical(baseTexture.Texture):
         baseTexture.Texture.__init__(self, name)  # init base class
         self.author = "athenaCL native"
         self.tmName = "LiteralVertical"
+        # events only move earlier by the maximum time offset
+        self.timeOrdered = 1
         # will get defaults from object, order determines labels
         self.textPmtrNames = [
             "loopWithinSet",
@@ -79,6 +81,8 @@ class LiteralVertical(baseTexture.Texture):
         # used below now
         # create a list of chords from the appropriate pitch mode
         for pathPos in self.getPathPos():
+            if self._windowEnded(tCurrent - abs(textMaxTimeOffset)):
+                break
             chordCurrent = self.getPitchGroup(pathPos)
             multisetCurrent = self.getMultiset(pathPos)
 
@@ -105,6 +109,8 @@ class LiteralVertical(baseTexture.Texture):
                 else:  # sustain entire path over desired dur fraction
                     if tCurrent >= tEndSet:
                         break
+                if self._windowEnded(tCurrent - abs(textMaxTimeOffset)):
+                    break
 
                 # no ps yet found, give as None, get default
                 self.stateUpdate(
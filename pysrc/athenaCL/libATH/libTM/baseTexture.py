@@ -82,7 +82,7 @@ class Texture(object):
         self.doc = None  # from subclass
         self.mute = 0
 
-        self.esObj = eventList.EventSequence()  # greate a blank seq
+        self.esObj = eventList.eventSequenceFactory()  # greate a blank seq
         # this method will initialize all state variables and assign to none
         self.stateClear()
 
@@ -91,6 +91,10 @@ class Texture(object):
 
         # used to store data pased to parameter objects
         self.refDict = {}
+        # refDict is only refreshed from state attributes when dirty
+        self._refDictDirty = 1
+        # path list cached for the duration of a score; None when not scoring
+        self._statePathList = None
         # name parameter fields that are active
         # aux and text parameters cannot be turned off
         self.pmtrCommon = basePmtr.tCOMMONQ
@@ -98,6 +102,17 @@ class Texture(object):
 
         self.pmtrQDict = {}
         self.pmtrObjDict = {}
+        # pmtr objs that do post event processing, in priority order
+        # compiled once per score in _scorePre
+        self.postEventPmtrObjs = []
+        # if events outside of a time window can be dropped as generated;
+        # TMs that process stored events after generation must store all
+        self.windowStore = 1
+        # if events are generated in time order; TMs that set this check
+        # _windowEnded and stop scoring a time window after its end
+        self.timeOrdered = 0
+        # start and end times of events stored while scoring; None if all
+        self._scoreWindow = None
 
         self.auxNo = 0  # set with load
 
@@ -312,6 +327,7 @@ class Texture(object):
         # pitch final includes transposition and temperament
         # may be none if transposition has not been performed
         self.stateCurrentPitchPost = pitchPost
+        self._refDictDirty = 1
 
     def stateClear(self):
         """return to none of score is completed
@@ -325,6 +341,8 @@ class Texture(object):
         self.stateCurrentPitchRaw = None  # pitch space, from chord, data
         self.stateCurrentPitchObj = None  # pitch object
         self.stateCurrentPitchPost = None  # pitch post transposition, temperament
+        self._statePathList = None
+        self._refDictDirty = 1
         self._clockReset()
 
     #     def _updatePolyMode(self):
@@ -360,22 +378,35 @@ class Texture(object):
         passed to parameter objects with each call function
         allows pmtr obj to have access to global texture data
         may also provide a means for pmtr obj to communicate
+
+        the same dictionary is always returned; state values are only
+        rewritten after stateUpdate has been called, and the path list is
+        reused while scoring. outside of scoring, all values are refreshed
         """
+        if self._refDictDirty or self._statePathList == None:
+            self._updateRefDictState()
+        if self.pmtrObjDict["beatT"].currentValue == None:
+            bpm = self.pmtrObjDict["beatT"](t)  # get init value
+        else:  # get current value
+            bpm = self.pmtrObjDict["beatT"].currentValue
+        self.refDict["bpm"] = bpm
+        return self.refDict
+
+    def _updateRefDictState(self):
+        """write current state attributes into the refDict"""
         self.refDict["stateCurrentTime"] = self.stateCurrentTime
         self.refDict["stateCurrentChord"] = self.stateCurrentChord
         self.refDict["stateCurrentPitchRaw"] = self.stateCurrentPitchRaw
         self.refDict["stateCurrentMultiset"] = self.stateCurrentMultiset
         self.refDict["stateCurrentPitchObj"] = self.stateCurrentPitchObj
         self.refDict["stateCurrentPitchPost"] = self.stateCurrentPitchPost
-        self.refDict["statePathList"] = self._getPathList()
-        if self.pmtrObjDict["beatT"].currentValue == None:
-            bpm = self.pmtrObjDict["beatT"](t)  # get init value
-        else:  # get current value
-            bpm = self.pmtrObjDict["beatT"].currentValue
-        self.refDict["bpm"] = bpm
+        if self._statePathList == None:
+            self.refDict["statePathList"] = self._getPathList()
+        else:
+            self.refDict["statePathList"] = self._statePathList
         self.refDict["fpAudioDirs"] = self.fpAudioDirs
         # self.refDict['sadr'] = self.fpAudioAnalysisDirs
-        return self.refDict
+        self._refDictDirty = 0
 
     def getRefClone(self):  # get reference data for clone creation
         # note: do not store this dict
@@ -1314,6 +1345,19 @@ class Texture(object):
             nameList.append(name)
         return nameList
 
+    def _compilePostEvent(self):
+        """get pmtr objs, sorted by priority, that define post event processing
+        pmtr objs that inherit the base class postEvent do nothing and are
+        excluded; as priority is read here, any edit to a parameter or its
+        priority is reflected the next time a score is made
+        """
+        pmtrObjs = []
+        for name in self._sortPmtrObjPriority():
+            pmtrObj = self.pmtrObjDict[name]
+            if type(pmtrObj).postEvent is not basePmtr.Parameter.postEvent:
+                pmtrObjs.append(pmtrObj)
+        return pmtrObjs
+
     def _makeEventComment(self, strMsg=None):
         "make a comment as a tuple as the first element in a list"
         msg = [
@@ -1339,19 +1383,42 @@ class Texture(object):
         eventDict["ps"] = ps
         eventDict["pan"] = pan
         eventDict["aux"] = auxiliary  # a list
-        eventDict["comment"] = self._makeEventComment(comment)
+        if self._outsideWindow(tCurrent):  # will not be stored
+            eventDict["comment"] = []
+        else:
+            eventDict["comment"] = self._makeEventComment(comment)
         return eventDict
 
+    def _outsideWindow(self, t):
+        """true if scoring a time window, and an event starting at t is
+        outside of it"""
+        if self._scoreWindow == None:
+            return 0
+        return t < self._scoreWindow[0] or t >= self._scoreWindow[1]
+
+    def _windowEnded(self, t):
+        """true if scoring a time window in a TM that generates events in
+        time order, and events starting at t or later are after the window;
+        t must include any offset that may move later events earlier"""
+        if not self.timeOrdered or self._scoreWindow == None:
+            return 0
+        return t >= self._scoreWindow[1]
+
     def storeEvent(self, eventDict):
         """for writting a single event, one at a time
         all TM call this method to add an event to a score
         do postEvent processign for each event after sorting priority
+        if scoring a time window, events outside of it are not processed
+        or stored
         """
-        # do post processing
-        attrSort = self._sortPmtrObjPriority()
-        refDict = self.getRefDict()  # get once, as all at same time
-        for name in attrSort:  # call method in each obj from low to high priority
-            eventDict = self.pmtrObjDict[name].postEvent(eventDict, refDict)
+        if self._outsideWindow(eventDict["time"]):
+            return
+        # do post processing; skipped entirely if no pmtr obj needs it
+        if self.postEventPmtrObjs:
+            refDict = self.getRefDict()  # get once, as all at same time
+            # call method in each obj from low to high priority
+            for pmtrObj in self.postEventPmtrObjs:
+                eventDict = pmtrObj.postEvent(eventDict, refDict)
         self.esObj.append(eventDict)
 
     def _mergeEventDict(self, parent, child):
@@ -1368,6 +1435,8 @@ class Texture(object):
         """
         parentComment = self._makeEventComment(comment)
         for eventDict in subEventArray:
+            if self._outsideWindow(eventDict["time"]):
+                continue
             eventDict = self._mergeEventDict(parentEventDict, eventDict)
             # override parent comment with one provided from args
             eventDict["comment"] = self._makeEventComment(comment)
@@ -1396,6 +1465,9 @@ class Texture(object):
                 # reset all necessary variables before scoring
                 # do update dyn parameters
                 self.pmtrObjDict[pmtrName].reset()
+        self.postEventPmtrObjs = self._compilePostEvent()
+        # path and pitch mode do not change while scoring
+        self._statePathList = self._getPathList()
         self.esObj.updatePre()
 
     def _scoreMain(self):
@@ -1409,23 +1481,47 @@ class Texture(object):
         # absolute, calculated time range
         self.timeRangeAbs = self.esObj.getTimeRangeAbs()
 
-    def score(self):  # main method called for scoring
-        """
+    def score(self, tStart=None, tEnd=None):  # main method called for scoring
+        """score all events; if tStart or tEnd is given, only store events
+        that start in the time window from tStart up to tEnd
+        events before the window must still be generated, as parameter
+        objects may depend on every previous call; they are not commented,
+        post-event processed, or stored. TMs that generate events in time
+        order stop after the window. events in the window are the same
+        as those of a complete score
+
         >>> from athenaCL.libATH.libTM import texture
         >>> ti = texture.factory('lg')
         >>> ti.loadDefault()
         >>> ti.score()
         1
+        >>> ti.score(4, 8)
+        1
+        >>> min(ti.esObj.getArray('time')) >= 4
+        True
         """
+        window = None
+        if tStart != None or tEnd != None:
+            if tStart == None:
+                tStart = float("-inf")
+            if tEnd == None:
+                tEnd = float("inf")
+            window = tStart, tEnd
         self._scorePre()
+        if self.windowStore:
+            self._scoreWindow = window
         ok = self._scoreMain()
+        self._scoreWindow = None
+        if window != None and not self.windowStore:
+            self.esObj.window(tStart, tEnd)
         self._scorePost()
         return ok
 
     def getScore(self):
         """always returna copy of current esObj
-        this copy may be manipulated elsewhere, and thus must be unique"""
-        return self.esObj.copy()  # return copy of object
+        this copy may be manipulated elsewhere; a copy-on-write snapshot
+        is returned, so events are only copied if changed"""
+        return self.esObj.snapshot()
 
     def clearScore(self):
         # print _MOD, 'clearing score'
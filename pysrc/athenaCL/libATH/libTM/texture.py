@@ -66,6 +66,27 @@ tmNames = {
 
 tmObjs = list(tmNames.values())
 
+# developer mode: if true, texture modules are reloaded on every lookup,
+# permitting edits to texture module source in a running session
+HOT_RELOAD = False
+
+
+def _buildClassRegistry():
+    """map texture class names to the module that defines them
+
+    >>> _buildClassRegistry()['LineGroove'] == LineGroove
+    True
+    """
+    post = {}
+    for mod in textureModules:
+        for objType in tmObjs:
+            if objType not in post and hasattr(mod, objType):
+                post[objType] = mod
+    return post
+
+
+_tmClassRegistry = _buildClassRegistry()
+
 
 # -----------------------------------------------------------------||||||||||||--
 def tmTypeParser(typeName):
@@ -83,13 +104,16 @@ def tmTypeParser(typeName):
 
 def locator(usrStr):
     objType = tmTypeParser(usrStr)  # check type string
-    modFound = None
-    for mod in textureModules:  # look through all mods for
-        reload(mod)
-        classList = dir(mod)
-        if objType in classList:
-            modFound = mod
-            break
+    if HOT_RELOAD:
+        modFound = None
+        for mod in textureModules:  # look through all mods for
+            reload(mod)
+            classList = dir(mod)
+            if objType in classList:
+                modFound = mod
+                break
+    else:
+        modFound = _tmClassRegistry.get(objType)
     if modFound == None:
         raise ValueError("parameter type error: %s" % usrStr)  # failure
     return modFound, objType
@@ -105,7 +129,8 @@ def factory(tmName, name=None):
     <athenaCL.libATH.libTM.LineGroove.LineGroove...
     >>> a = factory('da')
     """
-    reload(baseTexture)  # reload base classs
+    if HOT_RELOAD:
+        reload(baseTexture)  # reload base classs
     mod, objType = locator(tmName)  # check type string
     if objType == None:
         raise ValueError("texture module type error")  # failure
@@ -140,6 +165,82 @@ class Test(unittest.TestCase):
         for key, name in list(tmNames.items()):
             post = factory(name)
 
+    def testScoreRefDict(self):
+        # the incrementally updated refDict must produce the same seeded
+        # scores as a refDict rebuilt on every access
+        import copy, random
+        from athenaCL.libATH import pitchPath
+        from athenaCL.libATH.omde import rand
+
+        def seededScore(name, rebuild):
+            path = pitchPath.PolyPath("test")
+            path.loadPsList([(0, 4, 7), (2, 5, 9, 11), (-3, 1)])
+            ti = factory(name, "test")
+            ti.loadDefault(3, path, refresh=0)
+            ti.editPmtrObj("rhythmQ", "ba,((4,1,1),(8,3,1))", refresh=0)
+            ti.editPmtrObj("ampQ", "ru,.2,.9", refresh=0)
+            if rebuild:
+
+                def getRefDictRebuilt(t=0):
+                    ti._refDictDirty = 1
+                    ti._statePathList = None
+                    return baseTexture.Texture.getRefDict(ti, t)
+
+                ti.getRefDict = getRefDictRebuilt
+            random.seed(42)
+            rand._the_same.seed(42)
+            ti.score()
+            return copy.deepcopy(ti.esObj.list())
+
+        for name in list(tmNames.values()):
+            post = seededScore(name, 0)
+            self.assertNotEqual(post, [])
+            self.assertEqual(post, seededScore(name, 1))
+
+    def testScoreWindow(self):
+        # a windowed score must have the events of the complete score that
+        # start in the window
+        import copy, random
+        from athenaCL.libATH import pitchPath
+        from athenaCL.libATH.omde import rand
+
+        def seededScore(name, window, textQ=None):
+            path = pitchPath.PolyPath("test")
+            path.loadPsList([(0, 4, 7), (2, 5, 9, 11), (-3, 1)])
+            ti = factory(name, "test")
+            ti.loadDefault(3, path, refresh=0)
+            ti.editPmtrObj("ampQ", "ru,.2,.9", refresh=0)
+            if textQ != None:
+                ok, msg = ti.editPmtrObj(textQ[0], textQ[1], refresh=0)
+                self.assertTrue(ok, msg)
+            # record the times of generated events
+            ti.tGenerated = []
+            getAmp = ti.getAmp
+            ti.getAmp = lambda t: ti.tGenerated.append(t) or getAmp(t)
+            random.seed(42)
+            rand._the_same.seed(42)
+            ti.score(*window)
+            return copy.deepcopy(ti.esObj.list()), ti
+
+        # time offsets can move events earlier; parallel voices later
+        textQ = {
+            "LineGroove": ("textQ0", ("parallelMotionList", [7, 12], 0.3)),
+            "LineCluster": ("textQ0", ("parallelMotionList", [7, 12], 0.3)),
+            "LiteralVertical": ("textQ1", ("maxTimeOffset", 0.4)),
+            "DroneSustain": ("textQ0", ("maxTimeOffset", 0.4)),
+            "HarmonicAssembly": ("textQ0", ("maxTimeOffset", 0.4)),
+            "HarmonicShuffle": ("textQ2", ("maxTimeOffset", 0.4)),
+        }
+        for name in list(tmNames.values()):
+            for text in [None, textQ.get(name)]:
+                post, ti = seededScore(name, (), text)
+                for tStart, tEnd in [(0, 3), (4.5, 9), (9, 1000)]:
+                    match = [e for e in post if tStart <= e["time"] < tEnd]
+                    postWindow, ti = seededScore(name, (tStart, tEnd), text)
+                    self.assertEqual(postWindow, match, name)
+                    # TMs in time order stop generating after the window
+                    if ti.timeOrdered and text == None and tEnd < 1000:
+                        self.assertTrue(max(ti.tGenerated) < tEnd + 3, name)
 
 # -----------------------------------------------------------------||||||||||||--
 if __name__ == "__main__":
@@ -8,7 +8,7 @@
 # License:       GPL
 # -----------------------------------------------------------------||||||||||||--
 
-import string, random
+import string, random, bisect
 import unittest, doctest
 
 from athenaCL.libATH import permutate
@@ -87,6 +87,8 @@ class Transition:
         # define valid symbol (name) characters
         # symbols may not include spaces, nor case
         self.SYM = string.ascii_lowercase + string.digits
+        # compiled weights, by symbol sequence; filled when first used
+        self._compiled = None
 
     # -----------------------------------------------------------------------||--
     def _sortWeightKey(self, dict):
@@ -273,6 +275,7 @@ class Transition:
 
         # note: this will remove all spaces in all keys and all values
 
+        self._compiled = None
         self._parseValidate(usrStr)
         usrStr = self._parseClean(usrStr)
 
@@ -405,6 +408,7 @@ class Transition:
         """given an ordered list, do analysis
         will do all orders from zero up to the order specified
         will always do a zero order analsys"""
+        self._compiled = None
         # order should not be greater than the length of the data
         if order >= len(data):
             order = len(data) - 1
@@ -616,6 +620,83 @@ class Transition:
                 wPost.append(w)
         return wPost, sDeclared
 
+    def _compile(self):
+        """prepare for generation: map values to symbols, and find cumulative
+        weights for every weight key that has no expressions; sequences
+        matched by expressions, or by no key, are compiled when first used
+        """
+        self._orderMax = self._ordersSrc[-1]
+        self._valueSymbol = {}
+        self._valueSymbolHashable = 1
+        for s, v in list(self._symbols.items()):
+            try:
+                self._valueSymbol.setdefault(v, s)  # first symbol defined wins
+            except TypeError:  # unhashable values must be searched
+                self._valueSymbolHashable = 0
+        self._compiled = {}
+        self._expressions = []  # in the order searched by _findWeights
+        for key in list(self._weightSrc.keys()):
+            for element in key:
+                if drawer.isList(element):  # its an expression
+                    self._expressions.append((key, self._compileExpression(key)))
+                    break
+            else:
+                try:
+                    self._compiled[key] = self._compileWeights(self._weightSrc[key])
+                except unit.UnitException:
+                    pass  # left to raise if used
+
+    def _compileExpression(self, label):
+        """given a weight label with expressions, return a list of pairs, one
+        for each position; each pair gives if the symbol must be in or not in
+        the operands that follow"""
+        post = []
+        for element in label:
+            if not drawer.isList(element):
+                post.append((1, (element,)))
+            elif element[0] == self.EXPRESSALL:  # match anything
+                post.append((0, ()))
+            elif element[0] == self.EXPRESSNOT:  # not supplied operand
+                post.append((0, (element[1],)))
+            elif element[0] == self.EXPRESSOR:  # match any operands
+                post.append((1, tuple(element[1:])))
+            else:
+                post.append((1, ()))  # match nothing
+        return post
+
+    def _findWeightsCompiled(self, srcSeq):
+        """as _findWeights, but with compiled expressions"""
+        if srcSeq in self._weightSrc:  # direct match
+            return self._weightSrc[srcSeq]
+        srcLen = len(srcSeq)
+        for label, post in self._expressions:
+            if len(post) != srcLen:
+                continue  # a def for a different order
+            for i in range(srcLen):
+                include, operands = post[i]
+                if (srcSeq[i] in operands) != include:
+                    break
+            else:
+                return self._weightSrc[label]
+        return None
+
+    def _compileWeights(self, wList):
+        """given a list of weights, or none, return a list of the upper
+        boundary of each weight but the last, and a parallel list of values"""
+        wPost, sDeclared = self._scrubWeights(wList)
+        bounds = unit.unitBoundaryProportion(wPost)
+        upper = [b for a, m, b in bounds[:-1]]
+        return upper, [self._symbols[s] for s in sDeclared]
+
+    def _compiledToSymbolList(self, valueList):
+        """convert values to a tuple of symbols with the compiled table"""
+        if not self._valueSymbolHashable:
+            return self._valueListToSymbolList(valueList)
+        try:
+            return tuple([self._valueSymbol[v] for v in valueList])
+        except (KeyError, TypeError):
+            return self._valueListToSymbolList(valueList)  # raises ValueError
+
     def next(self, unitVal, previous, order, slide=1):
         """generate the next value of the a new chain
         unitVal is floating point number b/n 0 and 1; can be generated
@@ -625,34 +706,38 @@ class Transition:
         next available order, otherwise, will use zero order
         order may be a float; if so it will use weighting from drawer
         """
-        symbols = list(self._symbols.keys())
+        if self._compiled is None:
+            self._compile()
         # get appropriate order: if a float, will be dynamically allocated
         order = drawer.floatToInt(order, "weight")
-        if order not in list(range(0, self._ordersSrc[-1] + 1)):
-            order = self._ordersSrc[-1]  # use highest defined
+        if order < 0 or order > self._orderMax:
+            order = self._orderMax  # use highest defined
         # print _MOD, 'using order', order
         # get appropriate key of given length of previous
         prevLen = len(previous)
         if prevLen <= order:  # if less then specified by order
             if slide:  # use length as order
-                srcSeq = self._valueListToSymbolList(previous)
+                srcSeq = self._compiledToSymbolList(previous)
             else:
                 srcSeq = ()  # jump to zeroth
         else:  # if values are greater in length than order
             if order == 0:
                 srcSeq = ()
             else:
-                srcSeq = self._valueListToSymbolList(previous[-order:])
-        # determine of there is a direct match, or an expression match
-        wList = self._findWeights(srcSeq)  # may return None
-        # if none, will create equal distribution of all symbols
-        # return parallel lists of weights, symbols, both in same order
-        wPost, sDeclared = self._scrubWeights(wList)
-        # print _MOD, 'order, wPost, sDeclared', order, wPost, sDeclared
-        boundary = unit.unitBoundaryProportion(wPost)
-        i = unit.unitBoundaryPos(unitVal, boundary)
-        # get symbol, then de-signify symbols into the store value
-        return self._symbols[sDeclared[i]]
+                srcSeq = self._compiledToSymbolList(previous[-order:])
+        try:
+            upper, values = self._compiled[srcSeq]
+        except KeyError:
+            # determine of there is an expression match; may return None
+            # if none, will create equal distribution of all symbols
+            upper, values = self._compileWeights(self._findWeightsCompiled(srcSeq))
+            self._compiled[srcSeq] = upper, values
+        # select by position of unitVal w/n the weight boundaries
+        if unitVal < 0 or unitVal > 1:  # must be normalized
+            raise unit.UnitException("value (%s) must be in unit interval" % unitVal)
+        if unitVal == 1:
+            return values[-1]
+        return values[bisect.bisect_right(upper, unitVal)]
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -854,6 +939,35 @@ class Test(unittest.TestCase):
                     val = random.random()
                     a.next(val, msg, order)
 
+    def testNextCompiled(self):
+        def nextSearch(a, unitVal, previous, order):
+            # select without compiled tables, searching all weights
+            order = min(order, a.getOrderMax())
+            if len(previous) > order:
+                previous = previous[-order:] if order else []
+            wList = a._findWeights(a._valueListToSymbolList(previous))
+            wPost, sDeclared = a._scrubWeights(wList)
+            boundary = unit.unitBoundaryProportion(wPost)
+            return a._symbols[sDeclared[unit.unitBoundaryPos(unitVal, boundary)]]
+
+        for test in [
+            "a{x} b{y} c{z} :{a=3|b=.03|c=5} a:{a=1|b=5|c=4} b{a=2|b=2|c=6}",
+            "a{a} b{b} c{c} :{a=3|b=3} *:-c:{c=1} a:a|b|c:{c=1}",
+            "a{a} b{b} c{c} a:c|b:a{c=1} b:c|a:b{a=1} c:-c:c{b=1}",
+        ]:
+            a = Transition()
+            a.loadTransition(test)
+            for order in range(0, 3):
+                msg = []
+                for val in [0, 1, 0.5] + [random.random() for x in range(60)]:
+                    post = a.next(val, msg, order)
+                    self.assertEqual(post, nextSearch(a, val, msg, order))
+                    msg.append(post)
+
+        a = Transition()
+        a.loadTransition("a{a} b{b} :{a=1|b=1}")
+        self.assertRaises(unit.UnitException, a.next, 1.5, [], 0)
+
 
 # -----------------------------------------------------------------||||||||||||--
 
@@ -13,7 +13,8 @@
 # License:       GPL
 # -----------------------------------------------------------------||||||||||||--
 
-import copy
+import heapq
+import struct
 import unittest
 import codecs
 
@@ -46,16 +47,19 @@ def decimalProgramChange(ch=0):
 
 
 # -----------------------------------------------------------------||||||||||||--
-# midi number packing routines.
+# midi number packing routines; all return bytes
 def intToWord(x):
-    """Convert a 2 byte MSB LSB value."""
-    x = int(x)
-    return chr(x >> 8 & 0xFF) + chr(x & 0xFF)
+    """Convert a 2 byte MSB LSB value.
+
+    >>> intToWord(258)
+    b'\\x01\\x02'
+    """
+    return struct.pack(">H", int(x) & 0xFFFF)
 
 
 def intToLong(x):
     """Convert an int to a 4 byte MSB...LSB value."""
-    return intToWord(int(x) >> 16) + intToWord(int(x))
+    return struct.pack(">L", int(x) & 0xFFFFFFFF)
 
 
 def intTo3Byte(x):
@@ -65,14 +69,31 @@ def intTo3Byte(x):
 
 
 def intToVarNumber(x):
-    """Convert an int to a variable length midi value."""
-    lst = chr(x & 0x7F)
+    """Convert an int to a variable length midi value.
+
+    >>> intToVarNumber(0), intToVarNumber(128), intToVarNumber(0x0FFFFFFF)
+    (b'\\x00', b'\\x81\\x00', b'\\xff\\xff\\xff\\x7f')
+    """
+    lst = [x & 0x7F]
     while 1:
         x = x >> 7
         if x:
-            lst = chr((x & 0x7F) | 0x80) + lst
+            lst.insert(0, (x & 0x7F) | 0x80)
         else:
-            return lst
+            return bytes(lst)
+
+
+# variable length values of the most common deltas, up to two bytes long;
+# created when first needed
+_VAR_NUMBER_COUNT = 0x4000
+_varNumbers = None
+
+
+def _getVarNumbers():
+    global _varNumbers
+    if _varNumbers == None:
+        _varNumbers = [intToVarNumber(x) for x in range(_VAR_NUMBER_COUNT)]
+    return _varNumbers
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -121,16 +142,28 @@ class MidiPart:
         return durTicks
 
     def score(self, noteList):  # , ctable):
-        """write music data to mtracks."""
+        """write music data to mtracks.
+        noteList may be any iterable sorted by start time; notes are read
+        only as the track is written"""
+        track = self.mtrks[self.channel]
+        track.addStream(self._iterScore(track, noteList, self.chShare, self.initOffset))
+
+    def _iterScore(self, track, noteList, chShare, initOffset):
+        """yield (offset, event) pairs sorted by offset; events at the same
+        offset are in the order created. only note offs are held until
+        written, so memory use depends on the number of sounding notes"""
+        pending = []  # heap of (offset, order created, event)
+        count = 0
         # one program change per score only if not > 1 track using this ch
-        if not self.chShare:  # if not shareing, do pgm change now
-            self.mtrks[self.channel].addProgChange(self.initOffset, self.pgm)
+        if not chShare:  # if not shareing, do pgm change now
+            yield max(initOffset, 0), track.progChange(self.pgm)
 
         # list form: startT, noteDur, notVol, notNum,
         for line in noteList:
             # offset is the event start time, converted to ticks
             offset = self.getNoteLen(line[0])  # convert seconds to ticks
-            offset = offset + self.initOffset  # add inti offset to all t values
+            offset = offset + initOffset  # add inti offset to all t values
+            offset = max(offset, 0)
 
             dur = self.getNoteLen(line[1])  # convert seconds to ticks
             vol = line[2]  # velocity
@@ -139,11 +172,20 @@ class MidiPart:
 
             if vol == 0:
                 continue  # dont add 0 velocities
+            # note offs created before this note, at or before this offset
+            while pending and pending[0][0] <= offset:
+                event = heapq.heappop(pending)
+                yield event[0], event[2]
             # subtract on tick from pgm offset to give change time
-            if self.chShare:  # if true, other insts are using this channel
-                self.mtrks[self.channel].addProgChange(offset, self.pgm)
-            self.mtrks[self.channel].addPan(offset, pan)  # add pan
-            self.mtrks[self.channel].addPairToTrack(offset, dur, mpc, vol)
+            if chShare:  # if true, other insts are using this channel
+                yield offset, track.progChange(self.pgm)
+            yield offset, track.pan(pan)  # add pan
+            yield offset, track.noteOn(mpc, vol)
+            heapq.heappush(pending, (max(offset + dur, 0), count, track.noteOn(mpc, 0)))
+            count = count + 1
+        while pending:
+            event = heapq.heappop(pending)
+            yield event[0], event[2]
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -154,6 +196,8 @@ class MidiTrack:
         # this dictionary stores dictionary pairs of time offsets and events
         # processed with writeMidiTrack
         self.miditrk = {}
+        # iterators of (offset, event) pairs, merged w/ miditrk when written
+        self.streams = []
         self.channel = channel - 1  # off by one correction
         self.trkName = ""  # name is given by first inst to use this ch.
 
@@ -176,6 +220,35 @@ class MidiTrack:
         else:
             self.miditrk[offset] = [event]
 
+    def addStream(self, stream):
+        """Add an iterator of (offset, event) pairs, sorted by offset.
+        When written, events at the same offset are in the order added, w/
+        events added with addToTrack first.
+        """
+        self.streams.append(stream)
+
+    def _iterEvents(self):
+        """Yield all (offset, event) pairs in the order written."""
+        direct = []
+        for offset in sorted(self.miditrk.keys()):
+            for event in self.miditrk[offset]:
+                direct.append((offset, event))
+        # merge is stable: ties are taken from earlier iterables first
+        return heapq.merge(direct, *self.streams, key=lambda pair: pair[0])
+
+    def progChange(self, program):
+        """Return a packed midi program change."""
+        return bytes((0xC0 | self.channel, program))
+
+    def pan(self, v):
+        """Return a packed midi pan controller."""
+        return bytes((0xB0 | self.channel, 0x0A, v))
+
+    def noteOn(self, note, v):
+        """Return a packed midi note on; a velocity of 0 is a note off."""
+        # a ValueError will be rause if note is beyond a byte
+        return bytes((0x90 | self.channel, note, v))
+
     def addTimeSig(self, offset, nn, dd, cc, bb):
         """Create a midi time signature.
         delta - midi delta offset
@@ -183,27 +256,24 @@ class MidiTrack:
         dd - sig denominator, 2=quarter note, 3=eighth,
         cc - midi clocks/tick
         bb - # of 32nd notes in quarter (normally 8)
-        returns - packed string
+        returns - packed bytes
         """
-        self.addToTrack(
-            offset,
-            chr(0xFF) + chr(0x58) + chr(0x04) + chr(nn) + chr(dd) + chr(cc) + chr(bb),
-        )
+        self.addToTrack(offset, bytes((0xFF, 0x58, 0x04, nn, dd, cc, bb)))
 
     def addText(self, offset, msg):
         """Create a midi TextEvent."""
-        self.addToTrack(offset, chr(0xFF) + chr(0x01) + intToVarNumber(len(msg)) + msg)
+        self.addToTrack(offset, b"\xff\x01" + intToVarNumber(len(msg)) + b(msg))
 
     def addTrkName(self, offset, msg):
         """Creates a midi track name event."""
-        self.addToTrack(offset, chr(0xFF) + chr(0x03) + intToVarNumber(len(msg)) + msg)
+        self.addToTrack(offset, b"\xff\x03" + intToVarNumber(len(msg)) + b(msg))
 
     def addProgChange(self, offset, program):
         """Create a midi program change.
         program - midi program
-        Returns - packed string
+        Returns - packed bytes
         """
-        self.addToTrack(offset, chr(0xC0 | self.channel) + chr(program))
+        self.addToTrack(offset, self.progChange(program))
 
     def addGlis(self, offset, v):
         """Set the portamento. LowLevel MIDI.
@@ -211,75 +281,81 @@ class MidiTrack:
         then sets the LSN rate.
         """
         if v == 0:
-            self.addToTrack(offset, chr(0xB0 | self.channel) + chr(0x41) + chr(0x00))
+            self.addToTrack(offset, bytes((0xB0 | self.channel, 0x41, 0x00)))
         else:
-            self.addToTrack(offset, chr(0xB0 | self.channel) + chr(0x41) + chr(0x7F))
-            self.addToTrack(offset, chr(0xB0 | self.channel) + chr(0x05) + chr(v))
+            self.addToTrack(offset, bytes((0xB0 | self.channel, 0x41, 0x7F)))
+            self.addToTrack(offset, bytes((0xB0 | self.channel, 0x05, v)))
 
     def addPan(self, offset, v):
         """Set the lsb of the pan setting
         controller 10"""
         # v = int(v) # make sure pan is an int
-        self.addToTrack(offset, chr(0xB0 | self.channel) + chr(0x0A) + chr(v))
+        self.addToTrack(offset, self.pan(v))
 
     # this should be the master volume for the channel
     def addChannelVol(self, offset, v):
         """Set the midi channel volume.
         controller 7"""
         # v = int(v) # make sure int
-        self.addToTrack(offset, chr(0xB0 | self.channel) + chr(0x07) + chr(v))
+        self.addToTrack(offset, bytes((0xB0 | self.channel, 0x07, v)))
 
     def addTempo(self, offset, beats):
         """Create a midi tempo meta event.
         beats - beats per second
-        Return - packed midi string
+        Return - packed midi bytes
         """
-        self.addToTrack(
-            offset, chr(0xFF) + chr(0x51) + chr(0x03) + intTo3Byte(60000000 / beats)
-        )
+        self.addToTrack(offset, b"\xff\x51\x03" + intTo3Byte(60000000 / beats))
 
     def addPairToTrack(self, offset, duration, note, v):
         """Add a note on/off pair to a track."""
         # note = int(note) # double check these are integers
         # v = int(v)
-        # a ValueError will be rause if note is beyond chr's ability
-        st = chr(0x90 | self.channel) + chr(note)
-        self.addToTrack(offset, st + chr(v))
-        self.addToTrack(offset + duration, st + chr(0))
-
-    def writeMidiTrack(self, out):
-        # Create the track. We convert timing offsets to midi-deltas.
-        # This is done in-memory so we can determine the size which
-        # is put in before the data.
-        out.write(b("MTrk"))
-        sizePt = out.tell()
-        out.write(b(intToLong(0)))  # dummy, redo at end
-
-        dataPt = out.tell()
-        trkKeys = list(self.miditrk.keys())  # the keys are the midi timing offset
-        trkKeys.sort()
-
+        self.addToTrack(offset, self.noteOn(note, v))
+        self.addToTrack(offset + duration, self.noteOn(note, 0))
+
+    def encode(self, runningStatus=False):
+        """Return the complete track chunk as a bytearray, converting timing
+        offsets to midi-deltas, and the number of distinct timing offsets.
+        With runningStatus, the status byte of a channel event is omitted
+        if it is the same as that of the previous event; meta events
+        cancel running status.
+        """
+        varNumbers = _getVarNumbers()
+        data = bytearray(b"MTrk\x00\x00\x00\x00")  # size is set at end
         last = 0
-        for tOffset in trkKeys:
+        offsetCount = 0
+        status = None
+        for tOffset, eventData in self._iterEvents():
             delta = tOffset - last
-            if delta < 0:
-                delta = 0
-            # get all event data from this point
-            for eventData in self.miditrk[tOffset]:
-                out.write(b(intToVarNumber(delta)))
-                out.write(b(eventData))
+            if delta > 0 or offsetCount == 0:
+                offsetCount = offsetCount + 1
+            elif delta < 0:
                 delta = 0
-            last = copy.copy(tOffset)
+            if delta < _VAR_NUMBER_COUNT:
+                data += varNumbers[delta]
+            else:
+                data += intToVarNumber(delta)
+            if eventData[0] == status:
+                data += eventData[1:]
+            else:
+                data += eventData
+                if runningStatus and eventData[0] < 0xF0:
+                    status = eventData[0]
+                else:
+                    status = None
+            last = tOffset
 
         # Add an EOF to the track
-        out.write(b(intToVarNumber(0)))
-        out.write(b(chr(0xFF) + chr(0x2F) + chr(0x00)))
-
-        totsize = out.tell() - dataPt
-        out.seek(sizePt)
+        data += b"\x00\xff\x2f\x00"
+        struct.pack_into(">L", data, 4, len(data) - 8)
+        return data, offsetCount
 
-        out.write(b(intToLong(totsize)))
-        out.seek(0, 2)
+    def writeMidiTrack(self, out, runningStatus=False):
+        """Write the track in a single buffer. Returns the number of
+        distinct timing offsets."""
+        data, offsetCount = self.encode(runningStatus)
+        out.write(data)
+        return offsetCount
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -290,9 +366,15 @@ class MidiTrack:
 
 
 class MidiScore:
-    def __init__(self, trackList=None, fileName="athenaCL midi", tempo=120):
-        """auto assign channels if none are given"""
+    def __init__(
+        self, trackList=None, fileName="athenaCL midi", tempo=120, runningStatus=False
+    ):
+        """auto assign channels if none are given
+        one track is written for each channel; parts sharing a channel are
+        merged into one track. runningStatus omits repeated status bytes;
+        it is off by default, as it changes the bytes of every file"""
         self.trackList = trackList
+        self.runningStatus = runningStatus
         self.maxCh = 16  # maximum channel assignment allowed
         self.mtrks = {}  # dict lives here, pased it inst class for writting
 
@@ -364,30 +446,27 @@ class MidiScore:
         self._setChShareFlags()  # if more than on trk per channel try to fix
         # this may raise an exception, OSError or IOError
         f = open(filePath, "wb")  # get file obj named f
-        # count tracks; needed for header
         mtrkKeys = list(self.mtrks.keys())
         mtrkKeys.sort()
+        # Write Midi file header; track count is rewritten at end
+        f.write(self._header(1))
+        # Write meta track
+        self.mtrks[0].writeMidiTrack(f, self.runningStatus)
         trackCount = 1  # account for meta track
+        # Write the remaining tracks, each encoded in memory
         for n in mtrkKeys[1:]:  # check all but 0 (meta)
-            if len(self.mtrks[n].miditrk) > 1:
+            data, offsetCount = self.mtrks[n].encode(self.runningStatus)
+            # tracks w/ events at only one time are not written
+            if offsetCount > 1:
+                f.write(data)
                 trackCount = trackCount + 1
-        # Write Midi file header.
-        headerStr = (
-            "MThd"
-            + intToLong(6)
-            + intToWord(1)
-            + intToWord(trackCount)
-            + intToWord(self.tickPerBeat)
-        )
-        f.write(b(headerStr))
-        # Write meta track
-        self.mtrks[0].writeMidiTrack(f)
-        # Write the remaining tracks
-        for n in mtrkKeys[1:]:
-            if len(self.mtrks[n].miditrk) > 1:
-                self.mtrks[n].writeMidiTrack(f)
+        f.seek(0)
+        f.write(self._header(trackCount))
         f.close()  # close file
 
+    def _header(self, trackCount):
+        return b"MThd" + struct.pack(">LHHH", 6, 1, trackCount, self.tickPerBeat)
+
 
 # -----------------------------------------------------------------||||||||||||--
 class Test(unittest.TestCase):
@@ -433,6 +512,84 @@ class Test(unittest.TestCase):
         )
         a = MidiScore(trackList)
 
+    def testWriteStream(self):
+        import os, tempfile
+
+        scoreA = [(0, 0.5, 90, 60, 60), (0.5, 0, 90, 61, 60), (0.5, 1, 0, 62, 60)]
+        scoreB = [(0.25, 0.25, 100, 70, 10), (0.5, 0.5, 100, 71, 10)]
+        fp = os.path.join(tempfile.gettempdir(), "athenaTestMidi.mid")
+        post = []
+        # notes may be provided as lists or as iterators
+        for a, b in ((scoreA, scoreB), (iter(scoreA), iter(scoreB))):
+            # both parts share a channel; a third part is empty
+            trackList = (("a", 0, 2, a), ("b", 1, 2, b), ("c", 0, 3, []))
+            MidiScore(trackList, runningStatus=False).write(fp)
+            f = open(fp, "rb")
+            post.append(f.read())
+            f.close()
+        os.remove(fp)
+        self.assertEqual(post[0], post[1])
+        # meta track and one note track; the empty track is not written
+        self.assertEqual(post[0][10:12], b"\x00\x02")
+        self.assertEqual(post[0].count(b"MTrk"), 2)
+        # note offs at 0.5 precede pan and note on at the same time
+        noteOff = b"\x91\x3c\x00"
+        pan = b"\xb1\x0a\x3c"
+        self.assertTrue(post[0].index(noteOff) < post[0].index(pan + b"\x00\x91\x3d"))
+
+    def testRunningStatus(self):
+        import os, tempfile
+
+        def readEvents(data):
+            """return a list of (tick, status, data bytes) for each track"""
+            tracks = []
+            pos = 14
+            while pos < len(data):
+                self.assertEqual(data[pos : pos + 4], b"MTrk")
+                end = pos + 8 + struct.unpack(">L", data[pos + 4 : pos + 8])[0]
+                pos = pos + 8
+                tick = 0
+                status = None
+                events = []
+                while pos < end:
+                    delta = 0
+                    while data[pos] & 0x80:
+                        delta = (delta << 7) | (data[pos] & 0x7F)
+                        pos = pos + 1
+                    delta = (delta << 7) | data[pos]
+                    tick = tick + delta
+                    pos = pos + 1
+                    if data[pos] & 0x80:  # a new status
+                        status = data[pos]
+                        pos = pos + 1
+                    if status == 0xFF:  # meta: type, length, data
+                        size = data[pos + 1]
+                        events.append((tick, status, data[pos : pos + 2 + size]))
+                        pos = pos + 2 + size
+                        status = None
+                    else:
+                        size = 1 if status & 0xF0 in (0xC0, 0xD0) else 2
+                        events.append((tick, status, data[pos : pos + size]))
+                        pos = pos + size
+                tracks.append(events)
+            return tracks
+
+        scoreA = [(x * 0.25, 0.5, 90, 60 + x % 12, 64) for x in range(200)]
+        scoreB = [(x * 0.5, 10, 80, 40, x % 128) for x in range(100)]
+        trackList = (("a", 0, None, scoreA), ("b", 4, None, scoreB))
+        fp = os.path.join(tempfile.gettempdir(), "athenaTestMidi.mid")
+        post = []
+        for runningStatus in (False, True):
+            MidiScore(trackList, runningStatus=runningStatus).write(fp)
+            f = open(fp, "rb")
+            post.append(f.read())
+            f.close()
+        os.remove(fp)
+        self.assertTrue(len(post[1]) < len(post[0]))
+        tracks = readEvents(post[0])
+        self.assertEqual(len(tracks), 3)  # meta track and one per channel
+        self.assertEqual(tracks, readEvents(post[1]))
+
 
 # -----------------------------------------------------------------||||||||||||--
 if __name__ == "__main__":
@@ -155,6 +155,35 @@ def psSetToMason(chord):
 
 # -----------------------------------------------------------------||||||||||||--
 # utility to calculate normal form
+
+# normal form of all 4096 pc sets, indexed by a bit for each pc; and the icv
+# and z relation of each scTriple; built when first used
+_normalTable = None
+_scTable = None
+
+
+def _normalTableGet():
+    """return a list of the scTriple and transposition of every pc set,
+    indexed by the sum of 2**pc for each pc in the set; index 0 is None"""
+    global _normalTable, _scTable
+    if _normalTable == None:
+        normalTable = [None]
+        scTable = {}
+        for mask in range(1, 4096):
+            chord = [pc for pc in range(12) if mask & (1 << pc)]
+            if len(chord) == 1:
+                normData = (1, 1, 0), chord[0]
+            else:
+                normData = _findNormalSearch(chord, FORTE)
+            normalTable.append(normData)
+            scTriple = normData[0]
+            if scTriple not in scTable:
+                scTable[scTriple] = forteToIcv(scTriple), forteToZData(scTriple)
+        _scTable = scTable
+        _normalTable = normalTable
+    return _normalTable
+
+
 def findNormalT(pcSet, setMatrix=None):
     """finds normal form of any pc set and returns forte number
     as a scTriple data structure, and transposition from normal form
@@ -184,27 +213,26 @@ def findNormalT(pcSet, setMatrix=None):
         pcVal = pitchTools.roundMicro(pcSet[0])
         return MONADscTuple, (pcVal % 12)
 
-    # scrub and go
-    pcSetClone = []
-    for psReal in pcSet:  # pcSet may contian psReal, w/ floating values
-        pcSetClone.append(pitchTools.roundMicro(psReal))
-    # check fr non base 12 numbers, negative numbers, redundancies
-    pcSetClone = list(pcSetTransposer(pcSetClone, 0))
-    pcSetClone.sort()
-
-    i = 0
-    chord = []
-    for i in range(0, 12):  # remove redundancies
-        if i in pcSetClone:
-            chord.append(i)
-    card = len(chord)
+    # scrub and go; pcSet may contian psReal, w/ floating values
+    # one bit for each pitch class removes octaves and redundancies
+    mask = 0
+    for psReal in pcSet:
+        mask = mask | (1 << (pitchTools.roundMicro(psReal) % 12))
+    card = bin(mask).count("1")
     if card < 1:  # monad has already been filtered out
         return None  # 2nd no is transposition from 0
     if card == 1:  # this is a set like (3,3,3,3)
         return MONADscTuple, (pcSet[0] % 12)
-    elif card > 12:
-        return None  # 'irrational cardinality error'
+    if setMatrix is FORTE:
+        return _normalTableGet()[mask]
+    chord = [pc for pc in range(12) if mask & (1 << pc)]
+    return _findNormalSearch(chord, setMatrix)
+
 
+def _findNormalSearch(chord, setMatrix):
+    """find normal form of an ordered list of two or more unique pitch classes
+    by testing each rotation against each set of the same cardinality"""
+    card = len(chord)
     rotIndices = list(range(0, card))
     foundIndex = None  # control variable
     for rot in rotIndices:
@@ -254,6 +282,41 @@ def findNormal(pcSet, setMatrix=None):
     return scTuple
 
 
+def findNormalData(pcSet):
+    """find the scTriple, transposition, icv, and z relation scTriple (or
+    None) of any pc set; returns None if a normal form cannot be found
+
+    >>> findNormalData([2,7,9])
+    ((3, 9, 0), 2, (0, 1, 0, 0, 2, 0), None)
+    >>> findNormalData([0,1,4,6])
+    ((4, 15, 1), 0, (1, 1, 1, 1, 1, 1), (4, 29, 1))
+    """
+    normData = findNormalT(pcSet)
+    if normData == None:
+        return None
+    scTriple, t = normData
+    _normalTableGet()  # assures _scTable
+    icv, zTriple = _scTable[scTriple]
+    return scTriple, t, icv, zTriple
+
+
+def findNormalDataList(pcSetList):
+    """findNormalData for each pc set in a list, such as the psPath of a
+    PolyPath; pc sets already found are not searched again
+
+    >>> findNormalDataList([(0,4,7), (2,7,9), (7,11,14)])[2]
+    ((3, 11, -1), 7, (0, 0, 1, 1, 1, 0), None)
+    """
+    found = {}
+    post = []
+    for pcSet in pcSetList:
+        key = tuple(pcSet) if drawer.isList(pcSet) else pcSet
+        if key not in found:
+            found[key] = findNormalData(pcSet)
+        post.append(found[key])
+    return post
+
+
 # -----------------------------------------------------------------||||||||||||--
 # conversion utilities
 
@@ -509,6 +572,56 @@ def refData(rawForte):
         return setRef
 
 
+# inverted index of the words of set class references, by refType; built
+# when first used
+_refIndex = {}
+
+
+def _refIndexGet(refType):
+    """return a dictionary of each lower case word used in references of
+    refType to a list of scTriple and count pairs, and a dictionary of each
+    three character n-gram to the set of words that contain it"""
+    if refType not in _refIndex:
+        postings = {}
+        for setTuple in getAllScTriples("all", 0):
+            refDict = refData(setTuple)
+            if refDict == None or refType not in refDict:
+                continue
+            counts = {}
+            for nameStrings in refDict[refType]:  # list of strings
+                for nw in _strToSearchList(nameStrings):
+                    nwTemp = nw.lower()
+                    counts[nwTemp] = counts.get(nwTemp, 0) + 1
+            for nwTemp, count in list(counts.items()):
+                if nwTemp not in postings:
+                    postings[nwTemp] = []
+                postings[nwTemp].append((setTuple, count))
+        grams = {}
+        for nwTemp in postings:
+            for i in range(len(nwTemp) - 2):
+                if nwTemp[i : i + 3] not in grams:
+                    grams[nwTemp[i : i + 3]] = set()
+                grams[nwTemp[i : i + 3]].add(nwTemp)
+        _refIndex[refType] = postings, grams
+    return _refIndex[refType]
+
+
+def _refIndexMatch(swTemp, postings, grams):
+    """return all indexed words that contain a lower case search word"""
+    if len(swTemp) < 3:  # too short for n-grams; test all words
+        candidates = postings
+    else:  # only words that have all n-grams of the search word
+        candidates = None
+        for i in range(len(swTemp) - 2):
+            if swTemp[i : i + 3] not in grams:
+                return []
+            if candidates == None:
+                candidates = grams[swTemp[i : i + 3]]
+            else:
+                candidates = candidates & grams[swTemp[i : i + 3]]
+    return [nwTemp for nwTemp in candidates if nwTemp.find(swTemp) >= 0]
+
+
 def findRef(searchStr, refType="name", setRange="all", tniMode=0):
     """
     >>> findRef('Neapolitan pentachord')[0]
@@ -517,29 +630,19 @@ def findRef(searchStr, refType="name", setRange="all", tniMode=0):
     (4, 13, 1)
     """
     searchWords = _strToSearchList(searchStr)  # returns a list
+    postings, grams = _refIndexGet(refType)
+    # score is the number of reference words that contain each search word
     scoreDict = {}
-    for setTuple in getAllScTriples("all", tniMode):
-        refDict = refData(setTuple)
-        scoreDict[setTuple] = 0
-        if refDict == None:
-            continue
-        if refType in list(refDict.keys()):  # name groups
-            nameList = refDict[refType]
-            nameWords = []
-            for nameStrings in nameList:  # list of strings
-                nameWords = nameWords + _strToSearchList(nameStrings)
-            for sw in searchWords:
-                swTemp = sw.lower()  # keep case
-                for nw in nameWords:
-                    nwTemp = nw.lower()  # keep case
-                    if nwTemp.find(swTemp) >= 0:
-                        scoreDict[setTuple] = scoreDict[setTuple] + 1  # add
+    for sw in searchWords:
+        swTemp = sw.lower()  # keep case
+        for nwTemp in _refIndexMatch(swTemp, postings, grams):
+            for setTuple, count in postings[nwTemp]:
+                if tniMode and setTuple[2] == -1:
+                    continue  # leave out inversions
+                scoreDict[setTuple] = scoreDict.get(setTuple, 0) + count
     rankList = []
     for setTuple in list(scoreDict.keys()):
-        if scoreDict[setTuple] == 0:
-            del scoreDict[setTuple]  # remove if 0 score
-        else:  # add ranks to a list
-            rankList.append((scoreDict[setTuple], setTuple))
+        rankList.append((scoreDict[setTuple], setTuple))
 
     rankList.sort()
     rankList.reverse()
@@ -1304,6 +1407,51 @@ class Test(unittest.TestCase):
     def testDummy(self):
         self.assertEqual(True, True)
 
+    def testNormalTable(self):
+        table = _normalTableGet()
+        self.assertEqual(len(table), 4096)
+        for mask in range(1, 4096):
+            chord = [pc for pc in range(12) if mask & (1 << pc)]
+            if len(chord) > 1:
+                self.assertEqual(table[mask], _findNormalSearch(chord, FORTE))
+        # psReal values, octaves, and redundancies
+        self.assertEqual(findNormalT([14.2, 3, 27, 5.9]), findNormalT([2, 3, 6]))
+        self.assertEqual(findNormalT([3.4, 15.2]), ((1, 1, 0), 3.4))
+
+    def testFindRef(self):
+        def findRefScan(searchStr, tniMode):
+            # score by testing every word of every reference
+            rankList = []
+            for setTuple in getAllScTriples("all", tniMode):
+                refDict = refData(setTuple)
+                if refDict == None:
+                    continue
+                nameWords = []
+                for nameStrings in refDict["name"]:
+                    nameWords = nameWords + _strToSearchList(nameStrings.lower())
+                score = 0
+                for sw in _strToSearchList(searchStr.lower()):
+                    score = score + len([nw for nw in nameWords if sw in nw])
+                if score > 0:
+                    rankList.append((score, setTuple))
+            rankList.sort()
+            rankList.reverse()
+            return [setTuple for score, setTuple in rankList] or None
+
+        for searchStr in [
+            "Neapolitan pentachord",
+            "MAJOR minor",
+            "e",
+            "ord ord",
+            "whole-tone",
+            "no match here",
+        ]:
+            for tniMode in [0, 1]:
+                self.assertEqual(
+                    findRef(searchStr, "name", "all", tniMode),
+                    findRefScan(searchStr, tniMode),
+                )
+
 
 # -----------------------------------------------------------------||||||||||||--
 
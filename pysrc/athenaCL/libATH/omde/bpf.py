@@ -11,7 +11,7 @@
 # -----------------------------------------------------------------||||||||||||--
 
 
-import math
+import math, bisect
 import unittest, doctest
 
 from athenaCL.libATH.omde.functional import Function, FunctionModel
@@ -60,63 +60,119 @@ class BPF(Function):
         self.xEnd, junk = self.pairs[-1]  # x value of last
         self.period = self.xEnd - self.xStart
         self._is_periodic = periodic
+        self._index()
+
+    def _index(self):
+        """
+        Store sorted time and value arrays for bisection, and reset the
+        cursor; called again if self.pairs is replaced.
+        """
+        self._pairsIndexed = self.pairs
+        self._times = [x for x, y in self.pairs]
+        self._values = [y for x, y in self.pairs]
+        self._cursor = 1
+
+    def _segment(self, t):
+        """
+        Return the index of the first point with a time greater than t.
+        The last segment is tried first, then the next, as times are
+        most often evaluated in order.
+        """
+        times = self._times
+        i = self._cursor
+        if i < len(times) and times[i - 1] <= t < times[i]:
+            return i
+        i = i + 1
+        if i < len(times) and times[i - 1] <= t < times[i]:
+            self._cursor = i
+            return i
+        i = bisect.bisect_right(times, t)
+        if 0 < i < len(times):
+            self._cursor = i
+        return i
 
     def __call__(self, t):
-        if self._is_periodic:
+        if self._pairsIndexed is not self.pairs:
+            self._index()
+        if self._is_periodic and self.period > 0:
             return self._evaluate_periodic(t)
         else:
             return self._evaluate_aperiodic(t)
 
+    def evaluate(self, times):
+        """
+        Return a list of values, one for each time in times.
+        The segment of every time is found with bisect before any
+        value is interpolated; interpolation is still done once per
+        time, by the interpolate method of the subclass.
+
+        >>> a = LinearSegment([(0, 0), (10, 10)], periodic=1)
+        >>> a.evaluate([2, 12, -8, 1002])
+        [2.0, 2.0, 2.0, 2.0]
+        >>> a = LinearSegment([(0, 0), (10, 10), (20, 0)])
+        >>> times = [-1, 0, 5, 10, 15, 20, 21]
+        >>> a.evaluate(times) == [a(t) for t in times]
+        True
+        """
+        if self._pairsIndexed is not self.pairs:
+            self._index()
+        if self._is_periodic and self.period > 0:
+            times = [self._periodic_time(t) for t in times]
+        points = self._times
+        values = self._values
+        segments = [bisect.bisect_right(points, t) for t in times]
+        last = len(points)
+        interpolate = self.interpolate
+        post = []
+        for t, i in zip(times, segments):
+            if i == 0:  # before first point
+                post.append(values[0])
+            elif i == last:  # past last point
+                post.append(values[-1])
+            else:
+                post.append(
+                    interpolate(t, points[i - 1], values[i - 1], points[i], values[i])
+                )
+        return post
+
     def _evaluate_aperiodic(self, t):
         """
         Aperiodic version of the __call__ operator.
         Values outside the boundaries of the function
         are the same of the boundaries.
         """
-        (time0, value0) = self.pairs[0]
-
+        i = self._segment(t)
         # Evaluation before first point
-        if t < time0:
-            return value0
-
-        index = 0  # need to check if after last point
-        for time1, value1 in self.pairs:
-            if t < time1:
-                break
-            index = index + 1
-            time0, value0 = time1, value1
-
+        if i == 0:
+            return self._values[0]
         # Evaluation past last point
-        if index == len(self.pairs):
-            return value0
-
-        return self.interpolate(t, time0, value0, time1, value1)
+        if i == len(self._times):
+            return self._values[-1]
+        return self.interpolate(
+            t, self._times[i - 1], self._values[i - 1], self._times[i], self._values[i]
+        )
 
     def _evaluate_periodic(self, t):
         """
         Periodic version of the __call__ operator.
         Function repeats outside of the boundaries.
-
         """
+        t = self._periodic_time(t)
+        i = self._segment(t)
+        # environment.printDebug('pre interpolate', t, i)
+        return self.interpolate(
+            t, self._times[i - 1], self._values[i - 1], self._times[i], self._values[i]
+        )
 
-        while t < self.xStart:  # shift time to a value within the range
-            t = t + self.period
-        while t >= self.xEnd:
-            t = t - self.period  #
-        #            while t < 0: # shift
-        #                 t = t + self.period
-        #            # changed to >= rather than >
-        #            # > caused divide by 0 error
-        #            while t >= self.period:
-        #                 t = t - self.period #
-
-        for time1, value1 in self.pairs:  # find next set of points
-            if t < time1:
-                break
-            time0, value0 = time1, value1
-        # environment.printDebug('pre interpolate', t, time0, value0, time1, value1)
-
-        return self.interpolate(t, time0, value0, time1, value1)
+    def _periodic_time(self, t):
+        """
+        Shift a time outside of the boundaries to within them.
+        """
+        if t < self.xStart or t >= self.xEnd:  # shift time to within the range
+            t = self.xStart + ((t - self.xStart) % self.period)
+            if t >= self.xEnd:  # may round up to the end
+                t = t - self.period
+        return t
 
     def interpolate(self, time, time0, value0, time1, value1):
         """
@@ -293,6 +349,30 @@ class Test(unittest.TestCase):
     def testDummy(self):
         self.assertEqual(True, True)
 
+    def testEvaluate(self):
+        pairs = [(0.0, 0.0), (4.0, 10.0), (4.0, 2.0), (7.0, 5.0), (9.0, 8.0)]
+        a = LinearSegment(pairs)
+        # values at and across points, out of order and outside the range
+        times = [-1, 0, 2, 4, 5.5, 9, 12, 3, 4, 0.5]
+        self.assertEqual(
+            a.evaluate(times), [0.0, 0.0, 5.0, 2.0, 3.5, 8.0, 8.0, 7.5, 2.0, 1.25]
+        )
+        b = LinearSegment(pairs, periodic=1)
+        self.assertEqual(b.evaluate([-8, 9, 13, 9005.5]), [2.5, 0.0, 2.0, 3.5])
+        # replaced pairs are indexed again
+        a.normalize()
+        self.assertEqual(a(9), 0.8)
+        # each interpolation gives the same values as when called per time
+        times = [x * 0.25 for x in range(-8, 60)] + [3.3, 0.1, 8.9, 4.0]
+        for periodic in [0, 1]:
+            for obj in [
+                LinearSegment(pairs, periodic=periodic),
+                PowerSegment(pairs, exp=2.0, periodic=periodic),
+                HalfCosineSegment(pairs, periodic=periodic),
+                NoInterpolationSegment(pairs, periodic=periodic),
+            ]:
+                self.assertEqual(obj.evaluate(times), [obj(t) for t in times])
+
     def testBasic(self):
         segment1 = HalfCosineSegment([(0.0, 0.0), (4.0, 10.0), (7.0, 5.0), (9.0, 8.0)])
         segment2 = NoInterpolationSegment(
@@ -30,6 +30,7 @@ outputFormatNames = {
     "cb": "csoundBatch",  # batch file for csound processing
     "sct": "superColliderTask",
     "mf": "midiFile",
+    "ma": "midiAudio",  # midi file rendered with the soundfont
     "ts": "textSpace",
     "tt": "textTab",
     #    'mc'      :'maxColl',
@@ -47,6 +48,8 @@ def outputFormatParser(typeName):
     'midiFile'
     >>> outputFormatParser('af')
     'audioFile'
+    >>> outputFormatParser('ma')
+    'midiAudio'
     """
     parsed = drawer.acronymExpand(typeName, outputFormatNames)
     if parsed == None:
@@ -183,6 +186,20 @@ class FormatMidiFile(_OutputFormat):
         self.ext = ".mid"
 
 
+# -----------------------------------------------------------------||||||||||||--
+class FormatMidiAudio(_OutputFormat):
+    def __init__(self):
+        """
+        >>> a = FormatMidiAudio()
+        """
+        _OutputFormat.__init__(self)
+        self.name = "midiAudio"
+        self.emKey = "pathMidAudio"
+        self.doc = "Standard MIDI file rendered to audio with the soundfont"
+        # a wav extension is used if that is the audio format preference
+        self.ext = ".mid.aif"
+
+
 # -----------------------------------------------------------------||||||||||||--
 class FormatTextSpace(_OutputFormat):
     def __init__(self):
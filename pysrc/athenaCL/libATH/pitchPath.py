@@ -17,6 +17,7 @@ import unittest, doctest
 from athenaCL.libATH import pitchTools
 from athenaCL.libATH import drawer
 from athenaCL.libATH import multiset
+from athenaCL.libATH import error
 
 _MOD = "pitchPath"
 
@@ -231,9 +232,15 @@ class PolyPath:
     def loadPsList(self, pcsList):
         """adds pcs from a list of pc's, not as a complex set of data"""
         self.multisetPath = []  # clear
-        for entry in pcsList:
-            pcSet = tuple(entry)
-            self.multisetPath.append(multiset.Multiset(pcSet))
+        # find the normal form of all sets at once
+        normDataList = multiset.findNormalDataList(pcsList)
+        for i in range(len(pcsList)):
+            pcSet = tuple(pcsList[i])
+            if normDataList[i] == None:
+                raise error.MultisetError  # cancel set
+            setObj = multiset.Multiset(pcSet, normDataList[i][0])
+            setObj.setT(normDataList[i][1])
+            self.multisetPath.append(setObj)
         self._updateNew()
 
     def loadMultisetList(self, objList):
@@ -355,6 +362,11 @@ class PolyPath:
             raise ValueError("bad format name: %s" % name)
         return self._access(name)
 
+    def getNormalData(self):
+        """for each set, return the scTriple, transposition, icv, and z
+        relation scTriple (or None) found from the set's pitches"""
+        return multiset.findNormalDataList(self._access("psPath"))
+
     # -----------------------------------------------------------------------||--
     # semi public update methods; use these as much as possible
     def _updateNew(self, forceNoVL=0):
@@ -437,6 +449,15 @@ class Test(unittest.TestCase):
         p.rotate(1)
         p.slice((1, 3))
 
+    def testNormalData(self):
+        p = PolyPath()
+        p.loadPsList(((2, 5, 1), (-4, 5, 3), (14, 17, 13)))
+        self.assertEqual(p.get("scPath"), [(3, 3, 1), (3, 7, 1), (3, 3, 1)])
+        self.assertEqual(p.get("field"), [1, 3, 1])
+        post = p.getNormalData()
+        self.assertEqual([x[0] for x in post], p.get("scPath"))
+        self.assertEqual(post[1][2], multiset.forteToIcv((3, 7, 1)))
+
 
 # -----------------------------------------------------------------||||||||||||--
 if __name__ == "__main__":
@@ -572,6 +572,19 @@ def psToTempered(psReal, octShift, temperamentObj=None, tShift=0):
     return psReal
 
 
+def psListToTempered(psList, octShift, temperamentObj=None, tShift=0):
+    """converts a list of psReal values, with the same octave and transposition,
+    to tempered pitch values; see psToTempered
+
+    >>> psListToTempered([0, 4, 7], 1, None, 2)
+    [14, 18, 21]
+    """
+    psList = [(octShift * 12) + tShift + psReal for psReal in psList]
+    if temperamentObj != None:
+        psList = temperamentObj.temperList(psList)
+    return psList
+
+
 # -----------------------------------------------------------------||||||||||||--
 
 
@@ -78,6 +78,9 @@ def getCategoryDefaultDict(platform, category):
             "eventOutput": "('midiFile', 'xmlAthenaObject', 'csoundData')",
             "eventMode": "midi",  # startup value
             "refreshMode": "1",  # esObj refreshing
+            "scoreWorkers": "0",  # ELn worker processes; 0 scores in order
+            "scoreSeed": "0",  # ELn random seed when workers are used
+            "scoreCacheEvents": "1000000",  # events held by the ELn score cache
             "debug": "0",
             "cursorToolLb": "",
             "cursorToolRb": "",
@@ -11,7 +11,7 @@
 # not sure this import is necessary
 
 # standarind importas
-import copy, string, random
+import copy, string, random, bisect
 import unittest, doctest
 
 
@@ -42,6 +42,13 @@ from athenaCL.libATH import prefTools
 
 environment = prefTools.Environment(_MOD)
 
+# largest sieve period evaluated as a single period; larger sieves are
+# evaluated over each z
+PERIOD_MAX = 2**16
+# a segment only builds a period table if the period is no more than this
+# many times the length of z
+PERIOD_RATIO = 16
+
 
 # -----------------------------------------------------------------||||||||||||--
 # from
@@ -292,7 +299,7 @@ def _lcm(a, b):
     60
     """
     # // forcers integer style division (no remainder)
-    return abs(a * b) / _gcd(a, b)
+    return abs(a * b) // _gcd(a, b)
 
 
 def _lcmRecurse(filter):
@@ -425,21 +432,14 @@ class Residual:
         if format == None:
             format = self.segFmt
 
-        subset = []
         if self.m == 0:
-            return subset  # empty
+            return []  # empty
         n = (n + self.shift) % self.m  # check for n >= m
-
-        for value in z:
-            if n == value % self.m:
-                subset.append(value)
+        m = self.m
         if self.neg:  # find opposite
-            compset = copy.deepcopy(z)
-            for value in subset:
-                compset.remove(value)
-            seg = compset
+            seg = [value for value in z if n != value % m]
         else:
-            seg = subset
+            seg = [value for value in z if n == value % m]
 
         if format in ["bin", "binary"]:
             return unit.discreteBinaryPad(seg, z)
@@ -462,6 +462,25 @@ class Residual:
         """
         return self.m
 
+    def mask(self, period, n=0):
+        """an integer with a bit set for each member from 0 to period; period
+        must be a multiple of m
+
+        >>> a = Residual(3, 2)
+        >>> bin(a.mask(12))
+        '0b100100100100'
+        >>> bin((-a).mask(6))
+        '0b11011'
+        """
+        if self.m == 0:
+            return 0  # empty
+        full = (1 << period) - 1
+        # one bit every m bits, then moved to the shift
+        mask = (full // ((1 << self.m) - 1)) << ((n + self.shift) % self.m)
+        if self.neg:
+            return full ^ mask
+        return mask
+
     # -----------------------------------------------------------------------||--
     def copy(self):
         m = copy.copy(self.m)
@@ -600,8 +619,8 @@ class Residual:
         find m,n such that the intersection of two Residual's can
         be reduced to one Residual Xenakis p 273"""
         d = _gcd(m1, m2)
-        c1 = m1 / d  # not sure if we need floats here
-        c2 = m2 / d
+        c1 = m1 // d  # d is a factor of both
+        c2 = m2 // d
         n3 = 0
         m3 = 0
         if m1 != 0 and m2 != 0:
@@ -825,9 +844,11 @@ class Sieve:
         self.segFmtOption = ["int", "bin", "unit", "wid"]
 
         self.nonCompressible = 0  # if current z provides a nullSeg; no compression
+        self._cmpReady = 0  # compression is only done when first needed
         # varaibles will reinit w/ dedicated methods
         self.resLib = {}  # store id and object
         self.resId = 0  # used to calculate residual ids
+        self._periodTable = {}  # by state; only set if called
 
         # expanded, compressed form
         self.expTree = ""  # string that stores representation
@@ -843,16 +864,25 @@ class Sieve:
         if drawer.isList(self.usrStr):
             self._resClear()
             self._initLoadSegment(self.usrStr)  # z will be provided
-            self._initCompression()
         # normal instance, or a manual load
         else:  # process usrStr
             self._resClear()
             self._initParse()
+        self.cmpTree = ""
+        self._cmpReady = 0
+        self._periodTable = {}
+
+    def _cmpCheck(self):
+        """compress if not yet done for these residuals and z; compression
+        over a large z is slow, and is not needed for expanded sieves"""
+        if not self._cmpReady:
+            self._cmpReady = 1
             self._initCompression()
 
     def _initCompression(self):
         # only negative that will show up is binary negative, not unary
         # some internal intersections may have a complemented residual class
+        self._periodTable = {}  # residuals may have changed
         self.expType = "complex"  # assume complex
         if (
             self.NEG in self.expTree
@@ -882,6 +912,7 @@ class Sieve:
             method = "intersection"
 
     def _initPeriod(self):
+        self._cmpCheck()
         mListExp = self._resPeriodList("exp")
         mListCmp = self._resPeriodList("cmp")
         # print 'brute', _lcmBrute(mListExp)
@@ -900,8 +931,10 @@ class Sieve:
     def compress(self, z=None):
         if z != None and z != self.z:  # only process if z has changed
             self.z = z
-            self._resClear("cmp")  # clear compressed residuals
-            self._initCompression()  # may update self.nonCompressible
+            if self._cmpReady:
+                self._resClear("cmp")  # clear compressed residuals
+                self._cmpReady = 0
+        self._cmpCheck()  # may update self.nonCompressible
         if self.nonCompressible:  # do not changes set
             print("no compression availabile at this z.")
         else:
@@ -1376,25 +1409,62 @@ class Sieve:
         # print _MOD, 'cmpTree', self.cmpTree
 
     # -----------------------------------------------------------------------||--
-
-    def segment(self, state=None, n=0, z=None, format=None):
-        """
-        >>> a = Sieve('3@11')
-        >>> b = Sieve('2&4&8|5')
-        >>> c = Sieve('(5|2)&4&8')
-        >>> a.segment('exp')
-        [2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35, 38, 41, 44, 47, 50, 53, 56, 59, 62, 65, 68, 71, 74, 77, 80, 83, 86, 89, 92, 95, 98]
-        >>> c.segment('cmp', format='wid')
-        [8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8]
-        """
-
-        if state == None:
-            state = self.state
-        if z == None:
-            z = self.z
-        if format == None:
-            format = self.segFmt
-
+    # periodic evaluation
+
+    def _periodTableGet(self, state, size=None):
+        """evaluate one period of the sieve, from 0 to the lcm of all moduli;
+        return the period, a string of one binary digit for each integer in
+        the period, and a sorted list of the positions of members; return None
+        if the sieve cannot be evaluated by period
+
+        if size is given, a table not yet built is only built if the period
+        is no more than PERIOD_RATIO times size"""
+        if state in self._periodTable:
+            return self._periodTable[state]
+        if state == "cmp":
+            self._cmpCheck()
+        if state == "exp":
+            evalStr = self.expTree
+        elif state == "cmp":
+            evalStr = self.cmpTree
+        keys = self._resKeys(state)
+        period = 1
+        for key in keys:
+            m = self.resLib[key].m
+            if not drawer.isInt(m) or m < 0:
+                period = None  # only evaluated over z
+                break
+            if m != 0:  # 0 modulus is always empty
+                period = _lcm(period, m)
+        if period == None or period > PERIOD_MAX:
+            self._periodTable[state] = None
+            return None
+        if size != None and period > PERIOD_RATIO * size:
+            return None  # cheaper to evaluate over z; not stored
+        # as in segment(), remaining NEG are binary; the complement of a group
+        # is all members of the period minus the group
+        evalStr = evalStr.replace("-", "full-")
+        masks = {"full": (1 << period) - 1}
+        for i in range(len(keys)):
+            name = "r%s" % i
+            evalStr = evalStr.replace(keys[i], name)
+            masks[name] = self.resLib[keys[i]].mask(period)
+        evalStr = evalStr.replace(self.LGROUP, "(")
+        evalStr = evalStr.replace(self.RGROUP, ")")
+        try:
+            mask = eval(evalStr, {}, masks)
+        except SyntaxError:
+            raise SyntaxError("badly formed logical string (%s)" % evalStr)
+        digits = format(mask, "0%sb" % period)[::-1]  # lowest bit is 0
+        offsets = [i for i in range(period) if digits[i] == "1"]
+        self._periodTable[state] = period, digits, offsets
+        return self._periodTable[state]
+
+    def _segmentEval(self, state, n, z):
+        """evaluate the sieve over each integer in z, with set operations on
+        the segments of each residual class"""
+        if state == "cmp":
+            self._cmpCheck()
         if state == "exp":
             evalStr = copy.copy(self.expTree)
         elif state == "cmp":
@@ -1424,6 +1494,152 @@ class Sieve:
 
         seg = list(seg)
         seg.sort()
+        return seg
+
+    def isMember(self, value, n=0, state=None):
+        """true if value is a member of the sieve
+
+        >>> a = Sieve('3@2|4')
+        >>> a.isMember(5), a.isMember(6), a.isMember(6, 2)
+        (True, False, True)
+        """
+        if state == None:
+            state = self.state
+        table = self._periodTableGet(state)
+        if table == None:
+            return self._segmentEval(state, n, [value]) == [value]
+        period, digits, offsets = table
+        return digits[(value - n) % period] == "1"
+
+    def _iterSegmentEval(self, zMin, zMax, n, state, zStep=100):
+        """iterate over members, in order, by evaluating each zStep integers;
+        if zMax is None, stops after the same number of steps as collect()"""
+        p = zMin
+        zExtendCount = 0
+        while zExtendCount < 10000:
+            if zMax != None:
+                if p > zMax:
+                    break
+                zStep = min(zStep, zMax - p + 1)
+            for value in self._segmentEval(state, n, list(range(p, p + zStep))):
+                yield value
+            p = p + zStep
+            if zMax == None:
+                zExtendCount = zExtendCount + 1
+
+    def iterSegment(self, zMin=0, zMax=None, n=0, state=None):
+        """iterate over members from zMin to zMax, inclusive, by repeating
+        one period of the sieve; if zMax is None, does not stop, unless the
+        period is larger than PERIOD_MAX; then members are found by evaluating
+        z, and iteration stops after the same number of steps as collect()
+
+        >>> a = Sieve('3@2|4')
+        >>> b = a.iterSegment(10)
+        >>> [next(b) for x in range(6)]
+        [11, 12, 14, 16, 17, 20]
+        >>> list(a.iterSegment(-5, 5))
+        [-4, -1, 0, 2, 4, 5]
+        """
+        if state == None:
+            state = self.state
+        table = self._periodTableGet(state)
+        if table == None:
+            for value in self._iterSegmentEval(zMin, zMax, n, state):
+                yield value
+            return
+        period, digits, offsets = table
+        if offsets == []:
+            return  # empty sieve
+        pos = (zMin - n) % period
+        base = zMin - pos  # start of the period that contains zMin
+        i = bisect.bisect_left(offsets, pos)
+        count = len(offsets)
+        while 1:
+            if i == count:  # move to the next period
+                base = base + period
+                i = 0
+            value = base + offsets[i]
+            if zMax != None and value > zMax:
+                return
+            yield value
+            i = i + 1
+
+    def nextMember(self, value, n=0, state=None):
+        """the next member greater than value, or None if the sieve is empty
+
+        >>> a = Sieve('3@2|4')
+        >>> a.nextMember(12), a.nextMember(-7)
+        (14, -4)
+        """
+        for post in self.iterSegment(value + 1, None, n, state):
+            return post
+        return None
+
+    def previousMember(self, value, n=0, state=None):
+        """the previous member less than value, or None if the sieve is empty
+
+        >>> a = Sieve('3@2|4')
+        >>> a.previousMember(12), a.previousMember(-3)
+        (11, -4)
+        """
+        if state == None:
+            state = self.state
+        table = self._periodTableGet(state)
+        if table == None:
+            p = value
+            zExtendCount = 0
+            while zExtendCount < 10000:  # same limit as collect()
+                seg = self._segmentEval(state, n, list(range(p - 100, p)))
+                if seg != []:
+                    return seg[-1]
+                p = p - 100
+                zExtendCount = zExtendCount + 1
+            return None
+        period, digits, offsets = table
+        if offsets == []:
+            return None  # empty sieve
+        pos = (value - n) % period
+        base = value - pos
+        i = bisect.bisect_left(offsets, pos) - 1
+        if i < 0:  # move to the previous period
+            base = base - period
+            i = len(offsets) - 1
+        return base + offsets[i]
+
+    # -----------------------------------------------------------------------||--
+
+    def segment(self, state=None, n=0, z=None, format=None):
+        """
+        >>> a = Sieve('3@11')
+        >>> b = Sieve('2&4&8|5')
+        >>> c = Sieve('(5|2)&4&8')
+        >>> a.segment('exp')
+        [2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35, 38, 41, 44, 47, 50, 53, 56, 59, 62, 65, 68, 71, 74, 77, 80, 83, 86, 89, 92, 95, 98]
+        >>> c.segment('cmp', format='wid')
+        [8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8]
+        """
+
+        if state == None:
+            state = self.state
+        if z == None:
+            z = self.z
+        if format == None:
+            format = self.segFmt
+
+        # z is tested against one period, repeated; non-integer values of z
+        # require evaluation over z
+        seg = None
+        table = self._periodTableGet(state, len(z))
+        if table != None:
+            period, digits, offsets = table
+            try:
+                seg = [value for value in z if digits[(value - n) % period] == "1"]
+            except TypeError:
+                pass
+            else:
+                seg = sorted(setConstruct(seg))
+        if seg == None:
+            seg = self._segmentEval(state, n, z)
         if format in ["bin", "binary"]:
             return unit.discreteBinaryPad(seg, z)
         elif format in ["unit"]:
@@ -1536,6 +1752,8 @@ class Sieve:
         style abs (absolute) does not add | tos single residual class"""
         if state == None:
             state = self.state
+        if state == "cmp":
+            self._cmpCheck()
         if state == "exp":
             msg = copy.copy(self.expTree)
         elif state == "cmp":
@@ -1810,6 +2028,43 @@ class Test(unittest.TestCase):
             str(a), "{-{13@3|13@5|13@7|13@9}&11@2}|{-{11@4|11@8}&13@9}|{13@0|13@1|13@6}"
         )
 
+    def testPeriod(self):
+        z = list(range(-60, 60))
+        for usrStr in [
+            "3@2 & 4@1 | 2@0 & 3@1 | 3@3 | -4@2",
+            "-(3@2 & -4@1 & -(12@3 | 12@8) | (-2@0 & 3@1 | (3@3)))",
+            "(-(13@3 | 13@5) & 11@2) ^ (-(11@4 | 11@8) & 13@9) | 0@3",
+            "97@3 | 89@5 | 83 | 79@1 | 2",  # too large for one period
+        ]:
+            a = Sieve(usrStr, z)
+            for state in ["exp", "cmp"]:
+                for n in [0, 5]:
+                    post = a._segmentEval(state, n, z)
+                    self.assertEqual(a.segment(state, n, z), post)
+                    self.assertEqual(list(a.iterSegment(-60, 59, n, state)), post)
+                    wide = a._segmentEval(state, n, list(range(-600, 600)))
+                    for value in range(-50, 50, 3):
+                        self.assertEqual(a.isMember(value, n, state), value in post)
+                        after = [x for x in wide if x > value]
+                        self.assertEqual(a.nextMember(value, n, state), after[0])
+                        before = [x for x in wide if x < value]
+                        self.assertEqual(a.previousMember(value, n, state), before[-1])
+
+        a = Sieve("3@1&3@2")  # empty
+        self.assertEqual(list(a.iterSegment(0)), [])
+        self.assertEqual(a.nextMember(10), None)
+
+        # a period much larger than z is evaluated over z; no table is built
+        z = list(range(100))
+        a = Sieve("2048@1|2047@3", z)
+        self.assertEqual(a.segment(), a._segmentEval("exp", 0, z))
+        self.assertEqual(a._periodTable.get("exp"), None)
+        a = Sieve("64@1|63@3", z)
+        self.assertEqual(a.segment(), a._segmentEval("exp", 0, z))
+        self.assertEqual(a._periodTable.get("exp"), None)
+        self.assertEqual(a.isMember(4033), True)  # builds the table
+        self.assertEqual(a._periodTable["exp"][0], 4032)
+
 
 # -----------------------------------------------------------------||||||||||||--
 if __name__ == "__main__":
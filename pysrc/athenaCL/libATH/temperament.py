@@ -20,7 +20,9 @@ _MOD = "temperament.py"
 
 
 class Temperament:
-    "parent class of all temperament classes"
+    """parent class of all temperament classes
+    subclasses translate a pitch class (an int from 0 to 11) with _translatePc;
+    deterministic temperaments compile these into a table when created"""
 
     def __init__(self):
         """
@@ -28,30 +30,45 @@ class Temperament:
         """
         self.name = None
         self.doc = None
+        self._pcTable = None  # tempered pc for each pc, if deterministic
+
+    def _compile(self):
+        """store the tempered value of each pc; pc 12 may be found when
+        rounding a value just below an octave"""
+        self._pcTable = tuple([self._translatePc(pc) for pc in range(13)])
+
+    def _translatePc(self, pc):
+        """return the tempered value of a pc; may be a float beyond 0-11"""
+        return pc
 
     def __call__(self, psReal):
-        """takes a psReal (post trans, post oct) and returns a psReal"""
-        self._splitPitch(psReal)  # this will assign local values
-        self._translatePitch()  # this will perform an operation on local vals
-        return self._joinPitch()  # this will return a psReal, delete local
+        """takes a psReal (post trans, post oct) and returns a psReal
 
-    def _splitPitch(self, psReal):
+        >>> a = Pythagorean()
+        >>> a(61.25)
+        61.15
+        """
         oct, pc, micro = pitchTools.splitPsReal(psReal)  # pc may have micro
-        # self.psReal = psReal
-        self.oct = oct
-        self.pc = pc
-        self.micro = micro
-
-    def _joinPitch(self):
-        # note: joinPsReal will accept pc values tt are not pc:
-        # the may be floats, above and below 0-11 range
-        psReal = pitchTools.joinPsReal(self.oct, self.pc, self.micro)
-        # deleat temporary variables
-        del self.oct
-        del self.pc
-        del self.micro
-        # del self.psReal
-        return psReal
+        if self._pcTable is not None:
+            return (oct * 12) + self._pcTable[pc] + micro
+        return pitchTools.joinPsReal(oct, self._translatePc(pc), micro)
+
+    def temperList(self, psArray):
+        """temper a list of psReal values, in order
+
+        >>> a = Interleave24Odd()
+        >>> a.temperList([60, 61.25, -1])
+        [60.5, 61.75, -0.5]
+        """
+        table = self._pcTable
+        if table is None:
+            return [self(psReal) for psReal in psArray]
+        post = []
+        for psReal in psArray:
+            oct, psReal = divmod(psReal, 12)
+            pc, micro = divmod(psReal, 1)
+            post.append((int(oct) * 12) + table[int(pc)] + micro)
+        return post
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -65,9 +82,10 @@ class TwelveEqual(Temperament):
         Temperament.__init__(self)
         self.name = "TwelveEqual"
         self.doc = "Twelve tone equal temperament"
+        self._compile()
 
-    def _translatePitch(self):
-        pass  # do nothing
+    def _translatePc(self, pc):
+        return pc  # do nothing
 
 
 class Pythagorean(Temperament):
@@ -78,37 +96,28 @@ class Pythagorean(Temperament):
         Temperament.__init__(self)
         self.name = "Pythagorean"
         self.doc = "Static Pythagorean tuning"
+        self._compile()
 
     # pythagorean, from dodge and jerse p39 -->
     # note: aug4 and dim5 are rounded (588,612) -->
-    def _translatePitch(self):
-        pc = self.pc
-        if pc == 0:
-            pcPost = 0.00
-        elif pc == 1:
-            pcPost = 0.90
-        elif pc == 2:
-            pcPost = 2.04
-        elif pc == 3:
-            pcPost = 2.94
-        elif pc == 4:
-            pcPost = 4.08
-        elif pc == 5:
-            pcPost = 4.98
-        elif pc == 6:
-            pcPost = 6.00
-        elif pc == 7:
-            pcPost = 7.02
-        elif pc == 8:
-            pcPost = 7.92
-        elif pc == 9:
-            pcPost = 9.06
-        elif pc == 10:
-            pcPost = 9.96
-        elif pc == 11:
-            pcPost = 11.09
-        # assign
-        self.pc = pcPost
+    pcTempered = (
+        0.00,
+        0.90,
+        2.04,
+        2.94,
+        4.08,
+        4.98,
+        6.00,
+        7.02,
+        7.92,
+        9.06,
+        9.96,
+        11.09,
+    )
+
+    def _translatePc(self, pc):
+        oct, pc = divmod(pc, 12)
+        return (oct * 12) + self.pcTempered[pc]
 
 
 class Just(Temperament):
@@ -119,38 +128,29 @@ class Just(Temperament):
         Temperament.__init__(self)
         self.name = "Just"
         self.doc = "Static Just tuning"
+        self._compile()
 
     # just, from dodge and jerse p39
     # note: aug unis and min2 (92,112), min2 is used
     # note: aug6 and min7 (996,1018), min7 is used
-    def _translatePitch(self):
-        pc = self.pc
-        if pc == 0:
-            pcPost = 0.00
-        elif pc == 1:
-            pcPost = 1.12
-        elif pc == 2:
-            pcPost = 2.04
-        elif pc == 3:
-            pcPost = 3.16
-        elif pc == 4:
-            pcPost = 3.86
-        elif pc == 5:
-            pcPost = 4.98
-        elif pc == 6:
-            pcPost = 6.00
-        elif pc == 7:
-            pcPost = 7.02
-        elif pc == 8:
-            pcPost = 8.14
-        elif pc == 9:
-            pcPost = 8.84
-        elif pc == 10:
-            pcPost = 10.18
-        elif pc == 11:
-            pcPost = 10.88
-        # assign
-        self.pc = pcPost
+    pcTempered = (
+        0.00,
+        1.12,
+        2.04,
+        3.16,
+        3.86,
+        4.98,
+        6.00,
+        7.02,
+        8.14,
+        8.84,
+        10.18,
+        10.88,
+    )
+
+    def _translatePc(self, pc):
+        oct, pc = divmod(pc, 12)
+        return (oct * 12) + self.pcTempered[pc]
 
 
 class MeanTone(Temperament):
@@ -161,38 +161,29 @@ class MeanTone(Temperament):
         Temperament.__init__(self)
         self.name = "MeanTone"
         self.doc = "Static Mean Tone tuning"
+        self._compile()
 
     # meanTone, from dodge and jerse p39
     # note: aug unis and min2 (76,117), min2 is used
     # note: aug6 and min7 (966,1007), min7 is used -
-    def _translatePitch(self):
-        pc = self.pc
-        if pc == 0:
-            pcPost = 0.00
-        elif pc == 1:
-            pcPost = 1.17
-        elif pc == 2:
-            pcPost = 1.93
-        elif pc == 3:
-            pcPost = 3.10
-        elif pc == 4:
-            pcPost = 3.86
-        elif pc == 5:
-            pcPost = 5.03
-        elif pc == 6:
-            pcPost = 5.80
-        elif pc == 7:
-            pcPost = 6.97
-        elif pc == 8:
-            pcPost = 8.14
-        elif pc == 9:
-            pcPost = 8.90
-        elif pc == 10:
-            pcPost = 10.07
-        elif pc == 11:
-            pcPost = 10.83
-        # assign
-        self.pc = pcPost
+    pcTempered = (
+        0.00,
+        1.17,
+        1.93,
+        3.10,
+        3.86,
+        5.03,
+        5.80,
+        6.97,
+        8.14,
+        8.90,
+        10.07,
+        10.83,
+    )
+
+    def _translatePc(self, pc):
+        oct, pc = divmod(pc, 12)
+        return (oct * 12) + self.pcTempered[pc]
 
 
 class Split24Lower(Temperament):
@@ -203,9 +194,10 @@ class Split24Lower(Temperament):
         Temperament.__init__(self)
         self.name = "Split24Lower"
         self.doc = "Lower half of a 24 tone equal tempered scale"
+        self._compile()
 
-    def _translatePitch(self):
-        self.pc = self.pc * 0.5
+    def _translatePc(self, pc):
+        return pc * 0.5
 
 
 class Split24Upper(Temperament):
@@ -216,9 +208,10 @@ class Split24Upper(Temperament):
         Temperament.__init__(self)
         self.name = "Split24Upper"
         self.doc = "Upper half of a 24 tone equal tempered scale"
+        self._compile()
 
-    def _translatePitch(self):
-        self.pc = (self.pc * 0.5) + 6  # shift 1/4 tone higher, 1/2 octave
+    def _translatePc(self, pc):
+        return (pc * 0.5) + 6  # shift 1/4 tone higher, 1/2 octave
 
 
 class Interleave24Even(Temperament):
@@ -229,9 +222,10 @@ class Interleave24Even(Temperament):
         Temperament.__init__(self)
         self.name = "Interleave24Even"
         self.doc = "Even steps of a 24 tone equal tempered scale"
+        self._compile()
 
-    def _translatePitch(self):
-        self.pc = self.pc + 0  # do nothing, same as 12te
+    def _translatePc(self, pc):
+        return pc + 0  # do nothing, same as 12te
 
 
 class Interleave24Odd(Temperament):
@@ -242,9 +236,10 @@ class Interleave24Odd(Temperament):
         Temperament.__init__(self)
         self.name = "Interleave24Odd"
         self.doc = "Odd steps of a 24 tone equal tempered scale"
+        self._compile()
 
-    def _translatePitch(self):
-        self.pc = self.pc + 0.5  # add 1/4 tone
+    def _translatePc(self, pc):
+        return pc + 0.5  # add 1/4 tone
 
 
 class NoiseLight(Temperament):
@@ -258,9 +253,9 @@ class NoiseLight(Temperament):
 
     maxNoise = 0.05
 
-    def _translatePitch(self):
+    def _translatePc(self, pc):
         shift = (random.random() * (self.maxNoise * 2)) - self.maxNoise
-        self.pc = self.pc + shift
+        return pc + shift
 
 
 class NoiseMedium(Temperament):
@@ -274,9 +269,9 @@ class NoiseMedium(Temperament):
 
     maxNoise = 0.10
 
-    def _translatePitch(self):
+    def _translatePc(self, pc):
         shift = (random.random() * (self.maxNoise * 2)) - self.maxNoise
-        self.pc = self.pc + shift
+        return pc + shift
 
 
 class NoiseHeavy(Temperament):
@@ -290,9 +285,9 @@ class NoiseHeavy(Temperament):
 
     maxNoise = 0.15
 
-    def _translatePitch(self):
+    def _translatePc(self, pc):
         shift = (random.random() * (self.maxNoise * 2)) - self.maxNoise
-        self.pc = self.pc + shift
+        return pc + shift
 
 
 class NoiseUser(Temperament):
@@ -304,9 +299,9 @@ class NoiseUser(Temperament):
 
     maxNoise = 10
 
-    def _translatePitch(self):
+    def _translatePc(self, pc):
         shift = (random.random() * (self.maxNoise * 2)) - self.maxNoise
-        self.pc = self.pc + shift
+        return pc + shift
 
 
 # -----------------------------------------------------------------||||||||||||--
@@ -376,6 +371,17 @@ class Test(unittest.TestCase):
             a = factory(name)
             post = [a(x) for x in range(0, 12)]
 
+    def testTemperList(self):
+        psArray = [x * 0.37 for x in range(-100, 100)] + [-1e-17]
+        for name in temperamentNames:
+            a = factory(name)
+            random.seed(3)
+            post = [a(x) for x in psArray]
+            random.seed(3)
+            self.assertEqual(a.temperList(psArray), post)
+        # values just below an octave may round to pc 12
+        self.assertEqual(factory("Just")(-1e-17), 0.0)
+
 
 # -----------------------------------------------------------------||||||||||||--
 if __name__ == "__main__":
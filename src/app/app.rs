@@ -1,5 +1,4 @@
 //! Application's GUI.
-use std::env;
 
 use iced::futures::sink::SinkExt;
 use iced::stream;
@@ -11,15 +10,13 @@ use iced::{time, Element, Font, Subscription, Task};
 use rfd::FileDialog;
 
 use super::player::{self, GlobalState as GlobalPlayerState, Track as PlayerState};
-use crate::interpreter;
+use crate::{interpreter, render};
 
 const TERM_WIDTH: u16 = 80;
 const FONT_WIDTH: u16 = 10;
 
 /// System application ID.
 pub const APPLICATION_ID: &str = "by.alestsurko.athenacl";
-// TODO it should be configurable so users could choose they own sf
-const SOUND_FONT: &str = "resources/SGM-v2.01-YamahaGrand-Guit-Bass-v2.7.sf2";
 
 /// athenaCL GUI.
 pub struct State {
@@ -33,18 +30,14 @@ pub struct State {
     texture_lib: Vec<String>,
     active_path: String, // not system path, but athenaCL pitch path
     active_texture: String,
+    /// The running command and its last progress.
+    job: Option<(interpreter::JobId, String)>,
 }
 
 impl Default for State {
     fn default() -> Self {
-        let mut exe_dir = env::current_exe().expect(
-            "executable directory should be available for standard
-            distributions of supported platforms (macOS, Windows, Ubuntu). The executable is also
-            not a symbolic link.",
-        );
-        exe_dir.pop();
-        exe_dir.push(SOUND_FONT);
-        let midi_player_state = GlobalPlayerState::new(&exe_dir.as_os_str().to_string_lossy());
+        let midi_player_state =
+            GlobalPlayerState::new(&render::sound_font_path().to_string_lossy());
         let output = vec![Output::Normal(
             r#"
                        _   _                        ___   __  
@@ -75,6 +68,7 @@ impl Default for State {
             texture_lib: Vec::new(),
             active_path: String::new(),
             active_texture: String::new(),
+            job: None,
         }
     }
 }
@@ -123,6 +117,14 @@ pub fn update(state: &mut State, message: Message) -> Task<Message> {
                 .send_blocking(interpreter::Message::SendCmd(format! {"tio {value}"}))
                 .expect("cannot send message to the interpreter");
         }
+        Message::CancelJob => {
+            if let Some((job_id, _)) = state.job {
+                interpreter::INTERPRETER_WORKER
+                    .interp_sender
+                    .send_blocking(interpreter::Message::CancelJob(job_id))
+                    .expect("cannot send message to the interpreter");
+            }
+        }
         Message::Interpreter(msg) => match msg {
             interpreter::Message::SendCmd(ref cmd) => {
                 state.answer = "".to_owned();
@@ -181,6 +183,21 @@ pub fn update(state: &mut State, message: Message) -> Task<Message> {
             interpreter::Message::ActiveTextureSet(texture_name) => {
                 state.active_texture = texture_name;
             }
+            interpreter::Message::JobStarted(job_id, _) => {
+                state.job = Some((job_id, String::new()));
+            }
+            interpreter::Message::JobProgress(job_id, stage, name) => {
+                if let Some((id, ref mut progress)) = state.job {
+                    if id == job_id {
+                        *progress = format!("{stage} {name}");
+                    }
+                }
+            }
+            interpreter::Message::JobFinished(job_id) => {
+                if matches!(state.job, Some((id, _)) if id == job_id) {
+                    state.job = None;
+                }
+            }
             _ => (),
         },
         Message::Player(message) => {
@@ -319,15 +336,21 @@ fn view_input(state: &State) -> Element<Message> {
 }
 
 fn view_bottom_panel(state: &State) -> Element<Message> {
-    row![
-        view_pici_chooser(state),
-        horizontal_space(),
-        player::view_tempo(&state.player_state).map(Message::Player)
-    ]
-    .spacing(10.0)
-    .padding([18, 0])
-    .align_y(iced::Alignment::Center)
-    .into()
+    let mut panel = row![view_pici_chooser(state), horizontal_space()];
+    if let Some((_, progress)) = &state.job {
+        panel = panel.push(text(progress)).push(
+            button(text("cancel"))
+                .style(button::text)
+                .on_press(Message::CancelJob),
+        );
+    }
+
+    panel
+        .push(player::view_tempo(&state.player_state).map(Message::Player))
+        .spacing(10.0)
+        .padding([18, 0])
+        .align_y(iced::Alignment::Center)
+        .into()
 }
 
 fn view_pici_chooser(state: &State) -> Element<Message> {
@@ -377,6 +400,7 @@ pub enum Message {
     SetScratchDir,
     PiSelected(String),
     TiSelected(String),
+    CancelJob,
     Interpreter(interpreter::Message),
     Player(player::Message),
 }
@@ -49,6 +49,16 @@ pub(super) mod _inner {
         Ok(())
     }
 
+    #[pyfunction(name = "jobProgress")]
+    pub(crate) fn job_progress(
+        job_id: interpreter::JobId,
+        stage: String,
+        name: String,
+        vm: &VirtualMachine,
+    ) -> PyResult<bool> {
+        Ok(interpreter::poll_job(vm, job_id, stage, name))
+    }
+
     #[pyfunction(name = "activeTextureSet")]
     pub(crate) fn active_texture_set(path: String) -> PyResult<()> {
         interpreter::INTERPRETER_WORKER
@@ -1,9 +1,11 @@
 //! athenaCL interpreter.
 
+use std::cell::RefCell;
+use std::collections::{BTreeSet, VecDeque};
 use std::sync::LazyLock;
 use std::thread;
 
-use super::{athena_obj_ext, dialog_ext, xml_tools_ext};
+use super::{athena_obj_ext, dialog_ext, render_ext, xml_tools_ext};
 use async_channel::{unbounded, Receiver, Sender};
 use rustpython_vm as vm;
 use thiserror::Error;
@@ -15,12 +17,26 @@ use vm::{
 /// Global interpreter representation.
 pub static INTERPRETER_WORKER: LazyLock<InterpreterWorker> = LazyLock::new(InterpreterWorker::run);
 pub(crate) type InterpreterResult<T> = Result<T, Error>;
+/// Id of a command run by the worker.
+pub type JobId = u64;
+
+thread_local! {
+    /// athenaCL's interpreter and AthenaObject, available on the worker thread to answer queries
+    /// while a job is running.
+    static ATH_OBJECTS: RefCell<Option<(PyObjectRef, PyObjectRef)>> = const { RefCell::new(None) };
+    /// Messages received while a job was running, which are handled after it finishes.
+    static DEFERRED: RefCell<VecDeque<Message>> = const { RefCell::new(VecDeque::new()) };
+    /// Ids of jobs cancelled while they were not running, checked when they reach a checkpoint.
+    static CANCELLED: RefCell<BTreeSet<JobId>> = const { RefCell::new(BTreeSet::new()) };
+}
 
 /// A worker which keeps the interpreter on a dedicated thread and provides communication with it
 /// via channels.
 #[derive(Debug)]
 pub struct InterpreterWorker {
     pub interp_sender: Sender<Message>,
+    /// Read by the worker loop, and by [`poll_job`] while a job is running.
+    interp_receiver: Receiver<Message>,
     pub gui_sender: Sender<Message>,
     pub gui_receiver: Receiver<Message>,
     /// Response sender/receiver is a special channel dedicated for sending user's answer to
@@ -34,9 +50,10 @@ pub struct InterpreterWorker {
 impl InterpreterWorker {
     /// Run the interpereter loop.
     fn run() -> Self {
-        let (interp_sender, r) = unbounded::<Message>();
+        let (interp_sender, interp_receiver) = unbounded::<Message>();
         let (gui_sender, gui_receiver) = unbounded::<Message>();
         let s = gui_sender.clone();
+        let r = interp_receiver.clone();
 
         let _ = thread::spawn(move || {
             let interpreter = Interpreter::new().unwrap_or_else(|err| {
@@ -44,17 +61,40 @@ impl InterpreterWorker {
                     .expect("can't send message to channel");
                 panic!("error initializating interpreter");
             });
+            ATH_OBJECTS.with(|objects| {
+                *objects.borrow_mut() = Some((
+                    interpreter.ath_interpreter.clone(),
+                    interpreter.ath_object.clone(),
+                ))
+            });
+            let mut job_id: JobId = 0;
 
             loop {
-                if let Ok(message) = r.recv_blocking() {
+                // messages deferred by the last job come first
+                let message = match DEFERRED.with(|deferred| deferred.borrow_mut().pop_front()) {
+                    Some(message) => Ok(message),
+                    None => r.recv_blocking(),
+                };
+                if let Ok(message) = message {
                     let msg = match message {
-                        Message::SendCmd(cmd) => interpreter.run_cmd(&cmd).map(Message::Post),
+                        Message::SendCmd(cmd) => {
+                            job_id += 1;
+                            s.send_blocking(Message::JobStarted(job_id, cmd.clone()))
+                                .expect("cannot send message to gui");
+                            let result = interpreter.run_job(job_id, &cmd).map(Message::Post);
+                            s.send_blocking(result.into())
+                                .expect("cannot send message to gui");
+                            Message::JobFinished(job_id)
+                        }
                         Message::GetScratchDir => {
-                            interpreter.scratch_dir().map(Message::ScratchDir)
+                            interpreter.scratch_dir().map(Message::ScratchDir).into()
+                        }
+                        Message::CancelJob(id) => {
+                            record_cancelled(id);
+                            continue;
                         }
                         _ => continue,
-                    }
-                    .into();
+                    };
 
                     s.send_blocking(msg).expect("cannot send message to gui");
                 }
@@ -65,6 +105,7 @@ impl InterpreterWorker {
 
         Self {
             interp_sender,
+            interp_receiver,
             gui_sender,
             gui_receiver,
             response_sender,
@@ -73,6 +114,73 @@ impl InterpreterWorker {
     }
 }
 
+/// Called by athenaCL at each checkpoint of a running job: when a texture or clone is scored and
+/// when an engine writes its output.
+///
+/// Sends the progress to the GUI, answers queries received since the last checkpoint (see
+/// `AthenaObject.cmdQuery`), records cancels of other jobs, and defers any other message until
+/// the job finishes. Returns `true` if the job has been cancelled.
+pub(crate) fn poll_job(vm: &VirtualMachine, job_id: JobId, stage: String, name: String) -> bool {
+    let worker = &*INTERPRETER_WORKER;
+    worker
+        .gui_sender
+        .send_blocking(Message::JobProgress(job_id, stage, name))
+        .expect("cannot send message to gui");
+    let Some((ath_interpreter, ath_object)) = ATH_OBJECTS.with(|objects| objects.borrow().clone())
+    else {
+        return false;
+    };
+    let mut cancelled = take_cancelled(job_id);
+
+    while let Ok(message) = worker.interp_receiver.try_recv() {
+        let msg = match message {
+            Message::CancelJob(id) if id == job_id => {
+                cancelled = true;
+                continue;
+            }
+            Message::CancelJob(id) => {
+                record_cancelled(id);
+                continue;
+            }
+            Message::GetScratchDir => get_scratch_dir(vm, &ath_object)
+                .map(Message::ScratchDir)
+                .into(),
+            Message::SendCmd(cmd) if is_query(vm, &ath_object, &cmd) => {
+                call_cmd(vm, &ath_interpreter, &cmd)
+                    .map(Message::Post)
+                    .into()
+            }
+            message => {
+                DEFERRED.with(|deferred| deferred.borrow_mut().push_back(message));
+                continue;
+            }
+        };
+
+        worker
+            .gui_sender
+            .send_blocking(msg)
+            .expect("cannot send message to gui");
+    }
+
+    cancelled
+}
+
+/// Record the cancel of a job that is not running, so it is cancelled at its first checkpoint.
+fn record_cancelled(job_id: JobId) {
+    CANCELLED.with(|cancelled| cancelled.borrow_mut().insert(job_id));
+}
+
+/// Take the cancel recorded for `job_id`, if any, and drop those of jobs run before it.
+fn take_cancelled(job_id: JobId) -> bool {
+    CANCELLED.with(|cancelled| {
+        let mut cancelled = cancelled.borrow_mut();
+        let later = cancelled.split_off(&(job_id + 1));
+        let found = cancelled.contains(&job_id);
+        *cancelled = later;
+        found
+    })
+}
+
 #[derive(Debug, Clone)]
 pub enum Message {
     /// Output from the interpreter (stdout).
@@ -81,6 +189,17 @@ pub enum Message {
     Ask(String),
     /// Send command to the interpreter.
     SendCmd(String),
+    /// Stop a running command at its next checkpoint.
+    CancelJob(JobId),
+    /// The interpreter started a command (sent with `SendCmd`).
+    JobStarted(JobId, String),
+    /// A running command reached a checkpoint.
+    ///
+    /// The values are the stage (`texture`, `clone` or `engine`) and the name of the texture,
+    /// clone or engine.
+    JobProgress(JobId, String, String),
+    /// A command finished, failed or was cancelled; sent after its output.
+    JobFinished(JobId),
     /// Error from the interpreter (stderr).
     Error(String),
     /// Python's interpreter- level errors.
@@ -133,7 +252,7 @@ impl Interpreter {
         let py_interpreter = init_py_interpreter();
         let (ath_interpreter, ath_object) = Self::init_ath_interpreter(&py_interpreter)?;
         Ok(Self {
-            py_interpreter: init_py_interpreter(),
+            py_interpreter,
             ath_interpreter,
             ath_object,
         })
@@ -159,33 +278,63 @@ interp"#
         })
     }
 
-    fn run_cmd(&self, cmd: &str) -> InterpreterResult<String> {
+    fn run_job(&self, job_id: JobId, cmd: &str) -> InterpreterResult<String> {
         self.py_interpreter.enter(|vm| -> _ {
             let result = vm
-                .call_method(&self.ath_interpreter, "cmd", (cmd.to_string(),))
+                .call_method(&self.ath_interpreter, "cmdJob", (job_id, cmd.to_string()))
                 .try_py()?;
-            let (is_ok, msg) = extract_result_tuple(vm, result).try_py()?;
 
-            if is_ok {
-                Ok(msg)
-            } else {
-                Err(Error::Command(cmd.to_owned(), msg))
-            }
+            extract_cmd_result(vm, cmd, result)
         })
     }
 
     fn scratch_dir(&self) -> InterpreterResult<String> {
-        self.py_interpreter.enter(|vm| -> _ {
-            let external = vm
-                .get_attribute_opt(self.ath_object.clone(), "external")
-                .try_py()?
-                .expect("external attribute is always available on AthenaObject");
-            let result = vm
-                .call_method(&external, "getPref", ("athena", "fpScratchDir"))
-                .try_py()?;
+        self.py_interpreter
+            .enter(|vm| get_scratch_dir(vm, &self.ath_object))
+    }
+}
 
-            extract_string(vm, result).try_py()
-        })
+fn call_cmd(
+    vm: &VirtualMachine,
+    ath_interpreter: &PyObjectRef,
+    cmd: &str,
+) -> InterpreterResult<String> {
+    let result = vm
+        .call_method(ath_interpreter, "cmd", (cmd.to_string(),))
+        .try_py()?;
+
+    extract_cmd_result(vm, cmd, result)
+}
+
+fn is_query(vm: &VirtualMachine, ath_object: &PyObjectRef, cmd: &str) -> bool {
+    vm.call_method(ath_object, "cmdIsQuery", (cmd.to_string(),))
+        .and_then(|result| result.try_to_bool(vm))
+        .unwrap_or(false)
+}
+
+fn get_scratch_dir(vm: &VirtualMachine, ath_object: &PyObjectRef) -> InterpreterResult<String> {
+    let external = vm
+        .get_attribute_opt(ath_object.clone(), "external")
+        .try_py()?
+        .expect("external attribute is always available on AthenaObject");
+    let result = vm
+        .call_method(&external, "getPref", ("athena", "fpScratchDir"))
+        .try_py()?;
+
+    extract_string(vm, result).try_py()
+}
+
+fn extract_cmd_result(
+    vm: &VirtualMachine,
+    cmd: &str,
+    result: PyObjectRef,
+) -> InterpreterResult<String> {
+    let (is_ok, msg) = extract_result_tuple(vm, result).try_py()?;
+
+    if is_ok {
+        Ok(msg)
+    } else {
+        Err(Error::Command(cmd.to_owned(), msg))
     }
 }
 
@@ -200,6 +349,7 @@ pub fn init_py_interpreter() -> PyInterpreter {
         xml_tools_ext::make_module(vm);
         dialog_ext::make_module(vm);
         athena_obj_ext::make_module(vm);
+        render_ext::make_module(vm);
     })
 }
 
@@ -4,4 +4,5 @@ pub use interpreter::*;
 mod athena_obj_ext;
 mod dialog_ext;
 mod interpreter;
+mod render_ext;
 mod xml_tools_ext;
@@ -0,0 +1,63 @@
+//! Offline audio rendering for athenaCL output engines.
+//!
+//! Exposes [`render`](crate::render) to Python, so MIDI output can be bounced to audio files
+//! without the GUI or an audio device.
+
+use std::path::PathBuf;
+
+use rustpython_vm::{pymodule, VirtualMachine};
+
+use crate::render;
+
+pub(crate) fn make_module(vm: &mut VirtualMachine) {
+    vm.add_native_module("renderExt", Box::new(_inner::make_module));
+}
+
+#[pymodule]
+pub(super) mod _inner {
+    use super::*;
+    use rustpython_vm::{convert::ToPyObject, PyResult};
+
+    /// The path of the soundfont used to render, or None if there is none.
+    #[pyfunction(name = "soundFont")]
+    pub(crate) fn sound_font() -> Option<String> {
+        render::find_sound_font().map(|path| path.to_string_lossy().into_owned())
+    }
+
+    /// Render each MIDI file of `midi_paths` to the audio file at the same index of `audio_paths`,
+    /// with the soundfont of [`soundFont`](sound_font); several files are rendered in parallel.
+    /// Returns a list with an error message for each file, empty if the file was written.
+    #[pyfunction(name = "renderMidi")]
+    pub(crate) fn render_midi(
+        midi_paths: Vec<String>,
+        audio_paths: Vec<String>,
+        tempo: f64,
+        vm: &VirtualMachine,
+    ) -> PyResult {
+        if midi_paths.len() != audio_paths.len() {
+            return Err(vm.new_value_error("each MIDI file needs one audio file path".to_owned()));
+        }
+        let jobs = midi_paths
+            .into_iter()
+            .zip(audio_paths)
+            .map(|(midi, audio)| (PathBuf::from(midi), PathBuf::from(audio)))
+            .collect::<Vec<_>>();
+
+        let results = match render::find_sound_font() {
+            Some(sf) => render::render_files(&sf, &jobs, tempo as f32),
+            None => jobs
+                .iter()
+                .map(|_| Err(render::Error::NoSoundFont))
+                .collect(),
+        };
+        let errors = results
+            .into_iter()
+            .map(|result| {
+                let msg = result.err().map(|e| e.to_string()).unwrap_or_default();
+                vm.ctx.new_str(msg).to_pyobject(vm)
+            })
+            .collect();
+
+        Ok(vm.ctx.new_list(errors).into())
+    }
+}
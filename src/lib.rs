@@ -4,3 +4,4 @@ pub use interpreter::init_py_interpreter;
 
 pub mod app;
 mod interpreter;
+pub mod render;
@@ -0,0 +1,385 @@
+//! Offline rendering of MIDI files to audio files.
+//!
+//! This uses the same soundfont renderer as the GUI player, but instead of feeding a sound card
+//! it runs as fast as possible and writes fixed blocks straight to a WAV or AIFF file. No audio
+//! device is needed.
+
+use std::env;
+use std::fs::{self, File};
+use std::io::{self, BufWriter, Seek, SeekFrom, Write};
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::Mutex;
+use std::thread;
+
+use midi_player::{Player, Settings as PlayerSettings};
+use thiserror::Error;
+
+/// Environment variable naming a soundfont to use instead of the bundled one.
+pub const SOUND_FONT_VAR: &str = "ATHENACL_SOUNDFONT";
+const SOUND_FONT: &str = "resources/SGM-v2.01-YamahaGrand-Guit-Bass-v2.7.sf2";
+// the longest release tail rendered after the last event, in seconds
+const TAIL_MAX: f64 = 4.0;
+// the tail ends on the first block with all samples below this level
+const TAIL_SILENCE: f32 = 1.0e-4;
+// rendering stops after this many times the length of the MIDI file, plus this many seconds, even
+// if the player has not reached the end
+const RENDER_MARGIN: f64 = 2.0;
+const RENDER_PAD: f64 = 10.0;
+// rendering stops if the player position has not advanced for this many seconds
+const STALL_TIME: f64 = 2.0;
+const CHANNELS: u16 = 2;
+
+/// The soundfont to render with, if there is one: the file named by [`SOUND_FONT_VAR`] if it is
+/// set, otherwise the bundled soundfont. The bundled soundfont is searched for next to the
+/// executable, then in its parent directories, as test executables are built below the
+/// directory holding `resources`.
+pub fn find_sound_font() -> Option<PathBuf> {
+    if let Some(path) = env::var_os(SOUND_FONT_VAR) {
+        let path = PathBuf::from(path);
+        return path.is_file().then_some(path);
+    }
+    let exe = env::current_exe().ok()?;
+    exe.ancestors()
+        .skip(1)
+        .map(|dir| dir.join(SOUND_FONT))
+        .find(|path| path.is_file())
+}
+
+/// The soundfont to play with; if none is found, the path of the bundled soundfont next to the
+/// executable, so the player reports it as missing.
+pub fn sound_font_path() -> PathBuf {
+    find_sound_font().unwrap_or_else(|| {
+        let mut exe_dir = env::current_exe().expect(
+            "executable directory should be available for standard
+            distributions of supported platforms (macOS, Windows, Ubuntu). The executable is also
+            not a symbolic link.",
+        );
+        exe_dir.pop();
+        exe_dir.push(SOUND_FONT);
+        exe_dir
+    })
+}
+
+/// Render a MIDI file into an audio file.
+///
+/// The format is chosen by the extension of `output`: `.wav` is written as WAV, anything else as
+/// AIFF. Samples are 16-bit stereo, at the sample rate of the player.
+///
+/// Rendering is bounded by the length of the MIDI file: if the player stalls or runs well past the
+/// end, what was rendered is kept and [`Error::Incomplete`] is returned.
+pub fn render_file(sf: &Path, midi: &Path, output: &Path, tempo: f32) -> Result<(), Error> {
+    let (mut player, controller) =
+        Player::new(&sf.to_string_lossy(), PlayerSettings::builder().build())
+            .map_err(|e| Error::Player(format!("{:?}", e)))?;
+    controller
+        .set_file(Some(&midi.to_path_buf()))
+        .map_err(|e| Error::Player(format!("{:?}", e)))?;
+    controller.set_position(0.0);
+    controller.set_tempo(tempo);
+    controller.play();
+
+    let sample_rate = player.settings().sample_rate;
+    let block_size = player.settings().audio_buffer_size as usize;
+    let blocks = |seconds: f64| (seconds * sample_rate as f64 / block_size as f64).ceil() as usize;
+    let duration = midi_duration(midi, tempo)?;
+    let end_blocks = blocks(duration);
+    let max_blocks = blocks(duration * RENDER_MARGIN + RENDER_PAD);
+    let stall_blocks = blocks(STALL_TIME);
+    let mut left = vec![0f32; block_size];
+    let mut right = vec![0f32; block_size];
+    let mut writer = AudioWriter::create(output, sample_rate)?;
+
+    // the player reports a position of 1.0 at the end of the file; a position going backwards
+    // means it has rewound, so the file has ended too; an empty file may have no position at all
+    let mut last = 0.0;
+    let mut stalled = 0;
+    let mut ended = false;
+    for block in 0..max_blocks {
+        player.render(&mut left, &mut right);
+        writer.write_block(&left, &right)?;
+        let position = controller.position();
+        if position.is_nan() || position >= 1.0 || position < last {
+            ended = true;
+            break;
+        }
+        stalled = if position > last { 0 } else { stalled + 1 };
+        if stalled >= stall_blocks {
+            // a player that stops after the length of the file, as for an empty file, has ended
+            ended = block + 1 >= end_blocks;
+            break;
+        }
+        last = position;
+    }
+    controller.stop();
+    if !ended {
+        // keep what was rendered as a valid file
+        writer.finish()?;
+        return Err(Error::Incomplete(midi.to_path_buf()));
+    }
+
+    let tail_blocks = (TAIL_MAX * sample_rate as f64 / block_size as f64).ceil() as usize;
+    for _ in 0..tail_blocks {
+        player.render(&mut left, &mut right);
+        if left
+            .iter()
+            .chain(right.iter())
+            .all(|s| s.abs() < TAIL_SILENCE)
+        {
+            break;
+        }
+        writer.write_block(&left, &right)?;
+    }
+
+    writer.finish()
+}
+
+/// Render many MIDI files at once, each given with its output path.
+///
+/// Files are rendered in parallel on worker threads, one player per thread, so a single file
+/// renders on one thread. Results are returned in the order of `jobs`. Each worker takes jobs until none are left; as each render is bounded,
+/// all workers finish.
+pub fn render_files(sf: &Path, jobs: &[(PathBuf, PathBuf)], tempo: f32) -> Vec<Result<(), Error>> {
+    let workers = thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .min(jobs.len());
+    let next = AtomicUsize::new(0);
+    let results = Mutex::new(
+        (0..jobs.len())
+            .map(|_| Ok(()))
+            .collect::<Vec<Result<(), Error>>>(),
+    );
+
+    thread::scope(|scope| {
+        for _ in 0..workers {
+            scope.spawn(|| loop {
+                let i = next.fetch_add(1, Ordering::Relaxed);
+                let Some((midi, output)) = jobs.get(i) else {
+                    break;
+                };
+                let result = render_file(sf, midi, output, tempo);
+                results.lock().expect("a render thread panicked")[i] = result;
+            });
+        }
+    });
+
+    results.into_inner().expect("a render thread panicked")
+}
+
+/// Render error.
+#[derive(Debug, Error)]
+pub enum Error {
+    /// No soundfont was found; see [`find_sound_font`].
+    #[error("Cannot find a soundfont; set ATHENACL_SOUNDFONT to the path of one")]
+    NoSoundFont,
+    /// The player could not load the soundfont or the MIDI file.
+    #[error("Cannot play MIDI: {0}")]
+    Player(String),
+    /// The player stopped advancing, or ran past the end of the MIDI file.
+    #[error("MIDI playback did not reach the end of {0}; the audio file is incomplete")]
+    Incomplete(PathBuf),
+    /// The audio file could not be written.
+    #[error("Cannot write audio file: {0}")]
+    Io(#[from] io::Error),
+}
+
+/// The length of a MIDI file in seconds, at `tempo` or the slowest tempo the file sets, whichever
+/// is slower. This only bounds rendering, so it does not follow the tempo map exactly.
+fn midi_duration(midi: &Path, tempo: f32) -> Result<f64, Error> {
+    let data = fs::read(midi)?;
+    let malformed = || Error::Player(format!("malformed MIDI file {}", midi.display()));
+    if data.len() < 14 || &data[..4] != b"MThd" {
+        return Err(malformed());
+    }
+    let header_len = u32::from_be_bytes([data[4], data[5], data[6], data[7]]) as usize;
+    let division = u16::from_be_bytes([data[12], data[13]]);
+    let mut bpm = tempo as f64;
+    let mut last_tick = 0;
+    let mut pos = 8 + header_len;
+    while pos + 8 <= data.len() {
+        let len = u32::from_be_bytes([data[pos + 4], data[pos + 5], data[pos + 6], data[pos + 7]]);
+        let chunk = data
+            .get(pos + 8..pos + 8 + len as usize)
+            .ok_or_else(malformed)?;
+        if &data[pos..pos + 4] == b"MTrk" {
+            let (ticks, track_bpm) = scan_track(chunk).ok_or_else(malformed)?;
+            last_tick = last_tick.max(ticks);
+            bpm = track_bpm.map_or(bpm, |b| bpm.min(b));
+        }
+        pos += 8 + len as usize;
+    }
+    if division & 0x8000 != 0 {
+        // SMPTE time: frames per second, as a negative number, then ticks per frame
+        let ticks_per_second = -((division >> 8) as u8 as i8) as f64 * (division & 0xff) as f64;
+        return Ok(last_tick as f64 / ticks_per_second.max(1.0));
+    }
+    Ok(last_tick as f64 / division.max(1) as f64 * 60.0 / bpm.max(1.0))
+}
+
+/// The tick of the last event of a track, and the slowest tempo it sets in BPM, if any; None if
+/// the track is malformed.
+fn scan_track(track: &[u8]) -> Option<(u64, Option<f64>)> {
+    let mut i = 0;
+    let mut tick = 0;
+    let mut bpm: Option<f64> = None;
+    let mut status = 0;
+    while i < track.len() {
+        tick += read_vlq(track, &mut i)?;
+        match *track.get(i)? {
+            0xff => {
+                let kind = *track.get(i + 1)?;
+                i += 2;
+                let len = read_vlq(track, &mut i)? as usize;
+                let meta = track.get(i..i + len)?;
+                if kind == 0x51 && len == 3 {
+                    let micros = u32::from_be_bytes([0, meta[0], meta[1], meta[2]]);
+                    if micros > 0 {
+                        let b = 60.0e6 / micros as f64;
+                        bpm = Some(bpm.map_or(b, |m| m.min(b)));
+                    }
+                }
+                i += len;
+            }
+            0xf0 | 0xf7 => {
+                i += 1;
+                let len = read_vlq(track, &mut i)? as usize;
+                i += len;
+            }
+            byte => {
+                // channel messages may omit the status byte if it repeats
+                if byte >= 0x80 {
+                    status = byte;
+                    i += 1;
+                } else if status == 0 {
+                    return None;
+                }
+                i += if matches!(status & 0xf0, 0xc0 | 0xd0) {
+                    1
+                } else {
+                    2
+                };
+            }
+        }
+    }
+    Some((tick, bpm))
+}
+
+/// Read a variable-length quantity, of at most four bytes.
+fn read_vlq(data: &[u8], i: &mut usize) -> Option<u64> {
+    let mut value = 0;
+    for _ in 0..4 {
+        let byte = *data.get(*i)?;
+        *i += 1;
+        value = (value << 7) | (byte & 0x7f) as u64;
+        if byte & 0x80 == 0 {
+            return Some(value);
+        }
+    }
+    None
+}
+
+#[derive(Clone, Copy)]
+enum AudioFormat {
+    Wav,
+    Aiff,
+}
+
+/// Writes 16-bit stereo PCM; the header is written on finish, when the length is known.
+struct AudioWriter {
+    file: BufWriter<File>,
+    format: AudioFormat,
+    sample_rate: u32,
+    frames: u32,
+}
+
+impl AudioWriter {
+    fn create(path: &Path, sample_rate: u32) -> io::Result<Self> {
+        let format = match path.extension().and_then(|e| e.to_str()) {
+            Some(ext) if ext.eq_ignore_ascii_case("wav") => AudioFormat::Wav,
+            _ => AudioFormat::Aiff,
+        };
+        let mut writer = Self {
+            file: BufWriter::new(File::create(path)?),
+            format,
+            sample_rate,
+            frames: 0,
+        };
+        writer.write_header()?;
+        Ok(writer)
+    }
+
+    fn write_block(&mut self, left: &[f32], right: &[f32]) -> io::Result<()> {
+        let mut bytes = Vec::with_capacity(left.len() * CHANNELS as usize * 2);
+        for (l, r) in left.iter().zip(right) {
+            for s in [l, r] {
+                let s = (s.clamp(-1.0, 1.0) * i16::MAX as f32) as i16;
+                match self.format {
+                    AudioFormat::Wav => bytes.extend_from_slice(&s.to_le_bytes()),
+                    AudioFormat::Aiff => bytes.extend_from_slice(&s.to_be_bytes()),
+                }
+            }
+        }
+        self.file.write_all(&bytes)?;
+        self.frames += left.len().min(right.len()) as u32;
+        Ok(())
+    }
+
+    fn finish(mut self) -> Result<(), Error> {
+        self.file.seek(SeekFrom::Start(0))?;
+        self.write_header()?;
+        self.file.flush()?;
+        Ok(())
+    }
+
+    fn write_header(&mut self) -> io::Result<()> {
+        let block_align = CHANNELS as u32 * 2;
+        let data_size = self.frames * block_align;
+        let f = &mut self.file;
+        match self.format {
+            AudioFormat::Wav => {
+                f.write_all(b"RIFF")?;
+                f.write_all(&(36 + data_size).to_le_bytes())?;
+                f.write_all(b"WAVEfmt ")?;
+                f.write_all(&16u32.to_le_bytes())?;
+                f.write_all(&1u16.to_le_bytes())?; // PCM
+                f.write_all(&CHANNELS.to_le_bytes())?;
+                f.write_all(&self.sample_rate.to_le_bytes())?;
+                f.write_all(&(self.sample_rate * block_align).to_le_bytes())?;
+                f.write_all(&(block_align as u16).to_le_bytes())?;
+                f.write_all(&16u16.to_le_bytes())?;
+                f.write_all(b"data")?;
+                f.write_all(&data_size.to_le_bytes())?;
+            }
+            AudioFormat::Aiff => {
+                f.write_all(b"FORM")?;
+                f.write_all(&(46 + data_size).to_be_bytes())?;
+                f.write_all(b"AIFFCOMM")?;
+                f.write_all(&18u32.to_be_bytes())?;
+                f.write_all(&CHANNELS.to_be_bytes())?;
+                f.write_all(&self.frames.to_be_bytes())?;
+                f.write_all(&16u16.to_be_bytes())?;
+                f.write_all(&extended(self.sample_rate))?;
+                f.write_all(b"SSND")?;
+                f.write_all(&(8 + data_size).to_be_bytes())?;
+                f.write_all(&0u32.to_be_bytes())?; // offset
+                f.write_all(&0u32.to_be_bytes())?; // block size
+            }
+        }
+        Ok(())
+    }
+}
+
+/// The sample rate as the 80-bit extended float AIFF uses.
+fn extended(rate: u32) -> [u8; 10] {
+    let mut bytes = [0u8; 10];
+    if rate == 0 {
+        return bytes;
+    }
+    let shift = rate.leading_zeros();
+    let exponent = (16383 + 31 - shift) as u16;
+    let mantissa = (rate as u64) << (32 + shift);
+    bytes[..2].copy_from_slice(&exponent.to_be_bytes());
+    bytes[2..].copy_from_slice(&mantissa.to_be_bytes());
+    bytes
+}
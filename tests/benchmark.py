@@ -0,0 +1,775 @@
+"""
+Timing benchmarks for athenaCL. These are not tests: each benchmark reports
+wall-clock times for a common operation, often comparing two code paths.
+
+Run inside the embedded interpreter with:
+
+    cargo test --release --test pysrc_bench -- --ignored --nocapture
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+
+def timeCall(func, repeat=1):
+    """
+    Return the best wall-clock time, in seconds, of calling func repeat times.
+    """
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        func()
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def report(name, *columns):
+    """
+    Print a single benchmark result line.
+    """
+    print("%-40s %s" % (name, "  ".join([str(c) for c in columns])))
+    sys.stdout.flush()
+
+
+def getInterpreter():
+    from athenaCL.libATH import athenaObj
+
+    return athenaObj.Interpreter("terminal")
+
+
+def cmd(ai, line):
+    ok, result = ai.cmd(line, errorMode="return")
+    if not ok:
+        raise Exception("failed cmd (%s): %s" % (line, result))
+    return result
+
+
+# -----------------------------------------------------------------||||||||||||--
+def benchParameterFactory():
+    """
+    Latency of TIn and AOl on a 40-texture AthenaObject, with the parameter
+    and texture modules reloaded on every lookup (hot-reload) and with the
+    precomputed class registries.
+    """
+    from athenaCL.libATH.libPmtr import parameter
+    from athenaCL.libATH.libTM import texture
+
+    textureCount = 40
+    fp = os.path.join(tempfile.gettempdir(), "athenaBenchFactory.xml")
+
+    ai = getInterpreter()
+    cmd(ai, "EMo m")
+    for i in range(textureCount):
+        cmd(ai, "TIn t%s %s" % (i, i % 100))
+    cmd(ai, "AOw %s" % fp)
+
+    counter = [0]
+    # the registry is timed first: reloading modules replaces their classes
+    for hotReload in (False, True):
+        parameter.HOT_RELOAD = hotReload
+        texture.HOT_RELOAD = hotReload
+
+        def tin():
+            counter[0] += 1
+            cmd(ai, "TIn bench%s 0" % counter[0])
+
+        def aol():
+            cmd(getInterpreter(), "AOl %s" % fp)
+
+        mode = "hot-reload" if hotReload else "registry"
+        report("parameter factory TIn (%s)" % mode, "%.4fs" % timeCall(tin, 5))
+        report(
+            "parameter factory AOl %s textures (%s)" % (textureCount, mode),
+            "%.4fs" % timeCall(aol, 1),
+        )
+
+    parameter.HOT_RELOAD = False
+    texture.HOT_RELOAD = False
+    os.remove(fp)
+
+
+# -----------------------------------------------------------------||||||||||||--
+def makeTexture(tmName, eventCount, rhythmQ="pt,(c,4),(c,1),(c,1),(c,1)"):
+    """
+    Return a loaded, unscored texture that produces about eventCount events
+    from a single-pitch path; the default rhythm is a constant 1/8 second.
+    """
+    from athenaCL.libATH.libTM import texture
+
+    ti = texture.factory(tmName, "bench")
+    ti.loadDefault(refresh=0)
+    ti.editPmtrObj("rhythmQ", rhythmQ, refresh=0)
+    ti.editPmtrObj("tRange", ("staticRange", (0, eventCount * 0.125)), refresh=0)
+    return ti
+
+
+def benchPostEvent():
+    """
+    Per-event scoring overhead of LineGroove and LineCluster, with a rhythm
+    that does no post-event processing (pulseTriple) and one that does
+    (binaryAccent).
+    """
+    for tmName in ("LineGroove", "LineCluster"):
+        for rhythmQ in (
+            "pt,(c,4),(c,1),(c,1),(c,1)",
+            "ba,((4,1,1),(4,1,1))",
+        ):
+            for eventCount in (10000, 100000):
+                ti = makeTexture(tmName, eventCount, rhythmQ)
+                elapsed = timeCall(ti.score)
+                report(
+                    "%s %s %s events" % (tmName, rhythmQ[:2], len(ti.esObj)),
+                    "%.3fs" % elapsed,
+                    "%.2fus/event" % (elapsed / len(ti.esObj) * 1e6),
+                )
+
+
+# -----------------------------------------------------------------||||||||||||--
+def memoryCall(func):
+    """
+    Return the result of func and the peak memory, in megabytes, allocated
+    while calling it; the peak is None if tracemalloc is not available.
+    """
+    try:
+        import tracemalloc
+    except ImportError:
+        return func(), None
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak / 1e6
+
+
+def benchEventSequence():
+    """
+    Memory and throughput of the dictionary and columnar EventSequence
+    storage with 1M events of the form created by baseTexture.makeEvent.
+    """
+    from athenaCL.libATH import eventList
+
+    eventCount = 1000000
+    pulses = ["(1,1,+)", "(2,1,+)", "(4,3,+)"]
+
+    for esClass in (eventList.EventSequence, eventList.EventSequenceColumnar):
+
+        def fill():
+            esObj = esClass()
+            for i in range(eventCount):
+                esObj.append(
+                    {
+                        "inst": 3,
+                        "time": i * 0.125,
+                        "bpm": 120,
+                        "pulse": pulses[i % 3],
+                        "dur": 0.125,
+                        "sus": 0.1,
+                        "acc": 1,
+                        "amp": 0.75,
+                        "ps": float(i % 24),
+                        "pan": 0.5,
+                        "aux": [0.5, 1],
+                        "comment": [i % 12],
+                    }
+                )
+            return esObj
+
+        name = esClass.__name__
+        # memory is measured separately, as tracing slows allocation
+        esObj, peak = memoryCall(fill)
+        del esObj
+        start = time.time()
+        esObj = fill()
+        report(
+            "%s append %s events" % (name, eventCount),
+            "%.3fs" % (time.time() - start),
+            "n/a" if peak is None else "%.1fMB" % peak,
+        )
+
+        def translate():  # the access pattern of the output engines
+            for event in esObj.list():
+                if event["acc"] == 0:
+                    continue
+                event["time"], event["sus"], event["amp"], event["aux"]
+
+        def arrays():  # the access pattern of clones
+            for key in ("time", "sus", "acc", "amp", "pan", "ps"):
+                esObj.setArray(key, [x * 0.5 for x in esObj.getArray(key)])
+
+        report("%s translate" % name, "%.3fs" % timeCall(translate))
+        report("%s getArray/setArray" % name, "%.3fs" % timeCall(arrays))
+        report("%s copy" % name, "%.3fs" % timeCall(esObj.copy))
+        report("%s sort" % name, "%.3fs" % timeCall(esObj.sort))
+        del esObj
+
+
+def benchSnapshot():
+    """
+    Wall time and peak memory of Performer.flattenAll, as called by ELn, on
+    20 textures with 5 clones each, with copy-on-write score snapshots and
+    with full copies.
+    """
+    from athenaCL.libATH import eventList
+
+    ai = getInterpreter()
+    cmd(ai, "EMo cn")
+    for t in range(20):
+        cmd(ai, "TIn t%s 3" % t)
+        cmd(ai, "TIe t 0,60")
+        for c in range(5):
+            cmd(ai, "TCn c%s" % c)
+
+    snapshot = eventList.EventSequence.snapshot
+    for mode in ("snapshot", "copy"):
+        if mode == "copy":
+            eventList.EventSequence.snapshot = eventList.EventSequence.copy
+        performer = eventList.Performer()
+        elapsed = timeCall(lambda: performer.flattenAll(ai.ao))
+        ignore, peak = memoryCall(lambda: performer.flattenAll(ai.ao))
+        report(
+            "Performer.flattenAll 20x5 (%s)" % mode,
+            "%.3fs" % elapsed,
+            "n/a" if peak is None else "%.1fMB" % peak,
+        )
+    eventList.EventSequence.snapshot = snapshot
+
+
+def benchScoreCache():
+    """
+    Wall time of seeded Performer.flattenAll, as called by ELn, on 20
+    textures with 5 clones each: with an empty score cache, with all scores
+    cached, and after editing one texture.
+    """
+    from athenaCL.libATH import eventList
+
+    ai = getInterpreter()
+    cmd(ai, "EMo cn")
+    for t in range(20):
+        cmd(ai, "TIn t%s 3" % t)
+        cmd(ai, "TIe t 0,60")
+        for c in range(5):
+            cmd(ai, "TCn c%s" % c)
+
+    performer = eventList.Performer()
+    flatten = lambda: performer.flattenAll(ai.ao, 1, 1, 0)
+    ai.ao.scoreCache.clear()
+    report("Performer.flattenAll 20x5 (empty cache)", "%.3fs" % timeCall(flatten))
+    report("Performer.flattenAll 20x5 (cached)", "%.3fs" % timeCall(flatten))
+    cmd(ai, "TIo t0")
+    cmd(ai, "TIe a ru,.2,.9")
+    report("Performer.flattenAll 20x5 (one edited)", "%.3fs" % timeCall(flatten))
+    report("score cache", ai.ao.scoreCache.report())
+
+
+def benchCloneScore():
+    """
+    Wall time and peak memory of scoring four clones of a 50k event texture;
+    clones share one texture refDict rather than copying it for each event.
+    """
+    from athenaCL.libATH import clone
+
+    ti = makeTexture("LineGroove", 50000)
+    ti.score()
+    clones = []
+    for i in range(4):
+        c = clone.Clone("c%s" % i, "bench")
+        c.loadDefault(ti.auxNo, "num")
+        clones.append(c)
+
+    def score():
+        for c in clones:
+            c.score(ti.getScore(), ti.getRefClone())
+
+    elapsed = timeCall(score)
+    ignore, peak = memoryCall(score)
+    report(
+        "Clone.score 4 clones %s events" % len(ti.esObj),
+        "%.3fs" % elapsed,
+        "n/a" if peak is None else "%.1fMB" % peak,
+    )
+
+
+def benchOutputEngines():
+    """
+    Wall time and peak memory of writing a 200k event score as a csound
+    score, a text table, and a MIDI file; scores are written one event at
+    a time, so peak memory does not grow with the size of the output.
+    """
+    from athenaCL.libATH import eventList
+
+    eventCount = 200000
+    ai = getInterpreter()
+    cmd(ai, "EMo cn")
+    ti = makeTexture("LineGroove", eventCount)
+    ti.score()
+    performer = eventList.Performer()
+    performer.flattenSome([ti])
+    outDir = tempfile.mkdtemp()
+    for outRequest, engine in (
+        ("csoundScore", eventList.EngineCsoundNative),
+        ("textTab", eventList.EngineText),
+        ("midiFile", eventList.EngineMidiFile),
+    ):
+        emObj = eventList.factory("csoundNative", ai.ao)
+        emObj.setRootPath(os.path.join(outDir, "bench.xml"))
+        write = lambda: engine(emObj, emObj.fpRef, ai.ao).write(
+            performer.polySeq, [outRequest]
+        )
+        elapsed = timeCall(write)
+        ignore, peak = memoryCall(write)
+        report(
+            "%s %s events" % (outRequest, len(ti.esObj)),
+            "%.3fs" % elapsed,
+            "n/a" if peak is None else "%.1fMB" % peak,
+        )
+    for name in os.listdir(outDir):
+        os.remove(os.path.join(outDir, name))
+    os.rmdir(outDir)
+
+
+def benchMidiFile():
+    """
+    Wall time and file size of EngineMidiFile output of 500k notes, split
+    into four textures on four channels, without and with running status.
+    """
+    from athenaCL.libATH import eventList
+
+    noteCount = 500000
+    ai = getInterpreter()
+    cmd(ai, "EMo m")
+    textures = []
+    for i in range(4):
+        ti = makeTexture("LineGroove", noteCount // 4)
+        ti.score()
+        textures.append(ti)
+    performer = eventList.Performer()
+    performer.flattenSome(textures)
+    outDir = tempfile.mkdtemp()
+    emObj = eventList.factory("midi", ai.ao)
+    emObj.setRootPath(os.path.join(outDir, "bench.xml"))
+    fp = emObj.outFormatToFilePath("midiFile")
+    for runningStatus in (False, True):
+        engine = eventList.EngineMidiFile(emObj, emObj.fpRef, ai.ao)
+        engine.runningStatus = runningStatus
+        elapsed = timeCall(lambda: engine.write(performer.polySeq, ["midiFile"]))
+        report(
+            "EngineMidiFile %s notes%s"
+            % (noteCount, ", running status" if runningStatus else ""),
+            "%.3fs" % elapsed,
+            "%.1fMB" % (os.path.getsize(fp) / 1e6),
+        )
+    for name in os.listdir(outDir):
+        os.remove(os.path.join(outDir, name))
+    os.rmdir(outDir)
+
+
+def benchAudioFile():
+    """
+    Wall time and peak memory of EngineAudioFile output of 200k events, mixed
+    into the file in blocks; peak memory does not grow with the file size.
+    """
+    from athenaCL.libATH import eventList
+
+    eventCount = 200000
+    ai = getInterpreter()
+    cmd(ai, "EMo cn")
+    ti = makeTexture("LineGroove", eventCount)
+    ti.score()
+    performer = eventList.Performer()
+    performer.flattenSome([ti])
+    outDir = tempfile.mkdtemp()
+    emObj = eventList.factory("csoundNative", ai.ao)
+    emObj.setRootPath(os.path.join(outDir, "bench.xml"))
+    write = lambda: eventList.EngineAudioFile(emObj, emObj.fpRef, ai.ao).write(
+        performer.polySeq, ["audioFile"]
+    )
+    elapsed = timeCall(write)
+    ignore, peak = memoryCall(write)
+    report(
+        "EngineAudioFile %s events" % len(ti.esObj),
+        "%.3fs" % elapsed,
+        "n/a" if peak is None else "%.1fMB" % peak,
+    )
+    for name in os.listdir(outDir):
+        os.remove(os.path.join(outDir, name))
+    os.rmdir(outDir)
+
+
+def benchMarkov():
+    """
+    Wall time of 1M draws from an order-3 Markov chain of 50 symbols; weights
+    are compiled to cumulative boundaries once and selected by bisection.
+    """
+    from athenaCL.libATH import drawer, markov
+
+    rand = random.Random(0)
+    labels = drawer.genAlphaLabel(50)
+    msg = ["%s{%s}" % (labels[i], i) for i in range(50)]
+    msg.append(":{%s}" % "|".join(["%s=1" % s for s in labels]))
+    # a direct key for some contexts, an expression for others
+    for i in range(2000):
+        key = ":".join(rand.sample(labels, 3))
+        weights = "|".join(["%s=%s" % (s, rand.randint(1, 9)) for s in labels[:8]])
+        msg.append("%s:{%s}" % (key, weights))
+    for s in labels[:10]:
+        msg.append("%s:*:-%s:{%s=1|%s=2}" % (s, s, s, labels[-1]))
+    a = markov.Transition()
+    a.loadTransition(" ".join(msg))
+    draws = 1000000
+
+    def generate():
+        previous = []
+        for i in range(draws):
+            previous.append(a.next(rand.random(), previous, 3))
+            if len(previous) > 3:
+                del previous[0]
+
+    elapsed = timeCall(generate)
+    report(
+        "Transition.next order 3, 50 symbols, %s draws" % draws,
+        "%.3fs" % elapsed,
+        "n/a",
+    )
+
+
+def benchSieve():
+    """
+    Wall time of creating sieve ParameterObjects over 20k integers and
+    drawing from them; a sieve is evaluated as one period, repeated over z,
+    and is only compressed when a compressed form is requested.
+    """
+    from athenaCL.libATH.libPmtr import parameter
+
+    logStr = "{-{13@3|13@5|13@7|13@9}&11@2}|{-{11@4|11@8}&13@9}|{13@0|13@1|13@6}"
+    args = [
+        ("valueSieve", logStr, 20000, ("c", 0), ("c", 1), "oc"),
+        ("sieveList", logStr, -10000, 10000, "unit", "oc"),
+        ("pulseSieve", logStr, 20000, (4, 1, 1), "oc", "s"),
+    ]
+
+    def create():
+        for a in args:
+            obj = parameter.factory(a, ["genPmtrObjs", "rthmPmtrObjs"])
+            for t in range(1000):
+                obj(t, {"bpm": 120})
+
+    report(
+        "sieve ParameterObjects 20k z (%s)" % len(args),
+        "%.3fs" % timeCall(create),
+        "n/a",
+    )
+
+
+def benchNormalForm():
+    """
+    Wall time of finding the normal form of 20k random pitch sets, and of
+    loading them as a path; every pc set is looked up in a table built once.
+    """
+    from athenaCL.libATH import multiset, pitchPath
+
+    rand = random.Random(0)
+    psList = []
+    for i in range(20000):
+        psList.append([rand.randint(-24, 24) for j in range(rand.randint(2, 8))])
+
+    def find():
+        for ps in psList:
+            multiset.findNormalT(ps)
+
+    def load():
+        p = pitchPath.PolyPath()
+        p.loadPsList(psList)
+
+    report("multiset.findNormalT 20k sets", "%.3fs" % timeCall(find, 3), "n/a")
+    report("PolyPath.loadPsList 20k sets", "%.3fs" % timeCall(load), "n/a")
+
+
+def benchFindRef():
+    """
+    Mean latency of set class name searches: one query for each word used in
+    the Forte catalogue references, and a part of each word; words are found
+    through an n-gram index built on the first query.
+    """
+    from athenaCL.libATH import multiset
+
+    queries = []
+    for scTriple in multiset.getAllScTriples():
+        refDict = multiset.refData(scTriple)
+        if refDict == None:
+            continue
+        for name in refDict["name"]:
+            for word in name.split():
+                queries.append(word)
+                queries.append(word[1:4])
+
+    def search():
+        for q in queries:
+            multiset.findRef(q)
+
+    elapsed = timeCall(search, 3)
+    report(
+        "multiset.findRef %s queries" % len(queries),
+        "%.3fms/query" % (elapsed / len(queries) * 1000),
+        "n/a",
+    )
+
+
+# -----------------------------------------------------------------||||||||||||--
+def benchProjectLoad():
+    """
+    Wall time of reading the data of a 300-texture AthenaObject saved as XML
+    and in the binary format, and of the complete AOl, which also scores
+    every texture.
+    """
+    from athenaCL.libATH import ioTools
+
+    textureCount = 300
+    base = os.path.join(tempfile.gettempdir(), "athenaBenchLoad")
+
+    ai = getInterpreter()
+    cmd(ai, "EMo m")
+    for i in range(textureCount):
+        cmd(ai, "TIn t%s %s" % (i, i % 100))
+    for ext in (".xml", ioTools.BINARY_EXTENSION):
+        cmd(ai, "AOw %s%s" % (base, ext))
+
+    def readXML():
+        ioTools.evalObjectDictionary(*ioTools.extractXML(base + ".xml"))
+
+    def readBinary():
+        ioTools.extractBinary(base + ioTools.BINARY_EXTENSION)
+
+    report(
+        "ioTools read %s textures (xml, binary)" % textureCount,
+        "%.4fs" % timeCall(readXML, 3),
+        "%.4fs" % timeCall(readBinary, 3),
+    )
+    for ext in (".xml", ioTools.BINARY_EXTENSION):
+
+        def aol():
+            cmd(ai, "AOl %s%s" % (base, ext))
+
+        report(
+            "AOl %s textures (%s)" % (textureCount, ext[1:]),
+            "%.4fs" % timeCall(aol, 3),
+            "%s bytes" % os.path.getsize(base + ext),
+        )
+        os.remove(base + ext)
+
+
+# -----------------------------------------------------------------||||||||||||--
+def benchStartup():
+    """
+    Wall time from importing athenaObj to a ready Interpreter, as done by the
+    interpreter worker before the first prompt, with no athenaCL modules
+    loaded; commands, help, clones, and orchestras are loaded on first use,
+    and the first command pays for loading the command module.
+    """
+
+    def unload():
+        post = {}
+        for name in list(sys.modules.keys()):
+            if name == "athenaCL" or name.startswith("athenaCL."):
+                post[name] = sys.modules.pop(name)
+        return post
+
+    saved = unload()
+
+    def start():
+        unload()
+        from athenaCL.libATH import athenaObj
+
+        athenaObj.Interpreter("terminal")
+
+    elapsed = timeCall(start, 3)
+    loaded = len(unload())
+    report("startup to first prompt", "%.4fs" % elapsed, "%s modules" % loaded)
+
+    def first():
+        unload()
+        from athenaCL.libATH import athenaObj
+
+        ai = athenaObj.Interpreter("terminal")
+        start = time.time()
+        cmd(ai, "PIn a 3")
+        return time.time() - start
+
+    report("first command (PIn)", "%.4fs" % min([first() for i in range(3)]), "n/a")
+    unload()
+    sys.modules.update(saved)
+
+
+# -----------------------------------------------------------------||||||||||||--
+def benchInterpolate():
+    """
+    Wall time of EventSequence.interpolate, as used by InterpolateLine and
+    InterpolateFill, creating 200 frames between each of 1000 events with
+    two aux values, for each interpolation method; frames are computed as a
+    column for each parameter and merged with events in time order.
+    """
+    from athenaCL.libATH import eventList
+
+    eventCount = 1000
+    frameCount = 200
+    for method in ("linear", "halfCosine", "power"):
+        for storage in ("dict", "columnar"):
+
+            def run():
+                if storage == "columnar":
+                    esObj = eventList.EventSequenceColumnar()
+                else:
+                    esObj = eventList.EventSequence()
+                tFrameArray = []
+                for i in range(eventCount):
+                    t = i * 1.0
+                    esObj.append(
+                        {
+                            "inst": 3,
+                            "time": t,
+                            "bpm": 120,
+                            "pulse": "(1,1,+)",
+                            "dur": 1.0,
+                            "sus": 1.0,
+                            "acc": 1,
+                            "amp": (i % 7) / 7.0,
+                            "ps": i % 12,
+                            "pan": (i % 5) / 5.0,
+                            "aux": [i % 3, 0.5],
+                            "comment": [],
+                        }
+                    )
+                    tFrameArray.append((t, 1.0, 1, method, 1.5))
+                    for j in range(1, frameCount + 1):
+                        tFrame = t + j / (frameCount + 1.0)
+                        tFrameArray.append((tFrame, 1.0 / (frameCount + 1), 0))
+                start = time.time()
+                esObj.interpolate(tFrameArray, 1)
+                return time.time() - start, len(esObj)
+
+            elapsed, count = min([run() for i in range(2)])
+            report(
+                "interpolate %s %s %s events" % (method, storage, count),
+                "%.3fs" % elapsed,
+                "%.2fus/frame" % (elapsed / count * 1e6),
+            )
+
+
+# -----------------------------------------------------------------||||||||||||--
+def benchOrchestra():
+    """
+    Wall time and peak memory of creating 500 csoundNative textures, and
+    wall time of building the full csoundNative orchestra 100 times;
+    orchestras and their instruments are shared by all textures, and
+    orchestra source is built once for each channel count and instrument list.
+    """
+    from athenaCL.libATH.libOrc import orc
+
+    textureCount = 500
+    create = lambda: [makeTexture("LineGroove", 10) for i in range(textureCount)]
+    elapsed = timeCall(create)
+    ignore, peak = memoryCall(create)
+    report(
+        "create %s textures" % textureCount,
+        "%.3fs" % elapsed,
+        "n/a" if peak is None else "%.1fMB" % peak,
+    )
+    orcObj = orc.factory("csoundNative")
+    elapsed = timeCall(lambda: [orcObj.constructOrc(2) for i in range(100)])
+    report("constructOrc all instruments x100", "%.3fs" % elapsed, "n/a")
+
+
+# -----------------------------------------------------------------||||||||||||--
+def benchCsoundScore():
+    """
+    Wall time of writing a 1M note csound score with the csoundNative
+    engine; amp, pitch, and pan are mapped with functions obtained from the
+    orchestra once per texture, and score columns are formatted in blocks.
+    """
+    from athenaCL.libATH import eventList
+
+    eventCount = 1000000
+    ai = getInterpreter()
+    cmd(ai, "EMo cn")
+    ti = makeTexture("LineGroove", eventCount)
+    ti.score()
+    performer = eventList.Performer()
+    performer.flattenSome([ti])
+    outDir = tempfile.mkdtemp()
+    emObj = eventList.factory("csoundNative", ai.ao)
+    emObj.setRootPath(os.path.join(outDir, "bench.xml"))
+    write = lambda: eventList.EngineCsoundNative(emObj, emObj.fpRef, ai.ao).write(
+        performer.polySeq, ["csoundScore"]
+    )
+    elapsed = timeCall(write)
+    report(
+        "csoundScore %s events" % len(ti.esObj),
+        "%.3fs" % elapsed,
+        "%.2fus/event" % (elapsed / len(ti.esObj) * 1e6),
+    )
+    for name in os.listdir(outDir):
+        os.remove(os.path.join(outDir, name))
+    os.rmdir(outDir)
+
+
+def benchScoreWindow():
+    """
+    Wall time of writing a csound score for a short window of a 100k event
+    texture, against writing the full score; events before the window are
+    generated but not stored, and LineGroove stops after the window.
+    """
+    from athenaCL.libATH import eventList
+
+    eventCount = 100000
+    ai = getInterpreter()
+    cmd(ai, "EMo cn")
+    ti = makeTexture("LineGroove", eventCount)
+    ai.ao.textureLib = {"bench": ti}
+    outDir = tempfile.mkdtemp()
+    for window in (None, (0, 10)):
+        emObj = eventList.factory("csoundNative", ai.ao)
+        emObj.setRootPath(os.path.join(outDir, "bench.xml"))
+        process = lambda: emObj.process(None, ["csoundScore"], window=window)
+        elapsed = timeCall(process)
+        report("csoundScore window %s" % (window,), "%.3fs" % elapsed)
+    for name in os.listdir(outDir):
+        os.remove(os.path.join(outDir, name))
+    os.rmdir(outDir)
+
+
+# -----------------------------------------------------------------||||||||||||--
+benchmarks = [
+    benchParameterFactory,
+    benchPostEvent,
+    benchEventSequence,
+    benchSnapshot,
+    benchScoreCache,
+    benchCloneScore,
+    benchOutputEngines,
+    benchMidiFile,
+    benchAudioFile,
+    benchMarkov,
+    benchSieve,
+    benchNormalForm,
+    benchFindRef,
+    benchProjectLoad,
+    benchStartup,
+    benchInterpolate,
+    benchOrchestra,
+    benchCsoundScore,
+    benchScoreWindow,
+]
+
+
+def run_benchmarks(name=None):
+    for func in benchmarks:
+        if name is None or func.__name__ == name:
+            report(func.__name__, "")
+            func()
+
+
+run_benchmarks()
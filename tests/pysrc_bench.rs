@@ -0,0 +1,51 @@
+// runs timing benchmarks for python code
+
+use std::time::Instant;
+
+use rustpython_vm as vm;
+
+#[test]
+#[ignore = "benchmarks are slow; run explicitly with --ignored"]
+fn bench() {
+    let interpreter = athenacl::init_py_interpreter();
+
+    let result = interpreter.enter(|vm| {
+        let scope = vm.new_scope_with_builtins();
+        let code = vm::py_compile!(file = "tests/benchmark.py");
+        vm.run_code_obj(vm.ctx.new_code(code), scope)?;
+
+        vm::PyResult::Ok(())
+    });
+
+    interpreter.run(|_vm| result.clone());
+
+    assert!(result.is_ok());
+}
+
+#[test]
+#[ignore = "benchmarks are slow; run explicitly with --ignored"]
+fn startup() {
+    // the same steps the interpreter worker takes before the first prompt
+    let start = Instant::now();
+    let interpreter = athenacl::init_py_interpreter();
+
+    let result = interpreter.enter(|vm| {
+        let scope = vm.new_scope_with_builtins();
+        let code = vm::py_compile!(
+            source = r#"from athenaCL.libATH import athenaObj
+interp = athenaObj.Interpreter()"#
+        );
+        vm.run_code_obj(vm.ctx.new_code(code), scope)?;
+
+        vm::PyResult::Ok(())
+    });
+
+    interpreter.run(|_vm| result.clone());
+
+    assert!(result.is_ok());
+    println!(
+        "{:<40} {:.3}s",
+        "startup to first prompt",
+        start.elapsed().as_secs_f64()
+    );
+}
@@ -60,6 +60,7 @@ def run_tests(test_case_name=None):
             'athenaCL.libATH.imageTools',
             'athenaCL.libATH.interpolate',
             'athenaCL.libATH.ioTools',
+            'athenaCL.libATH.jobTools',
             'athenaCL.libATH.language',
             'athenaCL.libATH.markov',
             'athenaCL.libATH.midiTools',